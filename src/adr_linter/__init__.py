@@ -15,6 +15,13 @@ ARCHITECTURE OVERVIEW
 Entry Points:
 - CLI: `python -m adr_linter.cli` or `theseus` command
 - Direct: `from adr_linter.engine import run`
+- Library: `from adr_linter.engine import lint, iter_findings` (in-memory
+  (path, text) pairs, no filesystem access, returns Findings)
+- Editor: `theseus lsp` (stdio language server, warm services.session)
+- Hooks: `theseus daemon` + `theseus --client ...` (warm Unix-socket
+  server, see daemon.py)
+- CI: `theseus --shard i/N` per node + `theseus merge ARTIFACT...` (see
+  services/shard.py, merge.py)
 
 Call Flow:
 CLI args → Engine → File Discovery → Validators → Report
@@ -23,7 +30,8 @@ COMPONENT RESPONSIBILITIES
 =========================
 
 cli.py:
-- Argument parsing (--path, --fail-on, -k, --format, --emit-metrics)
+- Argument parsing (--path, --fail-on, -k, --format, --emit-metrics,
+  --stream, --shard/--shard-out)
 - Output formatting (md, jsonl)
 - Exit code handling
 - Entry: main() → engine.run()
@@ -215,4 +223,13 @@ reduced validation coverage.
 Update `get_canonical_keys("delta")` to return universal sections only. Add
 clear docstring explaining single-file constraint. Update failing tests to
 expect universal sections rather than full inheritance validation.
+
+### **Update: extends-chain resolver**
+Option 4 (two-pass) is now available for rules that opt in:
+`services.linkgraph.ExtendsResolver` (reached via `LinkGraph.extends`)
+computes each ADR's `extends` ancestor chain and its effective section key
+set / merged overrides once per run, memoized and cycle-guarded, at
+O(total chain length) for the whole corpus. DELTA-300 and LINK-304 validate
+against the inherited structure of the base. SCHEMA-003 still validates
+deltas against universal sections only.
 """
@@ -5,10 +5,7 @@
 from __future__ import annotations
 import argparse
 import sys
-
-from .engine import run
-
-# from pathlib import Path
+from pathlib import Path
 from . import __package__  # noqa: F401  (keep relative imports stable)
 
 # TODO: Add versioning information from .env or pyproject.toml to support
@@ -23,6 +20,14 @@ def create_parser():
     parser = argparse.ArgumentParser(
         prog="theseus (adr-linter)",
         description="Linter for Theseus ADRs.",
+        epilog=(
+            "Subcommands: `theseus lsp` (stdio language server), "
+            "`theseus daemon [--path ROOT] [--socket PATH] [--stop]` (warm "
+            "lint server), "
+            "`theseus merge ARTIFACT...` (combine --shard runs). "
+            "`theseus --client [--socket PATH] ...` forwards a lint to the "
+            "daemon."
+        ),
     )
 
     parser.add_argument("--path", default=".")
@@ -35,12 +40,144 @@ def create_parser():
     )
     parser.add_argument("--emit-metrics", action="store_true")
     parser.add_argument("--format", choices=["md", "jsonl"], default="md")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="bounded-memory mode for very large corpora (two-phase lint)",
+    )
+    parser.add_argument(
+        "--shard",
+        default=None,
+        metavar="i/N",
+        help="lint only shard i of N and write an artifact for `merge`",
+    )
+    parser.add_argument("--shard-out", default=None, metavar="PATH")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="parse the index in N worker processes (large corpora)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="run per-file rules on N threads (free-threaded Python)",
+    )
+    parser.add_argument(
+        "--verify-pins",
+        action="store_true",
+        help="check relationship pins against local git history (LINK-306)",
+    )
+    parser.add_argument(
+        "--staged",
+        action="store_true",
+        help="lint staged ADR changes from the git index (pre-commit)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cpu",
+        default=None,
+        choices=["cpu", "mem", "all"],
+        help="profile each phase into logs/.adr/profile.{prof,txt}",
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="OUT.json",
+        help="write a Chrome Trace Event timeline of the run",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="forward this lint to a running `theseus daemon`",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        metavar="PATH",
+        help="daemon socket (default: <path>/logs/.adr/theseus.sock)",
+    )
     return parser
 
 
+def _run_lsp(argv) -> int:
+    from .lsp import main as lsp_main
+
+    return lsp_main(argv)
+
+
+def _run_daemon(argv) -> int:
+    from .daemon import daemon_main
+
+    return daemon_main(argv)
+
+
+def _run_merge(argv) -> int:
+    from .merge import merge_main
+
+    return merge_main(argv)
+
+
+def shard_arg(parser, args):
+    """
+    Validate `--shard i/N` (None when absent); exits via parser.error.
+    """
+    if args.shard is None:
+        return None
+    if args.keyword:
+        parser.error("--shard cannot be combined with -k")
+    if args.verify_pins:
+        # LINK-306 needs the work tree; `merge` only sees artifacts
+        parser.error("--shard cannot be combined with --verify-pins")
+    from .services.shard import parse_shard
+
+    try:
+        return parse_shard(args.shard)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def staged_arg(parser, args) -> bool:
+    """
+    Validate `--staged` (it reads the git index, not a file set to split
+    or stream); exits via parser.error.
+    """
+    if args.staged and (args.shard is not None or args.stream):
+        parser.error("--staged cannot be combined with --shard or --stream")
+    return args.staged
+
+
+# `theseus <subcommand> ...`; anything else is the classic lint invocation.
+# Subcommands (and the engine) are imported on demand so `--client` stays a
+# thin stdlib-only process.
+_SUBCOMMANDS = {
+    "lsp": _run_lsp,
+    "daemon": _run_daemon,
+    "merge": _run_merge,
+}
+
+
 def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in _SUBCOMMANDS:
+        return _SUBCOMMANDS[argv[0]](argv[1:])
     parser = create_parser()
     args = parser.parse_args(argv)
+    if args.client:
+        from .daemon import client_main
+
+        # The daemon parses the same argv (and ignores --client/--socket)
+        rc = client_main(argv, args.socket, args.path)
+        if rc is not None:
+            return rc
+
+    from .engine import run
+
+    shard = shard_arg(parser, args)
 
     rc = run(
         path=args.path,
@@ -48,6 +185,15 @@ def main(argv=None) -> int:
         k_expr=args.keyword,
         emit_metrics=args.emit_metrics,
         fmt=args.format,
+        stream=args.stream,
+        shard=shard,
+        shard_out=args.shard_out and Path(args.shard_out),
+        jobs=args.jobs,
+        threads=args.threads,
+        verify_pins=args.verify_pins,
+        staged=staged_arg(parser, args),
+        profile=args.profile,
+        trace=args.trace and Path(args.trace),
     )
     return rc
 
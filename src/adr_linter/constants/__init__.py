@@ -9,6 +9,8 @@ Provides backward-compatible imports while organizing constants into
 logical modules for better maintainability.
 """
 
+from pathlib import Path
+
 # Explicit imports to avoid flake8 F403/F401 warnings
 from .codes import (
     CODES,
@@ -47,20 +49,37 @@ from .validation import (
     PLACEHOLDER_RX,
     DATE_RX,
     EXTENDS_RX,
+    FILENAME_ID_RX,
+    FRONT_MATTER_RX,
     ID_RX,
     RFC_2119_RX,
     VAGUE_TERMS_RX,
     DECISION_ONE_LINER_PATTERN_RX,
     DECISION_ONE_LINER_KEY_PATTERN_RX,
     CONSTRAINT_RULES_KEY_PATTERN_RX,
+    HTML_COMMENT_RX,
+    MARKDOWN_HEADER_LINE_RX,
+    MARKDOWN_HEADER_PREFIX_RX,
+    MARKDOWN_HEADING_RX,
+    SENTENCE_SPLIT_RX,
+    PIN_DATE_RX,
+    PIN_HEX_LOWER_RX,
+    PIN_HEX_UPPER_RX,
     # - Patterns: Lists of RegEx
     PLACEHOLDER_PATTERNS,
     REAL_VALUE_INDICATORS,
     # - Patterns: Lists of Compiled RegEx
     PLACEHOLDER_BRACKET_PATTERNS_RXL,
-    # VALID_SCOPE_TOPIC_PATTERNS_RXL,
+    PLACEHOLDER_PATTERNS_RXL,
+    REAL_VALUE_INDICATORS_RXL,
+    VALID_SCOPE_TOPIC_PATTERNS_RXL,
+    # - Patterns: Combined alternations
+    PLACEHOLDER_BRACKET_ANY_RX,
+    PLACEHOLDER_ANY_RX,
+    SCOPE_TOPIC_ANY_RX,
     # defs
     has_placeholder_content,
+    strip_html_comments,
     is_single_statement,
     get_scope_topic_patterns,
     detect_real_governance_values,
@@ -71,9 +90,15 @@ from .sections import (
     SECTIONS_UNIVERSAL_CLOSING,
     CLASS_INSERTIONS,
     HEADING_ALIASES,
+    HEADERS_BY_KEY,
+    SECTION_SCHEMAS,
+    EMPTY_SECTION_SCHEMA,
+    SectionSchema,
+    section_schema,
     get_canonical_keys,
     get_expected_header_text,
     find_markdown_headers,
+    index_headings,
     validate_section_headers,
 )
 
@@ -88,6 +113,12 @@ ADR_LOCATIONS = (
     "docs/adrs/**/*.md",  # New Style Guide Enforced ADR location
     "docs/adrs/*.md",
 )
+# ADR_LOCATIONS as git pathspecs (glob magic: "**/" spans directories)
+ADR_PATHSPECS = tuple(f":(glob){pattern}" for pattern in ADR_LOCATIONS)
+
+# Linter output directory, relative to the lint root: run logs, metrics,
+# shard artifacts, profiles and the default daemon socket
+LOG_DIR = Path("logs") / ".adr"
 
 # Re-export all for backward compatibility
 __all__ = [
@@ -122,21 +153,38 @@ __all__ = [
     "PLACEHOLDER_RX",
     "DATE_RX",
     "EXTENDS_RX",
+    "FILENAME_ID_RX",
+    "FRONT_MATTER_RX",
     "ID_RX",
     "RFC_2119_RX",
     "VAGUE_TERMS_RX",
     "DECISION_ONE_LINER_PATTERN_RX",
     "DECISION_ONE_LINER_KEY_PATTERN_RX",
     "CONSTRAINT_RULES_KEY_PATTERN_RX",
+    "HTML_COMMENT_RX",
+    "MARKDOWN_HEADER_LINE_RX",
+    "MARKDOWN_HEADER_PREFIX_RX",
+    "MARKDOWN_HEADING_RX",
+    "SENTENCE_SPLIT_RX",
+    "PIN_DATE_RX",
+    "PIN_HEX_LOWER_RX",
+    "PIN_HEX_UPPER_RX",
     # - Patterns: Lists of RegEx
     "PLACEHOLDER_PATTERNS",
     "REAL_VALUE_INDICATORS",
     "VALID_STATUS_TRANSITIONS",
     # - Patterns: Lists of Compiled RegEx
     "PLACEHOLDER_BRACKET_PATTERNS_RXL",
-    # "VALID_SCOPE_TOPIC_PATTERNS_RXL",
+    "PLACEHOLDER_PATTERNS_RXL",
+    "REAL_VALUE_INDICATORS_RXL",
+    "VALID_SCOPE_TOPIC_PATTERNS_RXL",
+    # - Patterns: Combined alternations
+    "PLACEHOLDER_BRACKET_ANY_RX",
+    "PLACEHOLDER_ANY_RX",
+    "SCOPE_TOPIC_ANY_RX",
     # - defs
     "has_placeholder_content",
+    "strip_html_comments",
     "is_single_statement",
     "get_scope_topic_patterns",
     "detect_real_governance_values",
@@ -145,9 +193,15 @@ __all__ = [
     "SECTIONS_UNIVERSAL_CLOSING",
     "CLASS_INSERTIONS",
     "HEADING_ALIASES",
+    "HEADERS_BY_KEY",
+    "SECTION_SCHEMAS",
+    "EMPTY_SECTION_SCHEMA",
+    "SectionSchema",
+    "section_schema",
     "get_canonical_keys",
     "get_expected_header_text",
     "find_markdown_headers",
+    "index_headings",
     "validate_section_headers",
     # LLM Tail
     "LLM_TAIL_CORE_FIELDS",
@@ -159,4 +213,6 @@ __all__ = [
     "CANONICAL_KEYS_STRATEGY",
     # File I/O
     "ADR_LOCATIONS",
+    "ADR_PATHSPECS",
+    "LOG_DIR",
 ]
@@ -28,6 +28,7 @@ CODES = {
     ),
     "ADR-LINK-304": ("E", "Pointer to normative section key missing in base"),
     "ADR-LINK-305": ("E", "Missing references to owner ADRs"),
+    "ADR-LINK-306": ("E", "Pin does not resolve in the git history"),
     "ADR-LINK-320": ("I", "Supersede closure: multiple descendants"),
     "ADR-LINK-321": ("E", "Supersede closure: cycle detected"),
     "ADR-LINK-322": (
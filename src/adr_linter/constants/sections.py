@@ -7,12 +7,16 @@ Canonical section definitions implementing ADR-0001 §4 architecture.
 
 This module implements the universal + class-specific section structure
 defined in ADR-0001 §4, replacing the old hardcoded per-class lists.
+
+Per-class SectionSchema tables (ordered keys, key -> position, acceptable
+headers per key) are built once at import and shared; `section_schema()`
+returns them without allocating.
 """
 
-import re
+from types import MappingProxyType
+from typing import FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
-from typing import List, Optional
-from .validation import VALID_ADR_CLASSES
+from .validation import MARKDOWN_HEADING_RX, VALID_ADR_CLASSES
 
 # --- Universal Sections (ADR-0001 §4) ---------------------------------------
 
@@ -87,6 +91,110 @@ HEADING_ALIASES = {
     "Adoption and Enforcement": "adoption_and_enforcement",
 }
 
+# Reverse alias index: section key -> acceptable header texts (alias order)
+_headers_by_key: dict = {}
+for _heading, _key in HEADING_ALIASES.items():
+    _headers_by_key.setdefault(_key, []).append(_heading)
+HEADERS_BY_KEY: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {k: tuple(v) for k, v in _headers_by_key.items()}
+)
+del _headers_by_key, _heading, _key
+
+
+def _fallback_header(section_key: str) -> str:
+    return section_key.replace("_", " ").title()
+
+
+# --- Section schema tables ---------------------------------------------------
+
+
+class SectionSchema(NamedTuple):
+    """
+    Frozen canonical section layout for one ADR class.
+
+    keys:       ordered canonical keys
+    positions:  key -> index in `keys`
+    key_set:    frozenset(keys)
+    headers:    key -> acceptable markdown header texts
+    """
+
+    keys: Tuple[str, ...]
+    positions: Mapping[str, int]
+    key_set: FrozenSet[str]
+    headers: Mapping[str, Tuple[str, ...]]
+
+
+def _build_schema(keys) -> SectionSchema:
+    keys = tuple(keys)
+    return SectionSchema(
+        keys=keys,
+        positions=MappingProxyType({k: i for i, k in enumerate(keys)}),
+        key_set=frozenset(keys),
+        headers=MappingProxyType(
+            {
+                k: HEADERS_BY_KEY.get(k) or (_fallback_header(k),)
+                for k in keys
+            }
+        ),
+    )
+
+
+EMPTY_SECTION_SCHEMA = _build_schema(())
+
+# Universal only: unknown classes and delta (strict or relaxed)
+_UNIVERSAL_SCHEMA = _build_schema(
+    SECTIONS_UNIVERSAL_OPENING + SECTIONS_UNIVERSAL_CLOSING
+)
+
+# Style-guide is exempt (ADR-0001 §7.4); a template without template_of has
+# no schema of its own (ADR-0001 §7.5).
+SECTION_SCHEMAS: Mapping[str, SectionSchema] = MappingProxyType(
+    {
+        cls: (
+            EMPTY_SECTION_SCHEMA
+            if cls in ("style-guide", "template")
+            else _build_schema(
+                SECTIONS_UNIVERSAL_OPENING
+                + CLASS_INSERTIONS.get(cls, [])
+                + SECTIONS_UNIVERSAL_CLOSING
+            )
+        )
+        for cls in sorted(VALID_ADR_CLASSES)
+    }
+)
+
+
+def section_schema(
+    class_name: str,
+    *,
+    template_of: Optional[str] = None,
+    relaxed_delta: bool = False,
+) -> SectionSchema:
+    """
+    Shared SectionSchema for a class; same rules as get_canonical_keys().
+    """
+    if class_name == "style-guide":
+        return EMPTY_SECTION_SCHEMA
+
+    if class_name == "template":
+        # Template mirrors template_of class per ADR-0001 §7.5
+
+        # HACK: identifying missing input validation through new pytests
+        #       not sure yet how to address this issue as either a new
+        #       undocumented error band and what boundary is supposed
+        #       to govern this kind of error (e.g., engine? cli?
+        #       validation? ); bad/missing template_of is left to
+        #       TEMPLATE-700/705 for now
+        if not isinstance(template_of, str) or not template_of:
+            return EMPTY_SECTION_SCHEMA
+        return SECTION_SCHEMAS.get(template_of, EMPTY_SECTION_SCHEMA)
+
+    if class_name == "delta" and relaxed_delta:
+        return _UNIVERSAL_SCHEMA
+
+    return SECTION_SCHEMAS.get(class_name, _UNIVERSAL_SCHEMA)
+
+
 # --- Canonical Keys API -----------------------------------------------------
 
 
@@ -113,7 +221,8 @@ def get_canonical_keys(
                        base extras)
 
     Returns:
-        Ordered list of canonical section keys for the class
+        Ordered list of canonical section keys for the class (a copy of the
+        precomputed section_schema() keys)
 
     Limitations:
         This refactor handles simple canonical keys only. Dotted keys
@@ -121,46 +230,11 @@ def get_canonical_keys(
         are not implemented and require parser extensions for RFC-2119
         validation.
     """
-
-    # Style-guide exempt from canonical sections per ADR-0001 §7.4
-    if class_name == "style-guide":
-        return []
-
-    # Template mirrors template_of class per ADR-0001 §7.5
-    if class_name == "template":
-        if not isinstance(template_of, str) and class_name == "template":
-            # print(
-            #    f"-[D constants.section.py] template_of: "
-            #    f"{str(template_of)}, {type(template_of)}"
-            # )
-
-            # HACK: identifying missing input validation through new pytests
-            #       not sure yet how to address this issue as either a new
-            #       undocumented error band and what boundary is supposed
-            #       to govern this kind of error (e.g., engine? cli?
-            #       validation? )
-
-            # e.g.,:
-            # raise ValueError(
-            #     f"Invalid template_of: expected string, "
-            #     f"got {type(template_of).__name__}"
-            # )
-
-            return []
-
-        if not template_of or template_of not in VALID_ADR_CLASSES:
-            return []  # Let TEMPLATE-700/705 handle the error
-
-        return get_canonical_keys(template_of)
-
-    # Delta relaxed mode: universal sections required in order, base extras
-    # allowed
-    if class_name == "delta" and relaxed_delta:
-        return SECTIONS_UNIVERSAL_OPENING + SECTIONS_UNIVERSAL_CLOSING
-
-    # Standard class: universal + class-specific insertions
-    insertions = CLASS_INSERTIONS.get(class_name, [])
-    return SECTIONS_UNIVERSAL_OPENING + insertions + SECTIONS_UNIVERSAL_CLOSING
+    return list(
+        section_schema(
+            class_name, template_of=template_of, relaxed_delta=relaxed_delta
+        ).keys
+    )
 
 
 # TOREVIEW: Where should this logic go?  Identifying section headers or
@@ -168,41 +242,47 @@ def get_canonical_keys(
 #           individual validator
 
 
-def find_markdown_headers(body: str) -> dict[str, list[int]]:
+def index_headings(headings) -> dict[str, list[int]]:
     """
-    Find all markdown headers and their line numbers.
+    Header text -> line numbers, from parsed (text, level, pos, line)
+    headings (SectionData.headings).
     """
-    headers = {}
-    lines = body.split("\n")
-
-    for line_num, line in enumerate(lines, 1):
-        # Match markdown headers (## Header Text)
-        header_match = re.match(r"^#+\s+(.+)$", line.strip())
-        if header_match:
-            header_text = header_match.group(1).strip()
-            if header_text not in headers:
-                headers[header_text] = []
-            headers[header_text].append(line_num)
-
+    headers: dict[str, list[int]] = {}
+    for text, _level, _pos, line_num in headings:
+        headers.setdefault(text, []).append(line_num)
     return headers
 
 
-def get_expected_header_text(section_key: str) -> str:
+def find_markdown_headers(body: str) -> dict[str, list[int]]:
     """
-    Get all acceptable markdown header texts for a section key.
+    Find all markdown headers and their line numbers.
+
+    Same definition (MARKDOWN_HEADING_RX) as the parser's headings; parsed
+    documents should read SectionData.heading_index instead.
     """
-    acceptable_headers = []
+    headers: dict[str, list[int]] = {}
+    line_num, last = 1, 0
+    for m in MARKDOWN_HEADING_RX.finditer(body):
+        line_num += body.count("\n", last, m.start())
+        last = m.start()
+        headers.setdefault(m.group(2), []).append(line_num)
+    return headers
+
 
-    # Find all heading aliases that map to this section key
-    for heading_text, key in HEADING_ALIASES.items():
-        if key == section_key:
-            acceptable_headers.append(heading_text)
+def _acceptable_headers(section_key: str) -> Tuple[str, ...]:
+    return HEADERS_BY_KEY.get(section_key) or (
+        _fallback_header(section_key),
+    )
 
-    # If no aliases found, use fallback
-    if not acceptable_headers:
-        acceptable_headers.append(section_key.replace("_", " ").title())
 
-    return acceptable_headers
+def get_expected_header_text(section_key: str) -> List[str]:
+    """
+    Get all acceptable markdown header texts for a section key.
+
+    Reads the reverse alias index (HEADERS_BY_KEY); falls back to the
+    title-cased key when no alias maps to it.
+    """
+    return list(_acceptable_headers(section_key))
 
 
 # TOREVIEW: Where should this logic go?  Again if this code is validating
@@ -213,19 +293,18 @@ def get_expected_header_text(section_key: str) -> str:
 def validate_section_headers(ctx, section_keys: list[str]) -> list[str]:
     """
     Validate that section keys have corresponding markdown headers.
+
+    Uses the parser's header index (ctx.section_data.heading_index) so the
+    body is not re-split per validation.
     """
     violations = []
-    markdown_headers = find_markdown_headers(ctx.body)
+    markdown_headers = ctx.section_data.heading_index
 
     for section_key in section_keys:
-        acceptable_headers = get_expected_header_text(section_key)
+        acceptable_headers = _acceptable_headers(section_key)
 
         # Check if any acceptable header exists
-        header_found = any(
-            header in markdown_headers for header in acceptable_headers
-        )
-
-        if not header_found:
+        if markdown_headers.keys().isdisjoint(acceptable_headers):
             # Show all acceptable options in error
             header_options = "' or '".join(acceptable_headers)
             violations.append(
@@ -4,6 +4,12 @@
 
 """
 Validation patterns, valid values, and metadata definitions.
+
+Pattern registry: every regex the validators use is compiled here, once, at
+import. Rules that test "any of" a pattern list get a combined alternation
+(`*_ANY_RX`); rules that need per-pattern order keep a compiled list
+(`*_RXL`). Validators never call `re.compile` or pass string patterns to
+`re` at runtime (pinned by tests/adr_linter/registry).
 """
 
 import re
@@ -132,6 +138,15 @@ PLACEHOLDER_RX = re.compile(r"_placeholder\.py\Z")
 DATE_RX = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 EXTENDS_RX = re.compile(r"^ADR-\d{4}@(20\d{2}-\d{2}-\d{2}|[0-9a-f]{7,40})$")
 ID_RX = re.compile(r"^ADR-\d{4}$")
+# YAML front matter: `---` fence, payload, closing `---` line (or EOF)
+FRONT_MATTER_RX = re.compile(
+    r"^\s*---\s*\n"  # opening fence
+    r"(.*?)"  # YAML payload
+    r"\n---\s*(?:\n|$)",  # closing fence, allow EOF
+    re.S | re.M,
+)
+# ADR id encoded in a file name ("ADR-0001-style-guide.md" -> "ADR-0001")
+FILENAME_ID_RX = re.compile(r"^(ADR-\d{4})\b")
 
 RFC_2119_RX = re.compile(
     r"\b(" + "|".join(map(re.escape, RFC_2119_TERMS)) + r")\b",
@@ -158,6 +173,28 @@ CONSTRAINT_RULES_KEY_PATTERN_RX = re.compile(
     r"<!-- key: constraint_rules -->\s*\n(.*?)(?=<!-- key: \w+|$)", re.DOTALL
 )
 
+HTML_COMMENT_RX = re.compile(r"<!--.*?-->", re.DOTALL)
+
+# The one ATX heading definition, shared by the parser (SectionData.headings
+# / heading_index) and find_markdown_headers: optional indent, hashes, at
+# least one blank, text starting with a non-blank; trailing blanks (incl.
+# CR) dropped. Group 1: hashes (level), group 2: heading text.
+MARKDOWN_HEADING_RX = re.compile(
+    r"^[^\S\n]*(#+)[^\S\n]+(\S.*?)[^\S\n]*$", re.MULTILINE
+)
+
+# Header stripping: whole line (SCHEMA-016), leading hashes only
+# (TEMPLATE-606)
+MARKDOWN_HEADER_LINE_RX = re.compile(r"^#+\s*.*$", re.MULTILINE)
+MARKDOWN_HEADER_PREFIX_RX = re.compile(r"^#+\s*", re.MULTILINE)
+
+SENTENCE_SPLIT_RX = re.compile(r"[.!?]+\s+")
+
+# Relationship pins (LINK-303): ADR@YYYY-MM-DD or ADR@<hex sha>
+PIN_DATE_RX = re.compile(r"^20\d{2}-\d{2}-\d{2}$")
+PIN_HEX_LOWER_RX = re.compile(r"^[0-9a-f]{7,40}$")
+PIN_HEX_UPPER_RX = re.compile(r"^[0-9A-F]{7,40}$")
+
 # --- Regex List of RegEx -----------------------------------------------------
 
 # Common placeholder patterns in templates
@@ -195,7 +232,42 @@ PLACEHOLDER_BRACKET_PATTERNS_RXL = [
     re.compile(r"\[[^\]]+\]"),  # Square brackets
 ]
 
-# VALID_SCOPE_TOPIC_PATTERNS_RXL = _build_topic_patterns()
+# Case-sensitive, as TEMPLATE-608 has always matched them
+PLACEHOLDER_PATTERNS_RXL = [re.compile(p) for p in PLACEHOLDER_PATTERNS]
+
+# Order matters: TEMPLATE-608 reports the first hit of the first indicator
+REAL_VALUE_INDICATORS_RXL = [
+    re.compile(p, re.IGNORECASE) for p in REAL_VALUE_INDICATORS
+]
+
+
+def _scope_topic_rx(values) -> "re.Pattern[str]":
+    # sorted: set order varies with the hash seed
+    alternation = "|".join(sorted(values))
+    return re.compile(rf"\b({alternation})\.[a-zA-Z_][a-zA-Z0-9_]*")
+
+
+# Standard scope.topic (cli.topic, engine.topic, ...) then scope topics
+# (shared.topic, other.topic, ...)
+VALID_SCOPE_TOPIC_PATTERNS_RXL = [
+    _scope_topic_rx(VALID_SCOPE_VALUES),
+    _scope_topic_rx(VALID_SCOPE_TOPIC_VALUES),
+]
+
+# --- Combined alternations ("any of") ----------------------------------------
+
+
+def _any_rx(patterns, flags: int = 0) -> "re.Pattern[str]":
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+PLACEHOLDER_BRACKET_ANY_RX = _any_rx(
+    rx.pattern for rx in PLACEHOLDER_BRACKET_PATTERNS_RXL
+)
+PLACEHOLDER_ANY_RX = _any_rx(PLACEHOLDER_PATTERNS)
+SCOPE_TOPIC_ANY_RX = _any_rx(
+    rx.pattern for rx in VALID_SCOPE_TOPIC_PATTERNS_RXL
+)
 
 # --- Status Transition Rules -------------------------------------------------
 
@@ -222,16 +294,21 @@ def has_placeholder_content(content: str) -> bool:
     """
     Check if content contains any placeholder bracket patterns.
     """
-    return any(
-        pattern.search(content) for pattern in PLACEHOLDER_BRACKET_PATTERNS_RXL
-    )
+    return PLACEHOLDER_BRACKET_ANY_RX.search(content) is not None
+
+
+def strip_html_comments(content: str) -> str:
+    """
+    Remove HTML comments (key markers, editor notes) from section content.
+    """
+    return HTML_COMMENT_RX.sub("", content)
 
 
 def is_single_statement(content: str) -> bool:
     """
     Check if content is a single statement (one sentence).
     """
-    sentences = re.split(r"[.!?]+\s+", content.strip())
+    sentences = SENTENCE_SPLIT_RX.split(content.strip())
     return len([s for s in sentences if s.strip()]) == 1
 
 
@@ -241,22 +318,8 @@ def is_single_statement(content: str) -> bool:
 
 
 def get_scope_topic_patterns():
-    """Build compiled regex patterns for real topic detection."""
-    patterns = []
-
-    # Standard scope.topic patterns (cli.topic, engine.topic, etc.)
-    scope_pattern = "|".join(VALID_SCOPE_VALUES)
-    patterns.append(
-        re.compile(rf"\b({scope_pattern})\.[a-zA-Z_][a-zA-Z0-9_]*")
-    )
-
-    # Scope topic patterns (shared.topic, other.topic, etc.)
-    scope_topic_pattern = "|".join(VALID_SCOPE_TOPIC_VALUES)
-    patterns.append(
-        re.compile(rf"\b({scope_topic_pattern})\.[a-zA-Z_][a-zA-Z0-9_]*")
-    )
-
-    return patterns
+    """Compiled regex patterns for real topic detection (precompiled)."""
+    return VALID_SCOPE_TOPIC_PATTERNS_RXL
 
 
 # TOREVIEW: Where should this logic go?  parser? here like sections.py
@@ -268,7 +331,6 @@ def get_scope_topic_patterns():
 def detect_real_governance_values(constraint_data: dict) -> list[str]:
     """Detect real governance values in constraint rules."""
     violations = []
-    _REAL_TOPIC_PATTERNS_RXL = get_scope_topic_patterns()
 
     _YAML_CHECK_KEYS = VALID_SCOPE_YAML_KEYS - {"OWNED_BY"}
     _YAML_KEY_OWNED_BY = "OWNED_BY"
@@ -279,13 +341,12 @@ def detect_real_governance_values(constraint_data: dict) -> list[str]:
             for topic in constraint_data[key]:
                 if isinstance(topic, str):
                     # Check for real topic patterns
-                    for pattern in _REAL_TOPIC_PATTERNS_RXL:
-                        if pattern.search(
-                            topic
-                        ) and not has_placeholder_content(topic):
-                            violations.append(
-                                f"{key} contains real topic '{topic}'"
-                            )
+                    if SCOPE_TOPIC_ANY_RX.search(
+                        topic
+                    ) and not has_placeholder_content(topic):
+                        violations.append(
+                            f"{key} contains real topic '{topic}'"
+                        )
 
     # Check OWNED_BY for real scope and topic values
     if _YAML_KEY_OWNED_BY in constraint_data and isinstance(
@@ -296,14 +357,13 @@ def detect_real_governance_values(constraint_data: dict) -> list[str]:
                 # Check topic field
                 if "topic" in item and isinstance(item["topic"], str):
                     topic = item["topic"]
-                    for pattern in _REAL_TOPIC_PATTERNS_RXL:
-                        if pattern.search(
-                            topic
-                        ) and not has_placeholder_content(topic):
-                            violations.append(
-                                f"{_YAML_KEY_OWNED_BY} contains real "
-                                f"topic '{topic}'"
-                            )
+                    if SCOPE_TOPIC_ANY_RX.search(
+                        topic
+                    ) and not has_placeholder_content(topic):
+                        violations.append(
+                            f"{_YAML_KEY_OWNED_BY} contains real "
+                            f"topic '{topic}'"
+                        )
 
                 # Check owner field for real scope values
                 if "owner" in item and isinstance(item["owner"], str):
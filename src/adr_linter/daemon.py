@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/daemon.py
+
+"""
+`theseus daemon` / `theseus --client` — warm lint server on a Unix socket.
+
+Works like mypy's dmypy: the daemon imports the validators once, keeps
+the registry's compiled rule plans and one mtime-validated IndexCache per
+lint root, and serves lint requests. The client forwards its argv and
+working directory and replays the daemon's stdout/stderr and exit code,
+so hooks see the same output as an in-process `theseus` run.
+
+Wire format (one request per connection, JSON lines):
+  client → {"argv": [...], "cwd": "..."}   or   {"stop": true}
+  daemon → {"stdout": "..."}, {"stderr": "..."}, {"rc": N}
+
+The client keeps its imports to the stdlib (plus the constants package);
+when no daemon answers it falls back to linting in-process. Both sides
+default to <lint root>/logs/.adr/theseus.sock and make the socket path
+absolute, so the daemon and a client started from another directory
+(`--path ..`) meet on the same socket.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .services.index import IndexCache
+    from .services.staged import BlobCache
+
+from .constants import LOG_DIR
+
+SOCKET_NAME = "theseus.sock"
+
+
+def socket_path(sock: Optional[str], root: str = ".") -> Path:
+    """
+    Absolute socket path: `--socket` when given, else the lint root's
+    logs/.adr/theseus.sock.
+    """
+    path = Path(sock) if sock else Path(root) / LOG_DIR / SOCKET_NAME
+    return path.resolve()
+
+
+# ---- Server -----------------------------------------------------------------
+
+
+class LintDaemon:
+    """
+    Request handler state: one IndexCache per resolved lint root.
+    """
+
+    def __init__(self, sock: Path | str | None = None):
+        # Absolute: lint() switches to each client's working directory
+        self.socket_path = socket_path(sock and str(sock))
+        self._caches: Dict[str, "IndexCache"] = {}
+        # Parsed staged blobs per root (--staged; keyed by blob SHA)
+        self._blobs: Dict[str, "BlobCache"] = {}
+
+    def lint(self, argv: List[str], cwd: str) -> Tuple[str, str, int]:
+        """
+        Run one CLI lint in-process against warm state.
+
+        Requests are served one at a time, so switching to the client's
+        working directory keeps report paths identical to a local run.
+        A lint that raises (e.g. a rule tripping over a malformed ADR)
+        answers rc=2 with the traceback on stderr; the daemon keeps
+        serving.
+        """
+        from .cli import create_parser, shard_arg, staged_arg
+        from .engine import run
+        from .services.index import IndexCache
+        from .services.staged import BlobCache
+
+        out, err = io.StringIO(), io.StringIO()
+        prev = os.getcwd()
+        try:
+            os.chdir(cwd)
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    parser = create_parser()
+                    args = parser.parse_args(argv)
+                    key = Path(args.path).resolve().as_posix()
+                    cache = self._caches.setdefault(key, IndexCache())
+                    rc = run(
+                        path=args.path,
+                        fail_on=args.fail_on,
+                        k_expr=args.keyword,
+                        emit_metrics=args.emit_metrics,
+                        fmt=args.format,
+                        index_cache=None if args.stream else cache,
+                        stream=args.stream,
+                        shard=shard_arg(parser, args),
+                        shard_out=args.shard_out and Path(args.shard_out),
+                        jobs=args.jobs,
+                        threads=args.threads,
+                        verify_pins=args.verify_pins,
+                        staged=staged_arg(parser, args),
+                        blob_cache=self._blobs.setdefault(key, BlobCache()),
+                        profile=args.profile,
+                        trace=args.trace and Path(args.trace),
+                    )
+                except SystemExit as e:  # argparse errors / --help
+                    rc = e.code if isinstance(e.code, int) else 2
+                except Exception:
+                    traceback.print_exc()
+                    rc = 2
+        finally:
+            os.chdir(prev)
+        return out.getvalue(), err.getvalue(), rc
+
+    def _handle(self, conn: socket.socket) -> bool:
+        with conn, conn.makefile("rwb") as f:
+            line = f.readline()
+            if not line:
+                return True
+            request = json.loads(line.decode("utf-8"))
+            if request.get("stop"):
+                _send(f, {"rc": 0})
+                return False
+            stdout, stderr, rc = self.lint(
+                list(request.get("argv", [])), request.get("cwd", ".")
+            )
+            if stdout:
+                _send(f, {"stdout": stdout})
+            if stderr:
+                _send(f, {"stderr": stderr})
+            _send(f, {"rc": rc})
+        return True
+
+    def serve_forever(self, ready: Optional[threading.Event] = None) -> int:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(self.socket_path))
+            server.listen()
+            if ready is not None:
+                ready.set()
+            while True:
+                conn, _ = server.accept()
+                try:
+                    keep = self._handle(conn)
+                except Exception:
+                    # Malformed request or a client that went away
+                    traceback.print_exc()
+                    keep = True
+                if not keep:
+                    break
+        finally:
+            server.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+        return 0
+
+
+def _send(f, payload: Dict) -> None:
+    f.write(json.dumps(payload).encode("utf-8") + b"\n")
+    f.flush()
+
+
+# ---- Client -----------------------------------------------------------------
+
+
+def request(sock_path: Path, payload: Dict) -> int:
+    """
+    Send one request and replay the daemon's streams; returns its rc.
+    Raises OSError when no daemon is listening; a connection closed
+    before the rc arrived is reported on stderr and returns 1.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(sock_path))
+        with s.makefile("rwb") as f:
+            _send(f, payload)
+            rc = None
+            for line in f:
+                msg = json.loads(line.decode("utf-8"))
+                if "stdout" in msg:
+                    sys.stdout.write(msg["stdout"])
+                if "stderr" in msg:
+                    sys.stderr.write(msg["stderr"])
+                if "rc" in msg:
+                    rc = msg["rc"]
+            sys.stdout.flush()
+            if rc is None:
+                print(
+                    f"theseus: daemon at {sock_path} closed the connection "
+                    "without a result",
+                    file=sys.stderr,
+                )
+                return 1
+            return rc
+
+
+def client_main(
+    argv: List[str], sock: Optional[str], root: str
+) -> Optional[int]:
+    """
+    `theseus --client [--socket PATH] <lint args>`: forward the parsed
+    argv to the daemon. Returns None when no daemon answers, for the
+    caller to lint in-process.
+    """
+    path = socket_path(sock, root)
+    if hasattr(socket, "AF_UNIX"):
+        try:
+            return request(path, {"argv": argv, "cwd": os.getcwd()})
+        except OSError:
+            pass
+    print(
+        f"theseus: no daemon at {path}; linting in-process", file=sys.stderr
+    )
+    return None
+
+
+def daemon_main(argv: List[str]) -> int:
+    """
+    `theseus daemon [--path ROOT] [--socket PATH] [--stop]` (runs in the
+    foreground).
+    """
+    parser = argparse.ArgumentParser(prog="theseus daemon")
+    parser.add_argument(
+        "--path", default=".", help="lint root holding the default socket"
+    )
+    parser.add_argument("--socket", default=None)
+    parser.add_argument("--stop", action="store_true")
+    args = parser.parse_args(argv)
+    sock = socket_path(args.socket, args.path)
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("theseus daemon: Unix sockets unavailable", file=sys.stderr)
+        return 2
+    if args.stop:
+        try:
+            return request(sock, {"stop": True})
+        except OSError:
+            print(f"theseus daemon: not running at {sock}")
+            return 1
+    return LintDaemon(sock).serve_forever()
@@ -7,36 +7,76 @@ TOREVIEW: [!?] - Need to confirm why this exists if not used in the actual
                  linter
           [??] - Need to confirm if this entry is still needed in this
                  file
+
+Entry points:
+ - run(path, ...):        CLI pipeline (discovery, printing, run logs)
+ - lint(documents, ...):  in-memory, side-effect free; returns Findings
+ - iter_findings(...):    generator variant of lint()
 """
 
 from __future__ import annotations
 
 
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .constants import (
+    LOG_DIR,
     SEVERITY_LEVELS,
 )
 
-from .filters import compile_k
+from .filters import compile_k, path_key
 
 from .models import ValidationData
 
 from .parser.front_matter import parse_front_matter
 
 from .parser.structure import (
+    ProjectedEntry,
+    build_index_from_texts,
     parse_document_structure,
+    project_document,
 )
 
-from .report import Report
+from .report import Finding, Findings, Report
 
 from .services.index import (
-    build_index_from_files,
-    load_files,
+    IndexCache,
+    LazyIndex,
+    build_header_index,
+    build_index_parallel,
+    build_projection_index,
+    discover,
     read_text as service_read_text,
 )
 
+from .services.linkgraph import build_link_graph
+
+from .services.pins import PinResolver
+
+from .services.profile import PhaseProfiler, profile_dir
+
+from .services.session import split_location
+
+from .services.staged import BlobCache, staged_snapshot
+
+from .services.shard import default_artifact, shard_of, write_artifact
+
 from .services.telemetry import (
     _run_log_path,
     _write_run_logs_md,
@@ -45,32 +85,330 @@ from .services.telemetry import (
     enhanced_metrics_tracking,
 )
 
+from .tracing import Tracer, span, tracing
+
+from .validators.schema.bulk import FrontMatterTable, run_bulk
+
 from .validators.registry import (
+    manifest_codes_cross_file,
+    manifest_codes_per_file,
     run_all as _run_all_validators,
     post_run as _post_run_validators,
 )
 
 
+def _local_codes() -> frozenset:
+    """
+    Per-file rule codes whose result depends on the document alone.
+    """
+    return frozenset(manifest_codes_per_file()) - frozenset(
+        manifest_codes_cross_file()
+    )
+
+
+def _validation_context(
+    path: Path,
+    text: str,
+    idx: Dict[str, Dict[str, Any]],
+    link_graph,
+    pins: Optional[PinResolver] = None,
+) -> ValidationData:
+    meta, end = parse_front_matter(text)
+    body = text[end:]
+    return ValidationData(
+        meta=meta,
+        body=body,
+        path=path,
+        section_data=parse_document_structure(body),
+        all_idx=idx,
+        link_graph=link_graph,
+        pins=pins,
+    )
+
+
+def _bulk_schema(
+    files: Iterable[Path],
+    idx: Dict[str, Dict[str, Any]],
+    codes: Optional[Iterable[str]] = None,
+) -> Dict[Path, Dict[str, List[Finding]]]:
+    """
+    Run the front-matter-only SCHEMA rules in bulk over the files' index
+    entries; findings per path, for run_all(..., precomputed=...). Files
+    without an entry of their own (no id, or a duplicate id) are left to
+    the per-file rules.
+    """
+    metas = {entry["path"]: entry["meta"] for entry in idx.values()}
+    rows = [p for p in files if p in metas]
+    table = FrontMatterTable(rows, [metas[p] for p in rows])
+    return dict(zip(rows, run_bulk(table, codes)))
+
+
+def _lint_file(
+    p: Path,
+    idx: Dict[str, Dict[str, Any]],
+    link_graph,
+    codes: Optional[Iterable[str]],
+    precomputed: Optional[Dict[str, List[Finding]]],
+    *,
+    project: bool = False,
+    keep_meta: bool = False,
+    pins: Optional[PinResolver] = None,
+    text: Optional[str] = None,
+) -> Tuple[List[Finding], Optional[Tuple[Dict, str]], Any]:
+    """
+    Per-file phase for one document: (findings, (meta, body) when
+    keep_meta, shard projection when project). Findings go to a buffer
+    owned by this call, so documents can be linted on worker threads
+    against the shared read-only index and merged in file order.
+
+    Keep the existing double-read behavior; route through services to
+    keep engine pure. The index phase and this phase read files
+    separately, which isolates them. `text` (staged blobs) skips the read.
+    """
+    if text is None:
+        text = service_read_text(p, encoding="utf-8")
+    ctx = _validation_context(p, text, idx, link_graph, pins)
+    buf = Report()
+    _run_all_validators(ctx, buf, codes, precomputed)
+    return (
+        buf.items,
+        (ctx.meta, ctx.body) if keep_meta else None,
+        project_document(p, text) if project else None,
+    )
+
+
+def _map_ordered(
+    fn: Callable[[Path], Any], items: Iterable[Path], threads: Optional[int]
+) -> Iterator[Any]:
+    """
+    fn over items, results in input order. With threads > 1, calls run on
+    a thread pool at most 2 * threads items ahead of the consumer (keeps
+    the --stream memory bound to a window of documents).
+    """
+    if not threads or threads <= 1:
+        yield from map(fn, items)
+        return
+    with ThreadPoolExecutor(threads) as pool:
+        window = deque()
+        for item in items:
+            window.append(pool.submit(fn, item))
+            if len(window) >= 2 * threads:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+@contextmanager
+def _phase(prof: Optional[PhaseProfiler], name: str) -> Iterator[None]:
+    # A run phase: a trace span, profiled when --profile is on
+    with span(name, "phase"):
+        with prof.phase(name) if prof is not None else nullcontext():
+            yield
+
+
+def _drain(rpt: Report) -> Iterator[Finding]:
+    items, rpt.items = rpt.items, []
+    yield from items
+
+
+def iter_findings(
+    documents: Iterable[Tuple[Union[str, Path], str]],
+    *,
+    rules: Optional[Iterable[str]] = None,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Iterator[Finding]:
+    """
+    Lint in-memory documents and yield findings as each document finishes.
+
+    documents: (path, text) pairs; paths only label findings and are never
+               opened, so drafts need not exist on disk.
+    rules:     optional subset of rule codes to run (default: all).
+    index:     optional prebuilt index (id -> entry) giving cross-file
+               context, e.g. the committed corpus; the documents' own
+               entries are added on top (a draft replaces its indexed id).
+
+    Per-file findings are yielded document by document, post-run (graph)
+    findings last. Nothing is read, written or printed.
+    """
+    docs = [(Path(p), text) for p, text in documents]
+    own = build_index_from_texts(docs)
+    idx = dict(index) if index is not None else {}
+    idx.update(own)
+    link_graph = build_link_graph(idx)
+
+    rules = frozenset(rules) if rules is not None else None
+    bulk = _bulk_schema((p for p, _ in docs), own, rules)
+    rpt = Findings()
+    for p, text in docs:
+        ctx = _validation_context(p, text, idx, link_graph)
+        _run_all_validators(ctx, rpt, rules, bulk.get(p))
+        yield from _drain(rpt)
+
+    _post_run_validators(idx, rpt, link_graph, rules)
+    yield from _drain(rpt)
+
+
+def lint(
+    documents: Iterable[Tuple[Union[str, Path], str]],
+    *,
+    rules: Optional[Iterable[str]] = None,
+    index: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Findings:
+    """
+    Pure library entry point: lint (path, text) pairs without touching the
+    filesystem or stdout. See iter_findings() for the arguments.
+
+    Use `Findings.exit_code(fail_on)` for the CLI's pass/fail decision and
+    `Findings.print()` to render the usual report.
+    """
+    findings = Findings()
+    findings.items.extend(iter_findings(documents, rules=rules, index=index))
+    return findings
+
+
 def run(
     path: str = ".",
     fail_on: str = "E",
     k_expr: Optional[str] = None,
     emit_metrics: bool = False,
     fmt: str = "md",
+    index_cache: Optional[IndexCache] = None,
+    stream: bool = False,
+    shard: Optional[Tuple[int, int]] = None,
+    shard_out: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    threads: Optional[int] = None,
+    verify_pins: bool = False,
+    staged: bool = False,
+    blob_cache: Optional[BlobCache] = None,
+    profile: Union[str, PhaseProfiler, None] = None,
+    trace: Optional[Path] = None,
 ) -> int:
+    if trace is not None:
+        # Re-enter with a tracer active; the file is written even when the
+        # run fails
+        kwargs = dict(locals(), trace=None)
+        with tracing(Tracer()) as tracer:
+            try:
+                return run(**kwargs)
+            finally:
+                tracer.write(Path(trace))
+                print(f"trace: {Path(trace).as_posix()}", file=sys.stderr)
+    if isinstance(profile, str):
+        # Re-enter with a profiler; it is stopped and written even when
+        # the run returns early or fails
+        kwargs = dict(locals())
+        prof = kwargs["profile"] = PhaseProfiler(profile)
+        try:
+            return run(**kwargs)
+        finally:
+            for written in prof.write(profile_dir(Path(path))):
+                print(f"profile: {written.as_posix()}", file=sys.stderr)
     root = Path(path)
-    all_files = load_files(root)
 
-    files = all_files
-    if k_expr:
-        pred = compile_k(k_expr)
-        files = [p for p in all_files if pred(p)]
-
-    rpt = Report()
     """
-    Build full index from all discovered files (impure call in services.index)
+    Build the index (impure calls in services.index). Without -k every
+    discovered file is indexed; with -k the matcher runs inside the
+    discovery walk, only the selected files are parsed up front and other
+    ADRs are loaded when a rule looks them up (LazyIndex).
+
+    stream=True is the bounded-memory mode: phase 1 keeps only a slim
+    link-relevant projection per document (build_projection_index), phase
+    2 validates one file at a time and drops its text once its rules ran.
+
+    shard=(i, N) lints only this shard's files with the rules that need no
+    other document and writes a shard artifact (services.shard) instead of
+    running cross-file rules; `theseus merge` finishes the run.
+
+    jobs=N (N > 1) builds a full-corpus header index with the pipelined
+    builder (reader threads, N parser processes); -k runs load lazily and
+    keep the sequential builder.
+
+    threads=N (N > 1) runs the per-file phase on N threads sharing the
+    read-only index; each document's findings are buffered separately and
+    merged in file order, so the report is identical to a serial run.
+    Rules keep no shared mutable state besides idempotent memos (plans,
+    resolved rule functions, `extends` chains); lazy -k loads are locked
+    in LinkGraph.has_node(). The speed-up needs a free-threaded build
+    (3.13t); with the GIL it mostly overlaps file reads.
+
+    verify_pins=True checks relationship pins against the local git
+    history (ADR-LINK-306, services.pins). It is a single-node check:
+    `merge` has no work tree, so the CLI rejects it with --shard.
+
+    staged=True lints the staged ADRs (pre-commit) from their git blobs,
+    with the index snapshot as cross-file context (services.staged); the
+    work tree is not read. `blob_cache` keeps parsed blobs across runs.
+
+    profile="cpu"|"mem"|"all" wraps each phase in cProfile and/or
+    tracemalloc and writes logs/.adr/profile.{prof,txt} (services.profile),
+    also when the run fails; a PhaseProfiler records into the caller's.
+
+    trace=PATH writes a Chrome Trace Event timeline of the run (phases,
+    reads, parses, rule calls, graph builds; one track per thread) to
+    PATH (tracing.py).
     """
-    idx = build_index_from_files(all_files)
+    phase = partial(_phase, profile)
+    matcher = compile_k(k_expr) if k_expr else None
+    texts: Dict[Path, str] = {}
+    with phase("discover"):
+        if staged:
+            # Pre-commit: lint the staged ADRs against the index snapshot
+            try:
+                files, texts, idx = staged_snapshot(root, blob_cache)
+            except (OSError, ValueError) as e:
+                print(f"theseus --staged: {e}", file=sys.stderr)
+                return 2
+            if matcher is not None:
+                files = [p for p in files if matcher.match_key(path_key(p))]
+        else:
+            files, others = discover(
+                root, matcher.match_key if matcher else None
+            )
+    codes = None
+    documents: List[ProjectedEntry] = []
+    with phase("index"):
+        if shard is not None:
+            # Cross-file rules run at merge time over every shard's
+            # projection
+            files = [
+                p
+                for p in files
+                if shard_of(p.relative_to(root), shard[1]) == shard[0]
+            ]
+            codes = _local_codes()
+            idx = {}
+        elif not staged:
+            if stream:
+                build = build_projection_index
+            elif index_cache is not None:
+                # Warm daemon state: only files whose stat changed are
+                # re-parsed
+                build = partial(index_cache.build, evict=matcher is None)
+            elif jobs and jobs > 1 and matcher is None:
+                build = partial(
+                    build_index_parallel, workers=jobs, header_only=True
+                )
+            else:
+                # Per-file rules re-read each linted file; the index keeps
+                # front matter only and parses a target's sections on
+                # demand
+                build = build_header_index
+            if matcher is None:
+                idx = build(files)
+            else:
+                idx = LazyIndex(others, build=build)
+                idx.seed(files)
+        # Front-matter SCHEMA rules run as column passes over all linted
+        # files (a stream projection and a shard run keep no full front
+        # matter)
+        bulk = (
+            _bulk_schema(files, idx) if shard is None and not stream else {}
+        )
+        with span("link_graph", "graph"):
+            link_graph = build_link_graph(idx)
+
+    rpt = Report()
 
     run_log_path = _run_log_path(root, fmt)
 
@@ -78,41 +416,71 @@ def run(
     # TOREVIEW: Have this logic moved to telemetry.py if values need
     #           to be created or set during runtime
     metrics_path = (
-        (root / "logs" / ".adr" / "lint_metrics.json")
+        (root / LOG_DIR / "lint_metrics.json")
         if emit_metrics
         else None
     )
     if metrics_path:
         ensure_metrics_file(metrics_path)
 
-    for p in files:
-        """
-        Keep the existing double-read behavior; route through services to
-        keep engine pure.  i.e., service wrapper
-
-        The current approach reads files twice - once for indexing and once
-        for validation. While this seems wasteful, it provides isolation
-        between the index-building phase and the validation phase.
-        """
-
-        text = service_read_text(p, encoding="utf-8")
-        meta, end = parse_front_matter(text)
-        body = text[end:]
-        section_data = parse_document_structure(body)
-
-        ctx = ValidationData(
-            meta=meta,
-            body=body,
-            path=p,
-            section_data=section_data,
-            all_idx=idx,
+    pins = PinResolver(root) if verify_pins else None
+    if pins is not None and not pins.available:
+        print(
+            "theseus --verify-pins: not a git work tree; LINK-306 skipped",
+            file=sys.stderr,
         )
+        pins = None
 
-        _run_all_validators(ctx, rpt)
+    def _one(p: Path):
+        return _lint_file(
+            p,
+            idx,
+            link_graph,
+            codes,
+            bulk.get(p),
+            project=shard is not None,
+            keep_meta=metrics_path is not None,
+            pins=pins,
+            text=texts.get(p),
+        )
 
-        enhanced_metrics_tracking(meta, body, p, rpt, metrics_path)
+    with phase("validate"):
+        try:
+            results = _map_ordered(_one, files, threads)
+            for p, (findings, kept, projection) in zip(files, results):
+                rpt.items.extend(findings)
+                if projection is not None:
+                    documents.append(projection)
+                if kept is not None:
+                    enhanced_metrics_tracking(*kept, p, rpt, metrics_path)
+                # Nothing but findings outlives this iteration (streaming
+                # bound)
+                del findings, kept, projection
+        finally:
+            # Reap the cat-file process even when a rule raises (daemon)
+            if pins is not None:
+                pins.close()
 
-    _post_run_validators(idx, rpt)
+    with phase("post_run"):
+        if shard is not None:
+            out = shard_out or default_artifact(root, shard)
+            write_artifact(out, shard, rpt.items, documents, root)
+        elif matcher is None and not staged:
+            _post_run_validators(idx, rpt, link_graph)
+        else:
+            # Graph rules see the linked subgraph (-k) or the whole staged
+            # snapshot; report the linted files only
+            if isinstance(idx, LazyIndex):
+                idx.expand()
+                link_graph.sync()
+            post = Report()
+            _post_run_validators(idx, post, link_graph)
+            keep = {p.as_posix() for p in files}
+            rpt.items.extend(
+                f
+                for f in post.items
+                if split_location(f.location)[0] in keep
+            )
 
     if emit_metrics:
         # Append run logs in chosen format
@@ -122,7 +490,12 @@ def run(
             _write_run_logs_jsonl(rpt.items, run_log_path)
 
     # print and compute exit code exactly like today
-    rpt.print()
+    with phase("report"):
+        rpt.print()
+    if shard is not None:
+        # Partial findings; the pass/fail decision is `theseus merge`'s
+        print(f"shard {shard[0]}/{shard[1]} artifact: {out.as_posix()}")
+        return 0
     threshold = SEVERITY_LEVELS[fail_on]
     for sev, _, _, _ in rpt.items:
         if SEVERITY_LEVELS.get(sev, 0) >= threshold:
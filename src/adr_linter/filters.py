@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 # !/usr/bin/env python3
-# src/adr_linter/parser/structure.py
+# src/adr_linter/filters.py
 
 """
 Reusable helpers for file selection and predicates (pytest-like -k).
@@ -9,12 +9,16 @@ Behavior is intentionally identical to the legacy implementation:
 - supports and/or/not, parentheses, bare/quoted tokens
 - tokens match case-insensitive substrings of full path OR filename
 - falls back to simple substring match if parse fails
+
+The expression compiles to a flat KMatcher evaluated on precomputed
+lowercase path keys, so discovery (services.index) can apply it while
+walking instead of after globbing everything.
 """
 
 from __future__ import annotations
 import re
 from pathlib import Path
-from typing import Callable, List
+from typing import List
 
 
 def _tokenize_k(expr: str) -> List[str]:
@@ -37,32 +41,70 @@ def _strip_quotes(tok: str) -> str:
     return tok
 
 
-def compile_k(expr: str) -> Callable[[Path], bool]:
+def path_key(path: Path) -> str:
     """
-    Compile a pytest-like -k boolean expression into a predicate Path->bool.
+    Precomputed match key: the lowercase posix path. The filename is its
+    suffix, so "token in path or token in name" is "token in key".
     """
-    tokens = _tokenize_k(expr)
-    if not tokens:
-        return lambda _p: True
+    return path.as_posix().lower()
+
+
+# Flat program opcodes; non-negative entries index KMatcher.needles
+_OP_AND = -1
+_OP_OR = -2
+_OP_NOT = -3
 
-    def _combine_or(left_pred, right_pred):
-        def predicate(path_obj: Path) -> bool:
-            return left_pred(path_obj) or right_pred(path_obj)
 
-        return predicate
+class KMatcher:
+    """
+    Compiled -k expression: lowercase needles plus a flat postfix program.
 
-    def _combine_and(left_pred, right_pred):
-        def predicate(path_obj: Path) -> bool:
-            return left_pred(path_obj) and right_pred(path_obj)
+    match_key() tests each needle once against a precomputed key and runs
+    the program on a small stack (no per-node closures, no per-node
+    lowercasing); calling the matcher with a Path keeps the legacy
+    predicate interface.
+    """
 
-        return predicate
+    __slots__ = ("expr", "needles", "program")
+
+    def __init__(self, expr: str, needles, program):
+        self.expr = expr
+        self.needles = tuple(needles)
+        self.program = tuple(program)
+
+    def match_key(self, key: str) -> bool:
+        if not self.program:
+            return True
+        hits = [n in key for n in self.needles]
+        stack: List[bool] = []
+        for op in self.program:
+            if op >= 0:
+                stack.append(hits[op])
+            elif op == _OP_NOT:
+                stack[-1] = not stack[-1]
+            else:
+                rhs = stack.pop()
+                if op == _OP_AND:
+                    stack[-1] = stack[-1] and rhs
+                else:
+                    stack[-1] = stack[-1] or rhs
+        return stack[-1]
 
-    def _negate(pred):
-        def predicate(path_obj: Path) -> bool:
-            return not pred(path_obj)
+    def __call__(self, path: Path) -> bool:
+        return self.match_key(path_key(path))
 
-        return predicate
 
+def compile_k(expr: str) -> KMatcher:
+    """
+    Compile a pytest-like -k boolean expression into a flat matcher
+    (callable Path->bool; match_key() for precomputed keys).
+    """
+    tokens = _tokenize_k(expr)
+    if not tokens:
+        return KMatcher(expr, (), ())
+
+    needles: List[str] = []
+    program: List[int] = []
     pos = 0
 
     def peek():
@@ -75,65 +117,45 @@ def compile_k(expr: str) -> Callable[[Path], bool]:
         return tok
 
     def parse_or():
-        node = parse_and()
-        while True:
-            t = peek()
-            if t == "or":
-                get()
-                rhs = parse_and()
-                lhs = node
-                node = _combine_or(lhs, rhs)
-            else:
-                break
-        return node
+        parse_and()
+        while peek() == "or":
+            get()
+            parse_and()
+            program.append(_OP_OR)
 
     def parse_and():
-        node = parse_not()
-        while True:
-            t = peek()
-            if t == "and":
-                get()
-                rhs = parse_not()
-                lhs = node
-                node = _combine_and(lhs, rhs)
-            else:
-                break
-        return node
+        parse_not()
+        while peek() == "and":
+            get()
+            parse_not()
+            program.append(_OP_AND)
 
     def parse_not():
-        t = peek()
-        if t == "not":
+        if peek() == "not":
             get()
-            sub = parse_not()
-            return _negate(sub)
-        return parse_term()
+            parse_not()
+            program.append(_OP_NOT)
+            return
+        parse_term()
 
     def parse_term():
-        t = peek()
-        if t == "(":
+        if peek() == "(":
             get()
-            node = parse_or()
+            parse_or()
             if peek() != ")":
                 raise ValueError("Unbalanced parentheses in -k expression")
             get()  # consume ')'
-            return node
-        raw = get()
-        tok = _strip_quotes(raw).lower()
-
-        def pred(path_obj: Path) -> bool:
-            s = path_obj.as_posix().lower()
-            n = path_obj.name.lower()
-            return tok in s or tok in n
-
-        return pred
+            return
+        tok = _strip_quotes(get()).lower()
+        if tok not in needles:
+            needles.append(tok)
+        program.append(needles.index(tok))
 
     try:
-        tree = parse_or()
+        parse_or()
         if pos != len(tokens):
             raise ValueError("Unexpected tokens at end of -k expression")
-        return tree
+        return KMatcher(expr, needles, program)
     except Exception:
-        needle = (expr or "").lower()
-        return lambda p: (
-            needle in p.as_posix().lower() or needle in p.name.lower()
-        )
+        # Legacy fallback: the whole expression as one substring
+        return KMatcher(expr, ((expr or "").lower(),), (0,))
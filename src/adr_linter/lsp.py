@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/lsp.py
+
+"""
+`theseus lsp` — minimal Language Server Protocol server over stdio.
+
+Speaks JSON-RPC 2.0 with Content-Length framing (stdlib only, no LSP
+framework dependency). Supported:
+
+ - initialize / initialized / shutdown / exit
+ - textDocument/didOpen, didChange (full sync), didSave, didClose
+ - textDocument/publishDiagnostics (server → client)
+
+State lives in a services.session.LintSession: the workspace index and
+link graph are built once at `initialize`; each change re-parses only the
+edited buffer and re-runs the affected rules for it and its graph
+neighbours, then publishes diagnostics with file line numbers.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+from urllib.parse import unquote, urlparse
+from urllib.request import pathname2url
+
+from .services.session import LintSession, doc_key, split_location
+
+# LSP DiagnosticSeverity
+_SEVERITY = {"E": 1, "W": 2, "I": 3}
+_SYNC_FULL = 1
+# JSON-RPC internal error; LSP MessageType.Error for window/logMessage
+_INTERNAL_ERROR = -32603
+_LOG_ERROR = 1
+
+
+def uri_to_path(uri: str) -> Path:
+    parsed = urlparse(uri)
+    return Path(unquote(parsed.path))
+
+
+def path_to_uri(path: str) -> str:
+    return "file://" + pathname2url(path)
+
+
+def read_message(rfile: BinaryIO) -> Optional[Dict[str, Any]]:
+    """
+    Read one framed JSON-RPC message; None on EOF.
+    """
+    length = None
+    while True:
+        line = rfile.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            length = int(value.strip())
+    if length is None:
+        return None
+    return json.loads(rfile.read(length).decode("utf-8"))
+
+
+def write_message(wfile: BinaryIO, payload: Dict[str, Any]) -> None:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    wfile.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+    wfile.write(body)
+    wfile.flush()
+
+
+class LspServer:
+    """
+    Dispatch loop. `session_factory(root)` builds the warm LintSession.
+    """
+
+    def __init__(
+        self, rfile: BinaryIO, wfile: BinaryIO, session_factory=LintSession
+    ):
+        self.rfile = rfile
+        self.wfile = wfile
+        self.session_factory = session_factory
+        self.session: Optional[LintSession] = None
+        # Session key -> the URI the client opened it under (symlinked
+        # roots resolve to another path)
+        self._uris: Dict[str, str] = {}
+        self._shutdown = False
+
+    # ---- Plumbing ----------------------------------------------------------
+
+    def _respond(self, msg_id, result=None, error=None) -> None:
+        payload: Dict[str, Any] = {"jsonrpc": "2.0", "id": msg_id}
+        if error is not None:
+            payload["error"] = error
+        else:
+            payload["result"] = result
+        write_message(self.wfile, payload)
+
+    def _notify(self, method: str, params: Dict[str, Any]) -> None:
+        write_message(
+            self.wfile, {"jsonrpc": "2.0", "method": method, "params": params}
+        )
+
+    def _publish(self, path: str) -> None:
+        diagnostics = []
+        for f in self.session.findings(path):
+            _loc, line = split_location(f.location)
+            row = (line - 1) if line else 0
+            diagnostics.append(
+                {
+                    "range": {
+                        "start": {"line": row, "character": 0},
+                        "end": {"line": row, "character": 0},
+                    },
+                    "severity": _SEVERITY.get(f.severity, 3),
+                    "code": f.code,
+                    "source": "theseus",
+                    "message": f.message,
+                }
+            )
+        self._notify(
+            "textDocument/publishDiagnostics",
+            {
+                "uri": self._uris.get(path) or path_to_uri(path),
+                "diagnostics": diagnostics,
+            },
+        )
+
+    def _apply(self, uri: str, text: Optional[str]) -> None:
+        path = uri_to_path(uri)
+        self._uris[doc_key(path)] = uri
+        for key in sorted(self.session.update(path, text)):
+            self._publish(key)
+
+    # ---- Handlers ----------------------------------------------------------
+
+    def _initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        root_uri = params.get("rootUri")
+        root = uri_to_path(root_uri) if root_uri else Path(".")
+        self.session = self.session_factory(root)
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": _SYNC_FULL,
+                    "save": {"includeText": False},
+                }
+            },
+            "serverInfo": {"name": "theseus"},
+        }
+
+    def _did_open(self, params: Dict[str, Any]) -> None:
+        doc = params["textDocument"]
+        self._apply(doc["uri"], doc["text"])
+
+    def _did_change(self, params: Dict[str, Any]) -> None:
+        changes = params.get("contentChanges") or []
+        if changes:
+            # Full sync: the last change carries the whole buffer
+            self._apply(params["textDocument"]["uri"], changes[-1]["text"])
+
+    def _did_close(self, params: Dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        path = uri_to_path(uri)
+        self.session.forget(path)
+        self._uris.pop(doc_key(path), None)
+        self._notify(
+            "textDocument/publishDiagnostics",
+            {"uri": uri, "diagnostics": []},
+        )
+
+    # ---- Loop --------------------------------------------------------------
+
+    def handle(self, msg: Dict[str, Any]) -> bool:
+        """
+        Handle one message; False once the client sent `exit`.
+
+        A handler that raises (e.g. a rule tripping over a half-edited
+        buffer) never ends the server: requests get a JSON-RPC internal
+        error, notifications a window/logMessage with the traceback.
+        """
+        try:
+            return self._dispatch(msg)
+        except Exception as e:
+            msg_id = msg.get("id")
+            if msg_id is not None:
+                self._respond(
+                    msg_id,
+                    error={"code": _INTERNAL_ERROR, "message": repr(e)},
+                )
+            else:
+                self._notify(
+                    "window/logMessage",
+                    {
+                        "type": _LOG_ERROR,
+                        "message": f"theseus: {msg.get('method')} failed\n"
+                        + traceback.format_exc(),
+                    },
+                )
+            return True
+
+    def _dispatch(self, msg: Dict[str, Any]) -> bool:
+        method = msg.get("method")
+        params = msg.get("params") or {}
+        msg_id = msg.get("id")
+
+        if method == "exit":
+            return False
+        if method == "initialize":
+            self._respond(msg_id, self._initialize(params))
+        elif method == "shutdown":
+            self._shutdown = True
+            self._respond(msg_id, None)
+        elif self.session is None:
+            if msg_id is not None:
+                self._respond(
+                    msg_id,
+                    error={"code": -32002, "message": "not initialized"},
+                )
+        elif method == "textDocument/didOpen":
+            self._did_open(params)
+        elif method == "textDocument/didChange":
+            self._did_change(params)
+        elif method == "textDocument/didClose":
+            self._did_close(params)
+        elif msg_id is not None:
+            # didSave / initialized and unknown notifications are no-ops
+            self._respond(
+                msg_id,
+                error={"code": -32601, "message": f"unknown: {method}"},
+            )
+        return True
+
+    def serve(self) -> int:
+        while True:
+            msg = read_message(self.rfile)
+            if msg is None or not self.handle(msg):
+                break
+        return 0 if self._shutdown else 1
+
+
+def main(argv=None) -> int:
+    return LspServer(sys.stdin.buffer, sys.stdout.buffer).serve()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/merge.py
+
+"""
+`theseus merge` — combine `--shard i/N` artifacts into one lint result.
+
+Each shard ran the per-file rules that need no other document. Merge
+rebuilds the index from every shard's projection (services.shard), runs
+the cross-file per-file rules (LINK-300/302/304/305, DELTA-300) for each
+document and the post-run graph rules, then prints the combined report
+and returns the exit code a single-node `theseus` run would return.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .models import ValidationData
+from .parser.structure import ProjectedEntry
+from .report import Findings
+from .services.linkgraph import build_link_graph
+from .services.shard import read_artifacts
+from .validators.registry import manifest_codes_cross_file, post_run, run_all
+
+
+def merge(artifacts: Iterable[Path]) -> Findings:
+    """
+    Findings of the whole partition (raises ValueError on an incomplete
+    or inconsistent set of artifacts).
+    """
+    findings, documents = read_artifacts(artifacts)
+    documents.sort(key=lambda e: e.path)
+
+    # Same precedence as a single-node index build over sorted files
+    idx: Dict[str, ProjectedEntry] = {}
+    for entry in documents:
+        if entry.meta.get("id"):
+            idx[entry.meta["id"]] = entry
+    link_graph = build_link_graph(idx)
+
+    rpt = Findings()
+    rpt.items.extend(findings)
+    codes = manifest_codes_cross_file()
+    for entry in documents:
+        ctx = ValidationData(
+            meta=entry.meta,
+            body="",
+            path=entry.path,
+            section_data=entry.section_data,
+            all_idx=idx,
+            link_graph=link_graph,
+        )
+        run_all(ctx, rpt, codes)
+    post_run(idx, rpt, link_graph)
+    return rpt
+
+
+def merge_main(argv: List[str]) -> int:
+    """
+    `theseus merge [--fail-on E|W|I] ARTIFACT...`.
+    """
+    parser = argparse.ArgumentParser(prog="theseus merge")
+    parser.add_argument("artifacts", nargs="+", type=Path)
+    parser.add_argument("--fail-on", default="E", choices=["E", "W", "I"])
+    args = parser.parse_args(argv)
+
+    try:
+        rpt = merge(args.artifacts)
+    except (OSError, ValueError) as e:
+        print(f"theseus merge: {e}", file=sys.stderr)
+        return 2
+    rpt.print()
+    return rpt.exit_code(args.fail_on)
@@ -7,9 +7,13 @@ Core data models used across the ADR linter (shared, importable).
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .services.linkgraph import LinkGraph
+    from .services.pins import PinResolver
 
 
 @dataclass
@@ -26,14 +30,21 @@ class SectionData:
     llm_tail: Optional[Dict]
     # byte offsets in body where RFC scan should be skipped
     exclusion_ranges: List[Tuple[int, int]]
-    # key -> raw content of that section (post-marker)
-    sections_by_key: Dict[str, str]
+    # key -> raw content of that section (post-marker); read-only view
+    sections_by_key: Mapping[str, str]
     # Enhanced fields for governance validation
     alias_hits: Dict[str, str]  # alias_heading -> canonical_key
     class_hint: Optional[str]  # ADR class from front-matter
+    # Raw artifacts so validators never re-scan the body
+    # key -> (start, end) body offsets of sections_by_key[key]
+    section_spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # markdown header text -> line numbers (ADR-SCHEMA-003 header checks)
+    heading_index: Dict[str, List[int]] = field(default_factory=dict)
+    # {"raw", "data", "error", "span"} for the llm_tail json fence, or None
+    llm_tail_block: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationData:
     """
     Context handed to validators (single unit of review).
@@ -45,3 +56,8 @@ class ValidationData:
     section_data: SectionData
     # Index for cross-file validation
     all_idx: Dict
+    # Shared relationship graph over all_idx (built once per run by the
+    # engine; see services.linkgraph.link_graph_for for the lazy fallback)
+    link_graph: Optional["LinkGraph"] = None
+    # Git pin lookups for ADR-LINK-306 (engine --verify-pins; else None)
+    pins: Optional["PinResolver"] = None
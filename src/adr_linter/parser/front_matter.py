@@ -3,9 +3,11 @@
 # src/adr_linter/parser/front_matter.py
 
 from __future__ import annotations
-import re
 from typing import Tuple, Dict
 
+from ..constants import FRONT_MATTER_RX
+from ..tracing import span
+
 try:
     import yaml  # type: ignore
 except Exception:
@@ -25,13 +27,7 @@ def parse_front_matter(text: str) -> Tuple[Dict, int]:
         text = text[1:]
     normalized = text.replace("\r\n", "\n")
 
-    m = re.search(
-        r"^\s*---\s*\n"  # opening fence
-        r"(.*?)"  # YAML payload
-        r"\n---\s*(?:\n|$)",  # closing fence, allow EOF
-        normalized,
-        flags=re.S | re.M,
-    )
+    m = FRONT_MATTER_RX.search(normalized)
     if not m:
         return {}, 0
 
@@ -49,14 +45,15 @@ def parse_front_matter(text: str) -> Tuple[Dict, int]:
         return result
 
     meta = {}
-    if yaml:
-        try:
-            data = yaml.safe_load(fm)
-            meta = data if isinstance(data, dict) else _kv_fallback(fm)
-        except Exception:
+    with span("front_matter", "parse"):
+        if yaml:
+            try:
+                data = yaml.safe_load(fm)
+                meta = data if isinstance(data, dict) else _kv_fallback(fm)
+            except Exception:
+                meta = _kv_fallback(fm)
+        else:
             meta = _kv_fallback(fm)
-    else:
-        meta = _kv_fallback(fm)
 
     # Map the normalized match back to original text to get end index
     block_norm = normalized[m.start() : m.end()]
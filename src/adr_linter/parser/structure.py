@@ -5,8 +5,11 @@
 from __future__ import annotations
 import json
 import re
+from bisect import bisect_right
+from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple, Optional
 
 from .front_matter import parse_front_matter
 
@@ -16,9 +19,13 @@ except Exception:
     yaml = None
 
 from ..models import SectionData
+from ..tracing import span
 from ..constants import (
+    ALL_RELATIONSHIP_FIELDS,
     HEADING_ALIASES,
+    MARKDOWN_HEADING_RX,
     get_canonical_keys,
+    index_headings,
 )
 
 
@@ -41,134 +48,307 @@ def _line_from_pos(text: str, pos: int) -> int:
     return text.count("\n", 0, pos) + 1
 
 
-def parse_document_structure(
-    body: str, *, class_hint: Optional[str] = None
-) -> SectionData:
-    """
-    Single-pass extraction of document structure with enhanced parser contract.
+# -----------------------------------------------------------------------------
+# Per-artifact scanners (each is one pass over the body)
+# -----------------------------------------------------------------------------
 
-    Args:
-        body: ADR document body (after front-matter)
-        class_hint: ADR class from front-matter to help with governance parsing
+_KEY_MARKER_RX = re.compile(
+    r"<!--\s*key:\s*([a-z0-9_]+(?:\.[a-z0-9_]+)?)\s*-->"
+)
+_YAML_BLOCK_RX = re.compile(r"```yaml\n(.*?)\n```", re.S | re.I)
+_LLM_TAIL_RX = re.compile(
+    r"<!--\s*llm_tail:begin\s*-->"
+    r".*?```json\r?\n"
+    r"(?P<json>.*?)\r?\n"
+    r"```"
+    r".*?<!--\s*llm_tail:end\s*-->",
+    re.DOTALL,
+)
+# Lenient form used for ADR-META-202 diagnostics: the fence does not need
+# its own lines, so empty or one-line blocks are still reported.
+_LLM_TAIL_BLOCK_RX = re.compile(
+    r"<!--\s*llm_tail:begin\s*-->"
+    r".*?```json\s*"
+    r"(?P<json>.*?)"
+    r"\s*```"
+    r".*?<!--\s*llm_tail:end\s*-->",
+    re.DOTALL,
+)
+# Exclusions for RFC-2119 scanning, in the historical emission order:
+# fenced code, inline code, URLs, HTML comments, blockquotes (ADR-0001 §11)
+_EXCLUSION_RXS = (
+    re.compile(r"```.*?```", re.S),
+    re.compile(r"`[^`]*`"),
+    re.compile(r"https?://[^\s\])<>\"']+"),
+    re.compile(r"<!--.*?-->", re.S),
+    re.compile(r"^[ \t]*>.*$", re.M),
+)
 
-    Returns:
-        SectionData with enhanced metadata for governance validation
-    """
-    # Key markers (primary section detection)
-    key_markers: List[Tuple[str, int, int]] = []
-    for m in re.finditer(
-        r"<!--\s*key:\s*([a-z0-9_]+(?:\.[a-z0-9_]+)?)\s*-->", body
-    ):
-        key = m.group(1)
-        start = m.start()
-        key_markers.append((key, start, _line_from_pos(body, start)))
 
-    # Headings (fallback section detection)
-    headings: List[Tuple[str, int, int, int]] = []
-    alias_hits: Dict[str, str] = {}
+def _line_starts(body: str) -> List[int]:
+    starts = [0]
+    pos = body.find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = body.find("\n", pos + 1)
+    return starts
 
-    for m in re.finditer(r"^(#{1,6})\s+([^\n#]+?)\s*$", body, flags=re.M):
-        level = len(m.group(1))
-        text = m.group(2).strip()
+
+def _scan_key_marker_spans(body: str) -> List[Tuple[str, int, int]]:
+    # (key, marker_start, marker_end)
+    return [
+        (m.group(1), m.start(), m.end())
+        for m in _KEY_MARKER_RX.finditer(body)
+    ]
+
+
+def _scan_headings(body: str, line_of) -> List[Tuple[str, int, int, int]]:
+    headings: List[Tuple[str, int, int, int]] = []
+    for m in MARKDOWN_HEADING_RX.finditer(body):
         start = m.start()
-        headings.append((text, level, start, _line_from_pos(body, start)))
-
-        # Check for heading aliases
-        canonical_key = map_heading_to_key(text)
-        if canonical_key:
-            alias_hits[text] = canonical_key
-
-    # Duplicate section detection
-    # HACK: Commented out call for now because the parser should be doing
-    #       nothing like raising ValueError and hard exits.  That should be
-    #       more of a CLI or Engine boundary.  It should also not be handling
-    #       clear validation issues like malformed or duplicated ADR sections.
-    #       That is a clear validator boundary.
-    # _detect_duplicate_sections(key_markers, alias_hits)
-
-    # Enhanced YAML blocks with metadata
+        headings.append((m.group(2), len(m.group(1)), start, line_of(start)))
+    return headings
+
+
+def _scan_yaml_blocks(body: str, class_hint: Optional[str]) -> List[Dict]:
     yaml_blocks: List[Dict] = []
-    for m in re.finditer(r"```yaml\n(.*?)\n```", body, flags=re.S | re.I):
+    if not yaml:
+        return yaml_blocks
+    for m in _YAML_BLOCK_RX.finditer(body):
         y = m.group(1)
         start, end = m.span()
-
-        if yaml:
-            try:
-                data = yaml.safe_load(y)
-                if isinstance(data, dict):
-                    # Determine YAML block kind for governance validation
-                    kind = _classify_yaml_block(data, class_hint)
-                    yaml_blocks.append(
-                        {"kind": kind, "data": data, "span": (start, end)}
-                    )
-            except Exception:
-                # Malformed YAML - include for error reporting
+        try:
+            data = yaml.safe_load(y)
+            if isinstance(data, dict):
+                # Determine YAML block kind for governance validation
+                kind = _classify_yaml_block(data, class_hint)
                 yaml_blocks.append(
                     {
-                        "kind": "malformed",
-                        "data": None,
+                        "kind": kind,
+                        "data": data,
                         "span": (start, end),
                         "raw": y,
                     }
                 )
+        except Exception as e:
+            # Malformed YAML - include for error reporting
+            yaml_blocks.append(
+                {
+                    "kind": "malformed",
+                    "data": None,
+                    "span": (start, end),
+                    "raw": y,
+                    "error": str(e),
+                }
+            )
+    return yaml_blocks
 
-    # LLM tail (prefer last)
-    llm_tail: Optional[Dict] = None
-    llm_tail_re = re.compile(
-        r"<!--\s*llm_tail:begin\s*-->"
-        r".*?```json\r?\n"
-        r"(?P<json>.*?)\r?\n"
-        r"```"
-        r".*?<!--\s*llm_tail:end\s*-->",
-        re.DOTALL,
-    )
-    matches = list(llm_tail_re.finditer(body))
-    if matches:
-        m = matches[-1]
+
+def _scan_llm_tail(body: str) -> Optional[Dict]:
+    # Prefer the last tail block in the document
+    last = None
+    for last in _LLM_TAIL_RX.finditer(body):
+        pass
+    if last is None:
+        return None
+    try:
+        return json.loads(last.group("json"))
+    except Exception:
+        return None
+
+
+def _scan_llm_tail_block(body: str) -> Optional[Dict]:
+    """
+    First llm_tail json fence as written: raw text (trimmed), parsed data,
+    and the JSON error when it does not parse. None when there is no block.
+    """
+    m = _LLM_TAIL_BLOCK_RX.search(body)
+    if not m:
+        return None
+    raw = m.group("json").strip()
+    block: Dict[str, Any] = {
+        "raw": raw,
+        "data": None,
+        "error": None,
+        "span": m.span(),
+    }
+    if raw:
         try:
-            llm_tail = json.loads(m.group("json"))
-        except Exception:
-            llm_tail = None
-
-    # Exclusions for RFC-2119 scanning
-    exclusion_ranges: List[Tuple[int, int]] = []
-    # Fenced code
-    for m in re.finditer(r"```.*?```", body, flags=re.S):
-        exclusion_ranges.append((m.start(), m.end()))
-    # Inline code
-    for m in re.finditer(r"`[^`]*`", body):
-        exclusion_ranges.append((m.start(), m.end()))
-    # URLs
-    for m in re.finditer(r"https?://[^\s\])<>\"']+", body):
-        exclusion_ranges.append((m.start(), m.end()))
-    # HTML comments
-    for m in re.finditer(r"<!--.*?-->", body, flags=re.S):
-        exclusion_ranges.append((m.start(), m.end()))
-    # Blockquotes (ADR-0001 §11 exemption)
-    for m in re.finditer(r"^[ \t]*>.*$", body, flags=re.M):
-        exclusion_ranges.append((m.start(), m.end()))
-
-    # Sections by key
-    sections_by_key: Dict[str, str] = {}
-    parts = re.split(
-        r"<!--\s*key:\s*([a-z0-9_]+(?:\.[a-z0-9_]+)?)\s*-->", body
-    )
-    for i in range(1, len(parts), 2):
-        key = parts[i]
-        content = parts[i + 1] if i + 1 < len(parts) else ""
-        sections_by_key[key] = content
-
-    return SectionData(
-        key_markers=key_markers,
-        headings=headings,
-        yaml_blocks=yaml_blocks,
-        llm_tail=llm_tail,
-        exclusion_ranges=exclusion_ranges,
-        sections_by_key=sections_by_key,
-        # Enhanced fields (need to update SectionInfo model)
-        alias_hits=alias_hits,
-        class_hint=class_hint,
-    )
+            block["data"] = json.loads(raw)
+        except Exception as e:
+            block["error"] = e
+    return block
+
+
+def _scan_exclusion_ranges(body: str) -> List[Tuple[int, int]]:
+    return [
+        (m.start(), m.end())
+        for rx in _EXCLUSION_RXS
+        for m in rx.finditer(body)
+    ]
+
+
+def _section_spans(
+    markers: List[Tuple[str, int, int]], body_len: int
+) -> Dict[str, Tuple[int, int]]:
+    # Content runs from the end of a marker to the next marker; a repeated
+    # key keeps its last occurrence (same as sections_by_key).
+    spans: Dict[str, Tuple[int, int]] = {}
+    for i, (key, _start, end) in enumerate(markers):
+        stop = markers[i + 1][1] if i + 1 < len(markers) else body_len
+        spans[key] = (end, stop)
+    return spans
+
+
+class SectionTexts(Mapping):
+    """
+    Read-only key -> section text view over the source text.
+
+    Holds the section spans only; each lookup slices the text, so no copy
+    of a section outlives the rule that reads it.
+    """
+
+    __slots__ = ("_source", "_offset", "_spans")
+
+    def __init__(
+        self, source: str, offset: int, spans: Dict[str, Tuple[int, int]]
+    ):
+        self._source = source
+        self._offset = offset
+        self._spans = spans
+
+    def __getitem__(self, key: str) -> str:
+        start, end = self._spans[key]
+        return self._source[self._offset + start : self._offset + end]
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key) -> bool:
+        return key in self._spans
+
+
+class LazySectionData(SectionData):
+    """
+    SectionData whose artifacts are computed on first attribute access and
+    memoized (functools.cached_property stores into the instance dict).
+
+    Same attribute API as SectionData; a document only pays for the
+    artifacts its applicable rules actually read (e.g. style-guide ADRs
+    never build exclusion ranges or YAML blocks).
+
+    `source[offset:]` is the body: index entries pass their raw text and
+    body offset instead of a second copy of the body. Positions in every
+    artifact are body-relative either way.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        class_hint: Optional[str] = None,
+        *,
+        offset: int = 0,
+    ):
+        self._source = source
+        self._offset = offset
+        self.class_hint = class_hint
+
+    @property
+    def _body(self) -> str:
+        # Sliced per artifact scan; only the source text is retained
+        return self._source[self._offset :] if self._offset else self._source
+
+    @cached_property
+    def _line_index(self) -> List[int]:
+        return _line_starts(self._body)
+
+    def _line_of(self, pos: int) -> int:
+        return bisect_right(self._line_index, pos)
+
+    @cached_property
+    def _marker_spans(self) -> List[Tuple[str, int, int]]:
+        with span("key_markers", "parse"):
+            return _scan_key_marker_spans(self._body)
+
+    @cached_property
+    def key_markers(self) -> List[Tuple[str, int, int]]:
+        return [
+            (key, start, self._line_of(start))
+            for key, start, _end in self._marker_spans
+        ]
+
+    @cached_property
+    def headings(self) -> List[Tuple[str, int, int, int]]:
+        with span("headings", "parse"):
+            return _scan_headings(self._body, self._line_of)
+
+    @cached_property
+    def alias_hits(self) -> Dict[str, str]:
+        alias_hits: Dict[str, str] = {}
+        for text, _lvl, _pos, _ln in self.headings:
+            canonical_key = map_heading_to_key(text)
+            if canonical_key:
+                alias_hits[text] = canonical_key
+        return alias_hits
+
+    @cached_property
+    def yaml_blocks(self) -> List[Dict]:
+        with span("yaml_blocks", "parse"):
+            return _scan_yaml_blocks(self._body, self.class_hint)
+
+    @cached_property
+    def llm_tail(self) -> Optional[Dict]:
+        return _scan_llm_tail(self._body)
+
+    @cached_property
+    def llm_tail_block(self) -> Optional[Dict]:
+        return _scan_llm_tail_block(self._body)
+
+    @cached_property
+    def exclusion_ranges(self) -> List[Tuple[int, int]]:
+        return _scan_exclusion_ranges(self._body)
+
+    @cached_property
+    def section_spans(self) -> Dict[str, Tuple[int, int]]:
+        return _section_spans(self._marker_spans, len(self._body))
+
+    @cached_property
+    def sections_by_key(self) -> Mapping:
+        return SectionTexts(self._source, self._offset, self.section_spans)
+
+    @cached_property
+    def heading_index(self) -> Dict[str, List[int]]:
+        # Derived from the headings scan; no second pass over the body
+        return index_headings(self.headings)
+
+
+def parse_document_structure(
+    body: str, *, class_hint: Optional[str] = None
+) -> SectionData:
+    """
+    Extraction of document structure with enhanced parser contract.
+
+    Artifacts (key markers, headings, YAML blocks, llm_tail, exclusion
+    ranges, section splits/spans, heading aliases, header index) are
+    computed lazily on first access; see LazySectionData.
+
+    Duplicate section detection is intentionally not done here.
+    HACK: `_detect_duplicate_sections` stays uncalled because the parser
+          should not raise ValueError or hard exit; that is a CLI/Engine
+          boundary, and malformed or duplicated ADR sections are a clear
+          validator boundary.
+
+    Args:
+        body: ADR document body (after front-matter)
+        class_hint: ADR class from front-matter to help with governance parsing
+
+    Returns:
+        SectionData with enhanced metadata for governance validation
+    """
+    return LazySectionData(body, class_hint)
 
 
 def _detect_duplicate_sections(
@@ -262,30 +442,166 @@ def expected_keys_for(
 # -----------------------------------------------------------------------------
 
 
+class IndexEntry(Mapping):
+    """
+    One index entry with the document's raw text stored once.
+
+    Reads like the legacy entry dict ({"path", "meta", "body", "raw",
+    "section_data"}): `body` is sliced from `raw` at `body_start` on
+    access and `section_data` is a LazySectionData over `raw`, built on
+    first access, so neither keeps a second copy of the body.
+    """
+
+    __slots__ = ("path", "meta", "_raw", "body_start", "_section_data")
+    _KEYS = ("path", "meta", "body", "raw", "section_data")
+
+    def __init__(
+        self, path: Path, meta: Dict, raw: Optional[str], body_start: int
+    ):
+        self.path = path
+        self.meta = meta
+        self._raw = raw
+        self.body_start = body_start
+        self._section_data: Optional[SectionData] = None
+
+    @property
+    def raw(self) -> str:
+        return self._raw
+
+    @property
+    def body(self) -> str:
+        return self.raw[self.body_start :]
+
+    @property
+    def section_data(self) -> SectionData:
+        if self._section_data is None:
+            self._section_data = LazySectionData(
+                self.raw, self.meta.get("class"), offset=self.body_start
+            )
+        return self._section_data
+
+    def __getitem__(self, key: str):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IndexEntry):
+            # raw before body_start: header-only entries load on raw
+            return (self.path, self.meta, self.raw, self.body_start) == (
+                other.path,
+                other.meta,
+                other.raw,
+                other.body_start,
+            )
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        adr_id = self.meta.get("id")
+        return f"{type(self).__name__}({self.path!r}, id={adr_id!r})"
+
+
+# Front-matter fields other documents' rules read: graph edges, post-run
+# class gating and LINK-322 fork rationale
+_PROJECTED_META = frozenset(
+    {"id", "class", "change_history"} | ALL_RELATIONSHIP_FIELDS
+)
+
+
+# Own YAML blocks cross-file rules read (LINK-302/304 ptr, DELTA-300)
+_PROJECTED_BLOCKS = ("ptr", "overrides")
+
+
+class SectionProjection(NamedTuple):
+    """
+    The part of SectionData cross-file rules read: key markers (`extends`
+    section keys), headings (LINK-302 fallback) and the document's own
+    ptr / overrides YAML blocks as {"kind", "data"}.
+    """
+
+    key_markers: Tuple[Tuple[str, int, int], ...]
+    headings: Tuple[Tuple[str, int, int, int], ...]
+    yaml_blocks: Tuple[Dict, ...] = ()
+
+
+class ProjectedEntry(Mapping):
+    """
+    Slim index entry for streaming / sharded runs: path, link-relevant
+    front matter and a SectionProjection. No body or raw text is retained.
+    """
+
+    __slots__ = ("path", "meta", "section_data")
+    _KEYS = ("path", "meta", "section_data")
+
+    def __init__(self, path: Path, meta: Dict, section_data):
+        self.path = path
+        self.meta = meta
+        self.section_data = section_data
+
+    def __getitem__(self, key: str):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+def project_document(path: Path, text: str) -> ProjectedEntry:
+    """
+    Pure: reduce one document to its ProjectedEntry (with or without id).
+    """
+    meta, end = parse_front_matter(text)
+    sd = LazySectionData(text, meta.get("class"), offset=end)
+    return ProjectedEntry(
+        path,
+        {k: v for k, v in meta.items() if k in _PROJECTED_META},
+        SectionProjection(
+            tuple(sd.key_markers),
+            tuple(sd.headings),
+            tuple(
+                {"kind": blk["kind"], "data": blk["data"]}
+                for blk in sd.yaml_blocks
+                if blk["kind"] in _PROJECTED_BLOCKS
+            ),
+        ),
+    )
+
+
+def project_entry(path: Path, text: str) -> Optional[ProjectedEntry]:
+    """
+    Index form of project_document(): None for documents without an id.
+    """
+    entry = project_document(path, text)
+    return entry if entry.meta.get("id") else None
+
+
 def build_index_from_texts(
     pairs: Iterable[Tuple[Path, str]],
-) -> Dict[str, Dict[str, Any]]:
+) -> Dict[str, IndexEntry]:
     """
     Pure index builder: given (path, raw text) pairs, parse front-matter and
-    structure and return the same index shape legacy/io.build_index produces.
+    return id -> IndexEntry (same keys legacy/io.build_index produced).
 
-    Updated to pass class hint to parser for enhanced governance support.
+    Structure is parsed lazily with the class hint from front-matter for
+    enhanced governance support.
     """
-    idx: Dict[str, Dict[str, Any]] = {}
+    idx: Dict[str, IndexEntry] = {}
     for p, text in pairs:
         meta, end = parse_front_matter(text)
-        body = text[end:]
-        class_hint = meta.get("class")
-        section_data = parse_document_structure(body, class_hint=class_hint)
-
         if meta.get("id"):
-            idx[meta["id"]] = {
-                "path": p,
-                "meta": meta,
-                "body": body,
-                "raw": text,
-                "section_data": section_data,
-            }
+            idx[meta["id"]] = IndexEntry(p, meta, text, end)
     return idx
 
 
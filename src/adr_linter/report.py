@@ -11,9 +11,21 @@ legacy.Report.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, NamedTuple, Optional
 
-from .constants import CODES, SEVERITY_LEVELS_REV
+from .constants import CODES, SEVERITY_LEVELS, SEVERITY_LEVELS_REV
+
+
+class Finding(NamedTuple):
+    """
+    One reported item. Still a plain 4-tuple for existing unpacking code:
+    (severity, code, location, message), location being "path[:line]".
+    """
+
+    severity: str
+    code: str
+    location: str
+    message: str
 
 
 class Report:
@@ -38,7 +50,7 @@ class Report:
         location = f"{path.as_posix()}"
         if line_num:
             location += f":{line_num}"
-        self.items.append((sev, code, location, msg))
+        self.items.append(Finding(sev, code, location, msg))
 
     def has_errors(self):
         return any(sev == "E" for sev, _, _, _ in self.items)
@@ -93,3 +105,26 @@ class Report:
             for sev, code, location, msg in group:
                 print(f"report.py: [{sev}] {code}: {msg}")
             print()  # blank line between files
+
+
+class Findings(Report):
+    """
+    Report returned by the in-memory API (engine.lint). Same items and
+    has_* helpers; nothing is printed unless the caller asks for it.
+    """
+
+    def __iter__(self) -> Iterator[Finding]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def exit_code(self, fail_on: str = "E") -> int:
+        """
+        1 when any finding is at or above the fail_on severity, else 0.
+        """
+        threshold = SEVERITY_LEVELS[fail_on]
+        for sev, _, _, _ in self.items:
+            if SEVERITY_LEVELS.get(sev, 0) >= threshold:
+                return 1
+        return 0
@@ -7,29 +7,68 @@ ADR file discovery and index construction (impure I/O layer).
 
 Pure path:  parser.structure.build_index_from_texts(...)
 Impure path: load_files(...), build_index_from_files(...), read_text(...)
+Header tier: build_header_index(...) (front matter only, read up to the
+             closing fence; sections promoted on first access)
+Streaming:   build_projection_index(...) (link-relevant projection only;
+             memory bounded by the largest document, see engine.run)
+Warm path:   IndexCache.build(...) (stat-validated reuse across runs)
+Parallel:    build_index_parallel(...) (reader threads feed front-matter
+             parsing in worker processes; same index, explicit policy
+             for duplicate ids)
+Filtered:    discover(root, select) + LazyIndex (-k runs load the
+             selected files; other ADRs are parsed when a rule looks
+             them up, located through the file-name id_manifest)
 
 Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
 """
 
 from __future__ import annotations
+import fnmatch
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Iterable, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
 
-from ..constants import ADR_LOCATIONS
-from ..parser.structure import build_index_from_texts
+from ..constants import ADR_LOCATIONS, FILENAME_ID_RX, FRONT_MATTER_RX
+from ..filters import path_key
+from ..parser.front_matter import parse_front_matter
+from ..parser.structure import (
+    IndexEntry,
+    ProjectedEntry,
+    build_index_from_texts,
+    project_entry,
+)
+from ..tracing import span
+from .linkgraph import iter_link_edges
 
 
 # ------------------------- Impure helpers (IO) -------------------------
 
 
-def load_files(root: Path) -> List[Path]:
+def discover(
+    root: Path, select: Optional[Callable[[str], bool]] = None
+) -> Tuple[List[Path], List[Path]]:
     """
-    Discover ADR markdown files using ADR_LOCATIONS, skipping any files
-    in hidden directories (e.g., '.adr') relative to 'root'.
-    Behavior mirrors the prior io.load_files.
+    Walk ADR_LOCATIONS under root, skipping files in hidden directories
+    (e.g., '.adr'). `select` is applied during the walk to each file's
+    precomputed lowercase key (filters.path_key); returns (selected, rest),
+    both sorted.
     """
     seen: set[Path] = set()
-    files: list[Path] = []
+    selected: list[Path] = []
+    rest: list[Path] = []
 
     # TODO: If ADR_LOCATIONS do not exist in current file structure,
     #       fail now and raise exception
@@ -45,8 +84,56 @@ def load_files(root: Path) -> List[Path]:
             rp = p.resolve()
             if rp not in seen:
                 seen.add(rp)
-                files.append(p)
-    return sorted(files)
+                if select is None or select(path_key(p)):
+                    selected.append(p)
+                else:
+                    rest.append(p)
+    return sorted(selected), sorted(rest)
+
+
+def _match_parts(parts: Tuple[str, ...], pattern: Tuple[str, ...]) -> bool:
+    # Path.glob semantics: "**" spans zero or more directories
+    if not pattern:
+        return not parts
+    if pattern[0] == "**":
+        return any(
+            _match_parts(parts[i:], pattern[1:])
+            for i in range(len(parts) + 1)
+        )
+    return (
+        bool(parts)
+        and fnmatch.fnmatchcase(parts[0], pattern[0])
+        and _match_parts(parts[1:], pattern[1:])
+    )
+
+
+def in_adr_locations(root: Path, path: Path) -> bool:
+    """
+    Whether discover(root) would pick up `path`: under root, matching one
+    of ADR_LOCATIONS and not in a hidden directory.
+    """
+    try:
+        rel = path.relative_to(root)
+    except ValueError:
+        return False
+    if any(part.startswith(".") for part in rel.parts):
+        return False
+    return any(
+        _match_parts(rel.parts, tuple(pattern.split("/")))
+        for pattern in ADR_LOCATIONS
+    )
+
+
+def load_files(
+    root: Path, select: Optional[Callable[[str], bool]] = None
+) -> List[Path]:
+    """
+    Discover ADR markdown files using ADR_LOCATIONS, skipping any files
+    in hidden directories (e.g., '.adr') relative to 'root'.
+    Behavior mirrors the prior io.load_files; `select` (a key predicate
+    such as KMatcher.match_key) is pushed into the walk.
+    """
+    return discover(root, select)[0]
 
 
 def build_index_from_files(
@@ -65,8 +152,411 @@ def build_index_from_files(
     return build_index_from_texts(pairs)
 
 
+# ------------------------- Header-only tier -------------------------
+
+# First read size; doubles per read up to the cap (front matter is small,
+# a file without any is read to EOF in O(size) scans)
+_HEADER_CHUNK = 4096
+_HEADER_CHUNK_MAX = 65536
+
+
+def read_header(path: Path, *, encoding: str = "utf-8") -> str:
+    """
+    Read `path` only up to its closing front-matter fence.
+
+    Reads in bounded chunks and stops once FRONT_MATTER_RX matches with
+    the closing fence line complete, so parse_front_matter() on the
+    result yields the same meta as on the whole file. Files without front
+    matter are read to EOF.
+    """
+    parts: list[str] = []
+    size = _HEADER_CHUNK
+    with span("read", "io", path=path.as_posix()), path.open(
+        encoding=encoding
+    ) as fh:
+        while True:
+            chunk = fh.read(size)
+            if not chunk:
+                return "".join(parts)
+            parts.append(chunk)
+            text = "".join(parts)
+            m = FRONT_MATTER_RX.search(text)  # text mode: "\n" newlines
+            # "\n---" closes the payload; its line must end in the buffer
+            if m and text.find("\n", m.end(1) + 4) != -1:
+                return text
+            size = min(size * 2, _HEADER_CHUNK_MAX)
+
+
+class HeaderEntry(IndexEntry):
+    """
+    Metadata-only index entry: path and meta from read_header().
+
+    The raw text (and with it `body` and `section_data`) is read on first
+    access, so only rules that need a target's sections (LINK-302,
+    `extends` section keys) pay for reading and parsing the whole file.
+    """
+
+    __slots__ = ("_encoding",)
+
+    def __init__(self, path: Path, meta: Dict, *, encoding: str = "utf-8"):
+        super().__init__(path, meta, None, 0)
+        self._encoding = encoding
+
+    @property
+    def promoted(self) -> bool:
+        return self._raw is not None
+
+    @property
+    def raw(self) -> str:
+        if self._raw is None:
+            text = read_text(self.path, encoding=self._encoding)
+            self.body_start = parse_front_matter(text)[1]
+            self._raw = text
+        return self._raw
+
+
+def build_header_index(
+    files: Iterable[Path],
+    *,
+    encoding: str = "utf-8",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Metadata-only counterpart of build_index_from_files(): same ids and
+    meta, entries are HeaderEntry (text read on first access).
+    """
+    idx: Dict[str, Dict[str, Any]] = {}
+    for p in files:
+        meta, _end = parse_front_matter(read_header(p, encoding=encoding))
+        if meta.get("id"):
+            idx[meta["id"]] = HeaderEntry(p, meta, encoding=encoding)
+    return idx
+
+
+def build_projection_index(
+    files: Iterable[Path],
+    *,
+    encoding: str = "utf-8",
+) -> Dict[str, ProjectedEntry]:
+    """
+    Streaming phase 1: read each file once and keep only its projection
+    (parser.structure.project_entry); the text is dropped per file.
+    """
+    idx: Dict[str, ProjectedEntry] = {}
+    for p in files:
+        entry = project_entry(p, read_text(p, encoding=encoding))
+        if entry is not None:
+            idx[entry.meta["id"]] = entry
+    return idx
+
+
+# ------------------------- Parallel pipeline -------------------------
+
+# What an index keeps when two files declare the same id. "last" is what
+# every sequential builder does (later sorted path wins).
+DUPLICATE_ID_POLICIES = ("last", "first", "error")
+
+# Files per worker task; small enough that parsing starts while the
+# reader threads are still busy, large enough to amortize pickling
+_PARSE_CHUNK = 32
+
+
+def _parse_front_matters(texts: List[str]) -> List[Tuple[Dict, int]]:
+    # Worker-process side: only (meta, body offset) travel back
+    return [parse_front_matter(t) for t in texts]
+
+
+def _chunks(it: Iterable, size: int) -> Iterable[List]:
+    it = iter(it)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_ahead(
+    pool: ThreadPoolExecutor, read: Callable[[Path], str], files, ahead: int
+) -> Iterator[Tuple[Path, str]]:
+    # (path, text) in input order, at most `ahead` reads in flight
+    window: deque = deque()
+    for p in files:
+        window.append((p, pool.submit(read, p)))
+        if len(window) >= ahead:
+            p, fut = window.popleft()
+            yield p, fut.result()
+    while window:
+        p, fut = window.popleft()
+        yield p, fut.result()
+
+
+def _admit(idx: Dict, adr_id: str, entry, policy: str) -> None:
+    prev = idx.get(adr_id)
+    if prev is None or policy == "last":
+        idx[adr_id] = entry
+    elif policy == "error":
+        raise ValueError(
+            f"duplicate id {adr_id}: {prev['path'].as_posix()} and "
+            f"{entry['path'].as_posix()}"
+        )
+
+
+def build_index_parallel(
+    files: Iterable[Path],
+    *,
+    workers: Optional[int] = None,
+    encoding: str = "utf-8",
+    duplicates: str = "last",
+    header_only: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Pipelined index build: a thread pool reads files while a process pool
+    parses front matter of the chunks already read.
+
+    Results are consumed in input order, so the index is the same for any
+    worker count and completion order. `duplicates` sets the duplicate-id
+    policy (DUPLICATE_ID_POLICIES): "last" (default, as the sequential
+    builders), "first", or "error" (ValueError naming both paths).
+    header_only=True reads up to the closing fence and returns HeaderEntry
+    items like build_header_index(); otherwise entries equal
+    build_index_from_files(). Structure stays lazy in both tiers.
+
+    Workers are spawned (no fork of a threaded parent), so this pays off
+    on large corpora only; `workers` defaults to os.cpu_count().
+
+    Reads run at most one chunk ahead and at most 2 * workers chunks are
+    in flight, each admitted as soon as it is the oldest: in-flight texts
+    are bounded by the window, not the corpus. Header texts are dropped
+    once parsed (full-text entries keep theirs, as the sequential build).
+    """
+    if duplicates not in DUPLICATE_ID_POLICIES:
+        raise ValueError(f"unknown duplicate id policy: {duplicates!r}")
+    read = read_header if header_only else read_text
+    n = workers or os.cpu_count() or 1
+
+    def _read(p: Path) -> str:
+        return read(p, encoding=encoding)
+
+    idx: Dict[str, Dict[str, Any]] = {}
+
+    def _collect(chunk: List[Tuple[Path, str]], parsed) -> None:
+        for (p, text), (meta, end) in zip(chunk, parsed.result()):
+            if not meta.get("id"):
+                continue
+            if header_only:
+                entry = HeaderEntry(p, meta, encoding=encoding)
+            else:
+                entry = IndexEntry(p, meta, text, end)
+            _admit(idx, meta["id"], entry, duplicates)
+
+    ctx = multiprocessing.get_context("spawn")
+    with ThreadPoolExecutor() as io, ProcessPoolExecutor(
+        n, mp_context=ctx
+    ) as cpu:
+        # Each chunk is handed to a parser process as soon as its texts
+        # are in; results are admitted in input order
+        pending: deque = deque()
+        reads = _read_ahead(io, _read, files, _PARSE_CHUNK)
+        for chunk in _chunks(reads, _PARSE_CHUNK):
+            texts = [t for _, t in chunk]
+            pending.append((chunk, cpu.submit(_parse_front_matters, texts)))
+            if len(pending) >= 2 * n:
+                _collect(*pending.popleft())
+        while pending:
+            _collect(*pending.popleft())
+    return idx
+
+
+class IndexCache:
+    """
+    mtime-validated index for long-lived processes (`theseus daemon`).
+
+    Each file's index entries are kept with its (mtime_ns, size) stamp; a
+    rebuild re-reads and re-parses only files whose stamp changed and drops
+    files that disappeared. The result equals build_index_from_files().
+    """
+
+    def __init__(self, *, encoding: str = "utf-8"):
+        self.encoding = encoding
+        self._entries: Dict[Path, Tuple[Tuple[int, int], Dict]] = {}
+
+    def build(
+        self, files: Iterable[Path], *, evict: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Index `files`; with evict=False entries for other files are kept
+        (partial builds, e.g. LazyIndex loads).
+        """
+        idx: Dict[str, Dict[str, Any]] = {}
+        live: set[Path] = set()
+        for p in files:
+            st = p.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            hit = self._entries.get(p)
+            if hit is None or hit[0] != stamp:
+                text = p.read_text(encoding=self.encoding)
+                hit = (stamp, build_index_from_texts([(p, text)]))
+                self._entries[p] = hit
+            idx.update(hit[1])
+            live.add(p)
+        if evict:
+            for stale in set(self._entries) - live:
+                del self._entries[stale]
+        return idx
+
+
+def _linked_ids(idx: Dict[str, Dict[str, Any]], ids: Iterable[str]):
+    for adr_id in ids:
+        for edge in iter_link_edges(adr_id, idx[adr_id]["meta"]):
+            yield edge.target
+
+
+def id_manifest(
+    files: Iterable[Path],
+) -> Tuple[Dict[str, List[Path]], List[Path]]:
+    """
+    ID -> candidate paths from file names ("ADR-0001-style-guide.md").
+    Returns (manifest, unnamed): files whose name carries no ADR id land in
+    `unnamed`. Nothing is read; entries are checked against front matter
+    when loaded (LazyIndex).
+    """
+    manifest: Dict[str, List[Path]] = {}
+    unnamed: List[Path] = []
+    for p in files:
+        m = FILENAME_ID_RX.match(p.name)
+        if m:
+            manifest.setdefault(m.group(1), []).append(p)
+        else:
+            unnamed.append(p)
+    return manifest, unnamed
+
+
+class LazyIndex(dict):
+    """
+    Index that parses an ADR the first time it is looked up (-k runs).
+
+    A plain id -> entry dict holding only what has been loaded so far;
+    `load(id)` reads the files whose name carries that id (id_manifest).
+    Loaded entries are keyed by their front-matter id, so a misnamed file
+    cannot shadow the real one: when the named candidates do not yield the
+    id, every file not read yet is indexed once before the id is reported
+    missing. The first entry loaded for an id wins.
+
+    LinkGraph.has_node()/resolve() call load(), so LINK-300/305 and
+    DELTA-300 pull in exactly the targets they check. `build` indexes a
+    batch of paths (default: build_header_index).
+
+    expand() (post-run) also needs the ADRs that point *at* the loaded
+    ones; it reads the remaining headers once and keeps them pooled, so
+    later load() calls are served from memory.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path],
+        *,
+        build: Callable[[Iterable[Path]], Dict[str, Dict[str, Any]]] = None,
+    ):
+        super().__init__()
+        self._build = build or build_header_index
+        self._manifest, self._unnamed = id_manifest(files)
+        self._exhausted = False
+        # Headers read by expand() and not admitted (yet)
+        self._pool: Dict[str, Dict[str, Any]] = {}
+
+    def _add(self, paths: List[Path]) -> None:
+        if paths:
+            for adr_id, info in self._build(paths).items():
+                self.setdefault(adr_id, info)
+
+    def seed(self, files: Iterable[Path]) -> None:
+        """
+        Index `files` eagerly (the documents being linted; not part of the
+        lazily loaded set passed to the constructor).
+        """
+        self._add(list(files))
+
+    def load(self, adr_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the entry for adr_id, reading it from disk if needed.
+        """
+        if adr_id in self:
+            return self[adr_id]
+        if adr_id in self._pool:
+            return self.setdefault(adr_id, self._pool.pop(adr_id))
+        self._add(self._manifest.pop(adr_id, []))
+        if adr_id not in self and not self._exhausted:
+            # Unconventional file name: read everything left, once
+            self._exhausted = True
+            rest = [p for paths in self._manifest.values() for p in paths]
+            self._manifest.clear()
+            self._add(sorted(rest + self._unnamed))
+            self._unnamed = []
+        return self.get(adr_id)
+
+    def _read_rest(self) -> None:
+        # Every file not read yet, once, into the pool
+        if not self._exhausted:
+            self._exhausted = True
+            rest = [p for paths in self._manifest.values() for p in paths]
+            self._manifest.clear()
+            paths = sorted(rest + self._unnamed)
+            self._unnamed = []
+            pooled = self._build(paths) if paths else {}
+            for adr_id, info in pooled.items():
+                if adr_id not in self:
+                    self._pool.setdefault(adr_id, info)
+
+    def expand(self) -> None:
+        """
+        Load every ADR connected to the loaded ones: targets of their
+        relationship fields (transitively, so `extends` chains resolve)
+        and the ADRs whose `supersedes` names one of them (descendants,
+        for LINK-320/321). Descendants are only known from their own front
+        matter, so the remaining headers are read once.
+        """
+        self._read_rest()
+        reached = set(self)
+        frontier = list(self)
+        while frontier:
+            ids = set(frontier)
+            targets = set(_linked_ids(self, frontier))
+            targets.update(
+                adr_id
+                for adr_id, info in self._pool.items()
+                if any(
+                    edge.target in ids
+                    for edge in iter_link_edges(
+                        adr_id, info["meta"], ("supersedes",)
+                    )
+                )
+            )
+            targets -= reached
+            for target in sorted(targets):
+                self.load(target)
+            reached |= targets
+            frontier = [t for t in targets if t in self]
+
+
+def build_context_index(
+    selected: List[Path],
+    others: List[Path],
+    *,
+    build: Callable[[Iterable[Path]], Dict[str, Dict[str, Any]]] = None,
+) -> LazyIndex:
+    """
+    Index the selected files plus the cross-file context they need: every
+    ADR reachable from them over relationship fields. Further lookups
+    through the returned LazyIndex still load on demand.
+    """
+    idx = LazyIndex(others, build=build)
+    idx.seed(selected)
+    idx.expand()
+    return idx
+
+
 def read_text(path: Path, *, encoding: str = "utf-8") -> str:
     """
     Tiny reader wrapper to keep engine free of direct filesystem calls.
     """
-    return path.read_text(encoding=encoding)
+    with span("read", "io", path=path.as_posix()):
+        return path.read_text(encoding=encoding)
@@ -3,53 +3,421 @@
 # src/adr_linter/services/linkgraph.py
 
 """
-Build supersede graphs for post-run validators.
+Typed relationship graph over every link field, built once per run.
 
 Used by:
+  - ADR-LINK-300 (E): reciprocity checks (supersedes/informs pairs)
+  - ADR-LINK-302/304 (W/E): base ADR resolution for `extends`
+  - ADR-LINK-305 (E): existence of `extends` / `owners_ptr` targets
+  - ADR-DELTA-300 (E): inherited section keys along the `extends` chain
   - ADR-LINK-320 (I): multiple descendants
   - ADR-LINK-321 (E): cycle detected
 
 Inputs: idx is the index built by the engine (id -> {meta, path, body, ...})
 Outputs:
- - graph[id] -> list of ids it supersedes
+ - LinkGraph: one multigraph with an edge per (src, field, target) taken
+   from ALL_RELATIONSHIP_FIELDS; pins are parsed once at build time
+ - ExtendsResolver (LinkGraph.extends): memoized `extends` ancestor chains
+   and effective (inherited) section keys / overrides per ADR
+ - graph[id] -> list of ids it supersedes (legacy supersede view)
  - reverse_graph[id] -> list of ids that supersede it (descendants)
 
+Edges to ids that are not indexed are kept (existence checks need them);
+`has_node()` tells callers whether a target resolves. Over a lazy index
+(services.index.LazyIndex, -k runs) an unknown id is loaded on first
+lookup and its edges join the graph.
+
 NOTE: This introduces cross-file analysis while the main pipeline is
       single-file oriented. Kept intentionally (per product direction),
       with this note documenting the tension for future review.
 
-Ref: ADR-0001 §10.4
+Ref: ADR-0001 §8, §10.1, §10.4
 """
 
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import threading
+from functools import cached_property
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..constants import ALL_RELATIONSHIP_FIELDS
+from ..parser.structure import parse_document_structure
+
+# Deterministic field order for edge emission (set iteration is not stable
+# across interpreter runs).
+_FIELDS: Tuple[str, ...] = tuple(sorted(ALL_RELATIONSHIP_FIELDS))
+
+
+class LinkEdge(NamedTuple):
+    """
+    One relationship value from front-matter, pin-parsed.
+
+    raw:    value as written (e.g. "ADR-0001@2025-09-01")
+    target: ADR id portion ("ADR-0001")
+    pin:    pin portion after '@' ("2025-09-01"), or None when unpinned
+    """
+
+    src: str
+    field: str
+    target: str
+    pin: Optional[str]
+    raw: str
+
+
+def parse_pin(value: Any) -> Tuple[str, Optional[str]]:
+    """
+    Split "ADR-XXXX@pin" into ("ADR-XXXX", "pin"); unpinned → (value, None).
+    """
+    s = str(value)
+    if "@" in s:
+        target, pin = s.split("@", 1)
+        return target, pin
+    return s, None
+
+
+def relationship_values(v: Any) -> List[str]:
+    """
+    Normalize a relationship field value to a list of strings.
+
+    Mirrors the legacy per-validator helpers: a string is a one-item list,
+    other iterables are stringified element-wise, empty values drop out.
+    """
+    if v is None:
+        return []
+    if isinstance(v, str):
+        return [v] if v else []
+    try:
+        return [str(x) for x in v if x]
+    except TypeError:
+        return [str(v)]
+
+
+def iter_link_edges(
+    src: str, meta: Dict, fields: Iterable[str] = _FIELDS
+) -> Iterable[LinkEdge]:
+    """
+    Yield pin-parsed edges for one document's front-matter.
+    """
+    for field in fields:
+        for raw in relationship_values(meta.get(field)):
+            target, pin = parse_pin(raw)
+            yield LinkEdge(src, field, target, pin, raw)
+
+
+class LinkGraph:
+    """
+    Typed multigraph over ALL_RELATIONSHIP_FIELDS with forward and reverse
+    adjacency. Membership checks are set lookups.
+    """
+
+    def __init__(self, idx: Dict[str, dict]):
+        self.idx = idx
+        self.nodes: FrozenSet[str] = frozenset(idx.keys())
+        # Serializes lazy loads (LazyIndex) when rules run on threads
+        self._load_lock = threading.RLock()
+        # src -> field -> [edges] (document order)
+        self._out: Dict[str, Dict[str, List[LinkEdge]]] = {}
+        # target -> field -> [edges]
+        self._in: Dict[str, Dict[str, List[LinkEdge]]] = {}
+        # (src, field) -> {target ids}
+        self._out_sets: Dict[Tuple[str, str], Set[str]] = {}
+
+        for sid, info in idx.items():
+            for edge in iter_link_edges(sid, info["meta"]):
+                self._add(edge)
+
+    def _add(self, edge: LinkEdge) -> None:
+        self._out.setdefault(edge.src, {}).setdefault(edge.field, []).append(
+            edge
+        )
+        self._in.setdefault(edge.target, {}).setdefault(
+            edge.field, []
+        ).append(edge)
+        self._out_sets.setdefault((edge.src, edge.field), set()).add(
+            edge.target
+        )
+
+    def _drop_out_edges(self, src: str) -> None:
+        for field, edges in self._out.pop(src, {}).items():
+            self._out_sets.pop((src, field), None)
+            for edge in edges:
+                bucket = self._in.get(edge.target, {}).get(field)
+                if bucket:
+                    bucket[:] = [e for e in bucket if e.src != src]
+
+    def refresh_node(self, adr_id: str) -> None:
+        """
+        Re-read one document's edges after idx[adr_id] was replaced or
+        removed (long-lived sessions). Resets the memoized extends resolver.
+        """
+        self._drop_out_edges(adr_id)
+        info = self.idx.get(adr_id)
+        if info is None:
+            self.nodes = self.nodes - {adr_id}
+        else:
+            self.nodes = self.nodes | {adr_id}
+            for edge in iter_link_edges(adr_id, info["meta"]):
+                self._add(edge)
+        self.__dict__.pop("extends", None)
+
+    def sync(self) -> None:
+        """
+        Admit index entries loaded since the graph was built (lazy
+        indexes). Memoized `extends` chains stay valid: they were resolved
+        through has_node(), which loads on demand.
+        """
+        new = self.idx.keys() - self.nodes
+        if new:
+            for adr_id in sorted(new):
+                for edge in iter_link_edges(adr_id, self.idx[adr_id]["meta"]):
+                    self._add(edge)
+            # Publish the nodes last: has_node() readers skip the lock
+            self.nodes = self.nodes | new
+
+    def neighbours(self, adr_id: str) -> Set[str]:
+        """
+        Ids whose cross-file results can change when adr_id changes: direct
+        link partners in either direction plus transitive `extends`
+        descendants (they inherit its section keys).
+        """
+        out: Set[str] = set()
+        for edges in self._out.get(adr_id, {}).values():
+            out.update(e.target for e in edges)
+        for edges in self._in.get(adr_id, {}).values():
+            out.update(e.src for e in edges)
+        stack = list(self.sources(adr_id, "extends"))
+        descendants = set(stack)
+        while stack:
+            for child in self.sources(stack.pop(), "extends"):
+                if child not in descendants:
+                    descendants.add(child)
+                    stack.append(child)
+        out |= descendants
+        out.discard(adr_id)
+        return out
+
+    # ---- Queries -----------------------------------------------------------
+
+    def has_node(self, adr_id: str) -> bool:
+        if adr_id in self.nodes:
+            return True
+        load = getattr(self.idx, "load", None)
+        if load is None:
+            return False
+        with self._load_lock:
+            if load(adr_id) is None:
+                return False
+            self.sync()
+        return True
+
+    def has_edge(self, src: str, field: str, target: str) -> bool:
+        return target in self._out_sets.get((src, field), ())
+
+    def edges(self, src: str, field: str) -> List[LinkEdge]:
+        return self._out.get(src, {}).get(field, [])
+
+    def targets(self, src: str, field: str) -> List[str]:
+        return [e.target for e in self.edges(src, field)]
+
+    def incoming(self, target: str, field: str) -> List[LinkEdge]:
+        return self._in.get(target, {}).get(field, [])
+
+    def sources(self, target: str, field: str) -> List[str]:
+        return [e.src for e in self.incoming(target, field)]
+
+    def resolve(self, value: Any) -> Optional[dict]:
+        """
+        Return the index entry a relationship value points at, or None.
+        """
+        if not value:
+            return None
+        target, _pin = parse_pin(value)
+        if not self.has_node(target):
+            return None
+        return self.idx[target]
+
+    @cached_property
+    def extends(self) -> "ExtendsResolver":
+        """
+        Shared `extends` chain resolver (memoized for the life of the graph).
+        """
+        return ExtendsResolver(self)
+
+
+class ExtendsResolver:
+    """
+    Resolve `extends` inheritance over the index, once per ADR.
+
+    chain(id)           -> ancestor ids, nearest base first
+    section_keys(id)    -> own key markers ∪ every ancestor's key markers
+    overrides(id)       -> ancestor overrides merged root-first, own last
+    is_cyclic(id)       -> True when the chain runs into an `extends` cycle
+
+    Each document's own keys/overrides are read once (from the index's
+    section_data when present, otherwise by parsing its body) and every
+    chain is memoized, so resolving the whole corpus costs O(total chain
+    length). Cycles terminate the chain instead of recursing.
+
+    Ref: ADR-0001 §4 (delta inherits base sections), §8 (overrides)
+    """
+
+    def __init__(self, graph: LinkGraph):
+        self.graph = graph
+        self._chains: Dict[str, Tuple[str, ...]] = {}
+        self._cyclic: Set[str] = set()
+        self._own_keys: Dict[str, FrozenSet[str]] = {}
+        self._own_overrides: Dict[str, Dict[str, Any]] = {}
+        self._section_keys: Dict[str, FrozenSet[str]] = {}
+
+    def _parent(self, adr_id: str) -> Optional[str]:
+        for target in self.graph.targets(adr_id, "extends"):
+            if self.graph.has_node(target):
+                return target
+        return None
+
+    def chain(self, adr_id: str) -> Tuple[str, ...]:
+        if adr_id in self._chains:
+            return self._chains[adr_id]
+
+        path: List[str] = [adr_id]
+        pos: Dict[str, int] = {adr_id: 0}
+        tail: Tuple[str, ...] = ()
+        cyclic = False
+        cycle_start: Optional[int] = None
+        cur = adr_id
+        while True:
+            parent = self._parent(cur)
+            if parent is None:
+                break
+            if parent in pos:
+                cyclic = True
+                cycle_start = pos[parent]
+                break
+            if parent in self._chains:
+                tail = (parent,) + self._chains[parent]
+                cyclic = parent in self._cyclic
+                break
+            pos[parent] = len(path)
+            path.append(parent)
+            cur = parent
+
+        for i in range(len(path) - 1, -1, -1):
+            if cycle_start is not None and i >= cycle_start:
+                # Cycle member: walk the rest of the loop back to itself.
+                chain = tuple(path[i + 1 :]) + tuple(path[cycle_start:i])
+            else:
+                chain = tuple(path[i + 1 :]) + tail
+            # Mark cyclic before publishing the chain (threaded readers)
+            if cyclic:
+                self._cyclic.add(path[i])
+            self._chains[path[i]] = chain
+        return self._chains[adr_id]
+
+    def is_cyclic(self, adr_id: str) -> bool:
+        self.chain(adr_id)
+        return adr_id in self._cyclic
+
+    def _section_data(self, adr_id: str):
+        info = self.graph.idx[adr_id]
+        sd = info.get("section_data")
+        if sd is None:
+            sd = parse_document_structure(info.get("body", ""))
+        return sd
+
+    def own_keys(self, adr_id: str) -> FrozenSet[str]:
+        if adr_id not in self._own_keys:
+            sd = self._section_data(adr_id)
+            self._own_keys[adr_id] = frozenset(k for k, _, _ in sd.key_markers)
+        return self._own_keys[adr_id]
+
+    def own_overrides(self, adr_id: str) -> Dict[str, Any]:
+        if adr_id not in self._own_overrides:
+            merged: Dict[str, Any] = {}
+            for blk in self._section_data(adr_id).yaml_blocks:
+                data = blk.get("data")
+                if blk.get("kind") == "overrides" and isinstance(data, dict):
+                    if isinstance(data.get("overrides"), dict):
+                        merged.update(data["overrides"])
+            self._own_overrides[adr_id] = merged
+        return self._own_overrides[adr_id]
+
+    def section_keys(self, adr_id: str) -> FrozenSet[str]:
+        """
+        Effective section keys: the ADR's own markers plus everything it
+        inherits through `extends`.
+        """
+        if adr_id not in self._section_keys:
+            keys = set(self.own_keys(adr_id))
+            for ancestor in self.chain(adr_id):
+                keys |= self.own_keys(ancestor)
+            self._section_keys[adr_id] = frozenset(keys)
+        return self._section_keys[adr_id]
+
+    def overrides(self, adr_id: str) -> Dict[str, Any]:
+        """
+        Effective overrides: root ancestor first, nearest base next, the
+        ADR's own overrides last (last writer wins).
+        """
+        merged: Dict[str, Any] = {}
+        for ancestor in reversed(self.chain(adr_id)):
+            merged.update(self.own_overrides(ancestor))
+        merged.update(self.own_overrides(adr_id))
+        return merged
+
+
+def build_link_graph(idx: Dict[str, dict]) -> LinkGraph:
+    """
+    Build the typed relationship graph for one run.
+    """
+    return LinkGraph(idx)
+
+
+def link_graph_for(ctx) -> LinkGraph:
+    """
+    Return the run's shared graph from the validation context, building it
+    from ctx.all_idx when the caller did not supply one (unit tests, ad-hoc
+    contexts). The result is cached on the context.
+    """
+    graph = getattr(ctx, "link_graph", None)
+    if graph is None or graph.idx is not ctx.all_idx:
+        graph = build_link_graph(ctx.all_idx)
+        ctx.link_graph = graph
+    return graph
 
 
 def build_supersede_graph(
     idx: Dict[str, dict],
+    link_graph: Optional[LinkGraph] = None,
 ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
     """
     Construct forward and reverse supersede graphs from the ADR index.
 
-    This is a straight lift of the legacy behavior:
+    Projection of the typed graph onto `supersedes`:
       - treat a string `supersedes` as a one-item list
+      - resolve pinned values ("ADR-0001@<pin>") to their ADR id
       - ignore targets that aren't present in the index
 
-    Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+    Ref: ADR-0001 §10.4
     """
+    lg = link_graph if link_graph is not None else build_link_graph(idx)
     graph: Dict[str, List[str]] = {k: [] for k in idx.keys()}
     reverse_graph: Dict[str, List[str]] = {k: [] for k in idx.keys()}
 
-    for sid, info in idx.items():
-        supersedes = info["meta"].get("supersedes")
-        if isinstance(supersedes, str):
-            supersedes = [supersedes]
-        if supersedes:
-            for target in supersedes:
-                if target in graph:
-                    graph[sid].append(target)
-                    reverse_graph[target].append(sid)
+    for sid in idx.keys():
+        for target in lg.targets(sid, "supersedes"):
+            if target in graph:
+                graph[sid].append(target)
+                reverse_graph[target].append(sid)
 
     return graph, reverse_graph
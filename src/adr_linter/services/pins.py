@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/services/pins.py
+
+"""
+Pin verification against the local git history (ADR-LINK-306).
+
+LINK-303 checks that a pin looks right; PinResolver checks that it
+resolves:
+
+ - hex pins (ADR-0001@1a2b3c4): the commit exists and the pinned ADR's
+   file existed at that revision. Every query goes through one
+   long-lived `git cat-file --batch-check` process;
+ - date pins (ADR-0001@2025-09-01): the ADR's file was in history on
+   that date. One `git log --name-only` scan of the ADR paths under the
+   run root (ADR_PATHSPECS) records the first commit date of each ADR.
+
+Answers are memoized per run, so each distinct pin costs one round trip
+however many documents repeat it. Only the local repository is read (no
+fetch); without git or outside a work tree the resolver is unavailable
+and LINK-306 does not run (engine.run says so on stderr).
+
+Ref: ADR-0001 §8 (pins)
+"""
+
+from __future__ import annotations
+
+import datetime
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..constants import ADR_PATHSPECS
+from ..constants.validation import PIN_DATE_RX
+
+# PinResolver.check() outcomes
+NO_COMMIT = "no-commit"
+NOT_AT_COMMIT = "not-at-commit"
+NOT_YET_COMMITTED = "not-yet-committed"
+
+
+def _git(root: Path, *args: str) -> Optional[str]:
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+class PinResolver:
+    """
+    Per-run pin lookups for one work tree. Thread-safe; close() (or use as
+    a context manager) stops the batch process.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self.available = _git(self.root, "rev-parse", "--git-dir") is not None
+        self._batch: Optional[subprocess.Popen] = None
+        self._objects: Dict[str, bool] = {}
+        self._first_seen: Optional[Dict[str, datetime.date]] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "PinResolver":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._batch is not None:
+            self._batch.stdin.close()
+            self._batch.wait()
+            self._batch = None
+
+    def _rel(self, path: Path) -> str:
+        return Path(path).resolve().relative_to(self.root).as_posix()
+
+    # ---- hex pins: one cat-file --batch-check pipe ------------------------
+
+    def _exists(self, spec: str) -> bool:
+        with self._lock:
+            hit = self._objects.get(spec)
+            if hit is None:
+                if self._batch is None:
+                    self._batch = subprocess.Popen(
+                        ["git", "cat-file", "--batch-check"],
+                        cwd=self.root,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        text=True,
+                    )
+                self._batch.stdin.write(spec + "\n")
+                self._batch.stdin.flush()
+                reply = self._batch.stdout.readline().rstrip("\n")
+                # "<oid> <type> <size>" or "<spec> missing|ambiguous"
+                hit = self._objects[spec] = not reply.endswith(
+                    (" missing", " ambiguous")
+                )
+            return hit
+
+    def commit_exists(self, sha: str) -> bool:
+        return self._exists(f"{sha}^{{commit}}")
+
+    def file_at(self, sha: str, path: Path) -> bool:
+        # "./" makes the path relative to the batch process's cwd (root)
+        return self._exists(f"{sha}:./{self._rel(path)}")
+
+    # ---- date pins: one git log scan --------------------------------------
+
+    def _scan(self) -> Dict[str, datetime.date]:
+        with self._lock:
+            if self._first_seen is None:
+                out = _git(
+                    self.root,
+                    "-c",
+                    "core.quotePath=off",
+                    "log",
+                    "--relative",
+                    "--format=%x00%cs",
+                    "--name-only",
+                    "--",
+                    *ADR_PATHSPECS,
+                )
+                first: Dict[str, datetime.date] = {}
+                day = None
+                # Commit dates need not follow log order (rebases,
+                # backdated commits): keep the earliest
+                for line in (out or "").splitlines():
+                    if line.startswith("\0"):
+                        day = datetime.date.fromisoformat(line[1:])
+                    elif line and day is not None:
+                        first[line] = min(first.get(line, day), day)
+                self._first_seen = first
+            return self._first_seen
+
+    def first_seen(self, path: Path) -> Optional[datetime.date]:
+        """
+        Date of the first commit touching path (None: not in history).
+        """
+        return self._scan().get(self._rel(path))
+
+    def check(self, pin: str, path: Path) -> Optional[str]:
+        """
+        None when `pin` resolves for the ADR stored at `path`, otherwise
+        one of NO_COMMIT, NOT_AT_COMMIT, NOT_YET_COMMITTED. `pin` is a
+        well-formed date or lowercase hex pin (LINK-303). Date pins of
+        files with no history yet (new, uncommitted ADRs) pass.
+        """
+        if PIN_DATE_RX.match(pin):
+            seen = self.first_seen(path)
+            if seen is not None and datetime.date.fromisoformat(pin) < seen:
+                return NOT_YET_COMMITTED
+            return None
+        if not self.commit_exists(pin):
+            return NO_COMMIT
+        if not self.file_at(pin, path):
+            return NOT_AT_COMMIT
+        return None
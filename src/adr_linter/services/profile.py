@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/services/profile.py
+
+"""
+Per-phase profiling for `theseus --profile[=cpu|mem|all]` (impure).
+
+engine.run wraps each phase (discover, index, validate, post_run, report)
+in PhaseProfiler.phase(); write() then drops two files in logs/.adr/:
+
+ - profile.prof: cProfile stats of the whole run (cpu), for pstats,
+   snakeviz or `python -m pstats`;
+ - profile.txt:  per phase, the top-N functions by cumulative time (cpu)
+   and the peak traced memory plus the top-N allocation sites that grew
+   during the phase (mem).
+
+Both files are overwritten each run, like lint_metrics.json. cProfile
+only sees the calling thread: with --threads / --jobs the workers' time
+shows up as waits in the main thread.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from ..constants import LOG_DIR
+
+PROFILE_MODES = ("cpu", "mem", "all")
+TOP_N = 20
+
+# Keep the profiler's own bookkeeping out of the allocation tables
+_OWN_FRAMES = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_OWN_FRAMES)
+
+
+def profile_dir(root: Path) -> Path:
+    return root / LOG_DIR
+
+
+class PhaseProfiler:
+    """
+    cProfile and/or tracemalloc around named phases of one run.
+    """
+
+    def __init__(self, mode: str = "cpu", top: int = TOP_N):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode: {mode}")
+        self.cpu = mode in ("cpu", "all")
+        self.mem = mode in ("mem", "all")
+        self.top = top
+        self._cpu: Dict[str, cProfile.Profile] = {}
+        # phase -> (seconds, peak bytes, top allocation growth lines)
+        self._phases: Dict[str, Tuple[float, int, List[str]]] = {}
+        self._own_tracing = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        prof = before = None
+        if self.mem:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._own_tracing = True
+            tracemalloc.reset_peak()
+            before = _snapshot()
+        if self.cpu:
+            prof = self._cpu.setdefault(name, cProfile.Profile())
+            prof.enable()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            if prof is not None:
+                prof.disable()
+            peak, growth = 0, []
+            if before is not None:
+                _, peak = tracemalloc.get_traced_memory()
+                after = _snapshot()
+                growth = [
+                    str(stat)
+                    for stat in after.compare_to(before, "lineno")[: self.top]
+                ]
+            self._phases[name] = (elapsed, peak, growth)
+
+    def _cpu_summary(self, name: str) -> str:
+        out = io.StringIO()
+        stats = pstats.Stats(self._cpu[name], stream=out)
+        stats.sort_stats("cumulative").print_stats(self.top)
+        # Drop pstats' banner lines up to the table header
+        lines = out.getvalue().splitlines()
+        start = next(
+            (i for i, ln in enumerate(lines) if "ncalls" in ln), len(lines)
+        )
+        return "\n".join(lines[start:]).rstrip()
+
+    def summary(self) -> str:
+        parts = []
+        for name, (elapsed, peak, growth) in self._phases.items():
+            head = f"== {name}: {elapsed:.3f}s"
+            if self.mem:
+                head += f", peak {peak / 1024:.1f} KiB"
+            parts.append(head)
+            if self.cpu:
+                parts.append(self._cpu_summary(name))
+            if self.mem:
+                parts.append(f"-- top {self.top} allocation sites (growth)")
+                parts.extend(growth or ["(none)"])
+            parts.append("")
+        return "\n".join(parts)
+
+    def write(self, out_dir: Path) -> List[Path]:
+        """
+        Write profile.prof (cpu) and profile.txt; stop tracemalloc if this
+        profiler started it. Returns the written paths.
+        """
+        if self._own_tracing:
+            tracemalloc.stop()
+            self._own_tracing = False
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        if self._cpu:
+            profiles = list(self._cpu.values())
+            stats = pstats.Stats(profiles[0])
+            if len(profiles) > 1:
+                stats.add(*profiles[1:])
+            prof_path = out_dir / "profile.prof"
+            stats.dump_stats(prof_path)
+            written.append(prof_path)
+        txt_path = out_dir / "profile.txt"
+        txt_path.write_text(self.summary(), encoding="utf-8")
+        written.append(txt_path)
+        return written
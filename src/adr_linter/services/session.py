@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/services/session.py
+
+"""
+Long-lived lint session: warm index + link graph with incremental updates.
+
+Used by the editor / daemon entry points (`theseus lsp`). The corpus is
+indexed once from disk; afterwards edited buffers are pushed in as text
+and only what they can affect is re-linted:
+
+ - the edited document: front-matter + structure re-parsed, every
+   applicable per-file rule re-run;
+ - its link-graph neighbours (link partners and `extends` descendants):
+   only the cross-file rules (those declaring a cross-file artifact);
+ - post-run (graph) rules over the whole index, which are cheap.
+
+Only files discover() would lint (ADR_LOCATIONS under the root) are
+tracked; updates to any other buffer are ignored. Findings are kept per
+document and per rule code so a neighbour's local findings survive a
+partial re-run. Line numbers are rebased from body
+lines to file lines (front-matter height added).
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..models import ValidationData
+from ..parser.front_matter import parse_front_matter
+from ..parser.structure import build_index_from_texts, parse_document_structure
+from ..report import Finding, Findings
+from ..validators.registry import (
+    manifest_codes_cross_file,
+    post_run,
+    run_all,
+)
+from .index import (
+    build_index_from_files,
+    in_adr_locations,
+    load_files,
+    read_text,
+)
+from .linkgraph import build_link_graph
+
+_POST_RUN = "post_run"
+
+
+def split_location(location: str):
+    """
+    "path[:line]" -> (path, line or None).
+    """
+    path, sep, line = location.rpartition(":")
+    if sep and line.isdigit():
+        return path, int(line)
+    return location, None
+
+
+def doc_key(path: Path | str) -> str:
+    """
+    Session key of a document: its resolved posix path.
+    """
+    return Path(path).resolve().as_posix()
+
+
+class LintSession:
+    """
+    Warm lint state for one workspace root.
+
+    Paths are absolute; findings are keyed by that path's posix string.
+    """
+
+    def __init__(self, root: Path | str = "."):
+        self.root = Path(root).resolve()
+        files = [p.resolve() for p in load_files(self.root)]
+        self.idx = build_index_from_files(files)
+        self.graph = build_link_graph(self.idx)
+        self._id_by_path: Dict[str, str] = {
+            Path(info["path"]).as_posix(): adr_id
+            for adr_id, info in self.idx.items()
+        }
+        self._texts: Dict[str, str] = {}
+        self._offsets: Dict[str, int] = {}
+        # path -> rule code (or _POST_RUN) -> findings
+        self._findings: Dict[str, Dict[str, List[Finding]]] = {}
+        self._cross_codes = frozenset(manifest_codes_cross_file())
+
+    # ---- Document state ----------------------------------------------------
+
+    def _text_for(self, key: str) -> Optional[str]:
+        if key in self._texts:
+            return self._texts[key]
+        try:
+            return read_text(Path(key))
+        except OSError:
+            return None
+
+    def _lint(self, key: str, codes: Optional[Iterable[str]] = None) -> None:
+        text = self._text_for(key)
+        if text is None:
+            self._findings.pop(key, None)
+            return
+        meta, end = parse_front_matter(text)
+        body = text[end:]
+        self._offsets[key] = text[:end].count("\n")
+        ctx = ValidationData(
+            meta=meta,
+            body=body,
+            path=Path(key),
+            section_data=parse_document_structure(body),
+            all_idx=self.idx,
+            link_graph=self.graph,
+        )
+        rpt = Findings()
+        run_all(ctx, rpt, codes)
+
+        by_code = self._findings.setdefault(key, {})
+        for code in list(by_code):
+            if code != _POST_RUN and (codes is None or code in codes):
+                del by_code[code]
+        for f in rpt:
+            by_code.setdefault(f.code, []).append(f)
+
+    def _post_run(self) -> Set[str]:
+        """
+        Re-run graph rules; return tracked paths whose results changed.
+        """
+        rpt = Findings()
+        post_run(self.idx, rpt, self.graph)
+        fresh: Dict[str, List[Finding]] = {}
+        for f in rpt:
+            key, _line = split_location(f.location)
+            if key in self._findings:
+                fresh.setdefault(key, []).append(f)
+
+        changed: Set[str] = set()
+        for key, by_code in self._findings.items():
+            new = fresh.get(key, [])
+            if by_code.get(_POST_RUN, []) != new:
+                changed.add(key)
+            if new:
+                by_code[_POST_RUN] = new
+            else:
+                by_code.pop(_POST_RUN, None)
+        return changed
+
+    def _reindex(self, key: str, text: Optional[str]) -> Set[str]:
+        """
+        Replace (or drop) the index entry for `key`; return touched ids.
+        """
+        touched: Set[str] = set()
+        old_id = self._id_by_path.pop(key, None)
+        if old_id is not None:
+            touched.add(old_id)
+            touched |= self.graph.neighbours(old_id)
+            if Path(self.idx.get(old_id, {}).get("path", "")) == Path(key):
+                del self.idx[old_id]
+            self.graph.refresh_node(old_id)
+
+        if text is not None:
+            new = build_index_from_texts([(Path(key), text)])
+            for adr_id, info in new.items():
+                self.idx[adr_id] = info
+                self._id_by_path[key] = adr_id
+                self.graph.refresh_node(adr_id)
+                touched.add(adr_id)
+                touched |= self.graph.neighbours(adr_id)
+        return touched
+
+    # ---- Public API --------------------------------------------------------
+
+    def update(self, path: Path | str, text: Optional[str]) -> Set[str]:
+        """
+        Set the live text for a document (None: fall back to disk) and
+        re-lint what it affects. Returns the paths whose findings may have
+        changed (posix strings); nothing for files outside ADR_LOCATIONS.
+        """
+        key = doc_key(path)
+        if not in_adr_locations(self.root, Path(key)):
+            return set()
+        if text is None:
+            self._texts.pop(key, None)
+        else:
+            self._texts[key] = text
+
+        touched_ids = self._reindex(key, self._text_for(key))
+        self._lint(key)
+
+        changed = {key}
+        for adr_id in touched_ids:
+            info = self.idx.get(adr_id)
+            if info is None:
+                continue
+            other = Path(info["path"]).as_posix()
+            if other != key and other in self._findings:
+                self._lint(other, self._cross_codes)
+                changed.add(other)
+
+        changed |= self._post_run()
+        return changed
+
+    def forget(self, path: Path | str) -> None:
+        """
+        Stop tracking diagnostics for a document (editor closed it).
+        """
+        key = doc_key(path)
+        if key in self._texts:
+            self.update(key, None)
+        self._findings.pop(key, None)
+        self._offsets.pop(key, None)
+
+    def findings(self, path: Path | str) -> List[Finding]:
+        """
+        Current findings for a tracked document, line numbers in file lines.
+        """
+        key = doc_key(path)
+        offset = self._offsets.get(key, 0)
+        out: List[Finding] = []
+        for items in self._findings.get(key, {}).values():
+            for f in items:
+                loc, line = split_location(f.location)
+                if line is not None:
+                    f = f._replace(location=f"{loc}:{line + offset}")
+                out.append(f)
+        return out
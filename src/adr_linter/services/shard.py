@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/services/shard.py
+
+"""
+CI sharding: deterministic file partition and shard artifacts.
+
+`theseus --shard i/N` lints the files whose path hashes to shard i
+(crc32 of the posix path relative to the lint root, stable across
+interpreters, nodes and checkout directories), runs the per-file rules
+that need no other document, and writes one JSON artifact:
+
+  {"format": 2, "shard": [i, N], "root": "<--path>",
+   "findings": [[sev, code, location, message], ...],
+   "documents": [{"path", "meta", "key_markers", "headings",
+                  "yaml_blocks"}, ...]}
+
+`documents` are parser.structure.ProjectedEntry projections. `theseus
+merge` (adr_linter.merge) rebuilds the index from every shard, runs the
+cross-file per-file rules and post-run on it and decides the exit code.
+Merge checks that every document sits in exactly one shard, the one its
+root-relative path hashes to.
+
+Front-matter values JSON cannot carry (YAML dates) are stored as strings;
+the projected fields are ids, classes and notes, which are strings anyway.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from ..constants import LOG_DIR
+from ..parser.structure import ProjectedEntry, SectionProjection
+from ..report import Finding
+
+SHARD_FORMAT = 2
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    "i/N" -> (i, N) with 1 <= i <= N; ValueError otherwise.
+    """
+    try:
+        i, n = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/N, got {spec!r}") from None
+    if not 1 <= i <= n:
+        raise ValueError(f"shard index out of range: {spec!r}")
+    return i, n
+
+
+def shard_of(rel: Path, total: int) -> int:
+    """
+    1-based shard number for a discovered path, given relative to the lint
+    root (the checkout location must not change the partition).
+    """
+    return zlib.crc32(rel.as_posix().encode("utf-8")) % total + 1
+
+
+def _relative(path: Path, root: Path) -> Path:
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
+def default_artifact(root: Path, shard: Tuple[int, int]) -> Path:
+    i, n = shard
+    return root / LOG_DIR / f"shard-{i}-of-{n}.json"
+
+
+def _dump_entry(entry: ProjectedEntry) -> Dict:
+    sd = entry.section_data
+    return {
+        "path": entry.path.as_posix(),
+        "meta": entry.meta,
+        "key_markers": sd.key_markers,
+        "headings": sd.headings,
+        "yaml_blocks": sd.yaml_blocks,
+    }
+
+
+def _load_entry(raw: Dict) -> ProjectedEntry:
+    return ProjectedEntry(
+        Path(raw["path"]),
+        raw["meta"],
+        SectionProjection(
+            tuple(tuple(m) for m in raw["key_markers"]),
+            tuple(tuple(h) for h in raw["headings"]),
+            tuple(raw["yaml_blocks"]),
+        ),
+    )
+
+
+def write_artifact(
+    out: Path,
+    shard: Tuple[int, int],
+    findings: Iterable[Finding],
+    documents: Iterable[ProjectedEntry],
+    root: Path = Path("."),
+) -> None:
+    out.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "format": SHARD_FORMAT,
+        "shard": list(shard),
+        "root": root.as_posix(),
+        "findings": [list(f) for f in findings],
+        "documents": [_dump_entry(e) for e in documents],
+    }
+    out.write_text(json.dumps(payload, default=str), encoding="utf-8")
+
+
+def read_artifacts(
+    paths: Iterable[Path],
+) -> Tuple[List[Finding], List[ProjectedEntry]]:
+    """
+    Load and combine shard artifacts. Raises ValueError unless they are
+    exactly shards 1..N of one partition and every document appears once,
+    in the shard its root-relative path hashes to.
+    """
+    findings: List[Finding] = []
+    documents: List[ProjectedEntry] = []
+    seen: Dict[int, Path] = {}
+    owner: Dict[Path, Path] = {}
+    total = None
+    for p in paths:
+        data = json.loads(Path(p).read_text(encoding="utf-8"))
+        if data.get("format") != SHARD_FORMAT:
+            raise ValueError(f"{p}: unsupported shard format")
+        i, n = data["shard"]
+        if total is None:
+            total = n
+        elif n != total:
+            raise ValueError(f"{p}: shard {i}/{n} is not part of a /{total}")
+        if i in seen:
+            raise ValueError(f"{p}: shard {i}/{n} already read from {seen[i]}")
+        seen[i] = p
+        root = Path(data["root"])
+        for raw in data["documents"]:
+            entry = _load_entry(raw)
+            rel = _relative(entry.path, root)
+            if rel in owner:
+                raise ValueError(
+                    f"{p}: {rel.as_posix()} already read from {owner[rel]}"
+                )
+            if shard_of(rel, n) != i:
+                raise ValueError(
+                    f"{p}: {rel.as_posix()} belongs to shard "
+                    f"{shard_of(rel, n)}/{n}, not {i}/{n}"
+                )
+            owner[rel] = p
+            documents.append(entry)
+        findings.extend(Finding(*row) for row in data["findings"])
+    if total is None:
+        raise ValueError("no shard artifacts given")
+    missing = sorted(set(range(1, total + 1)) - set(seen))
+    if missing:
+        raise ValueError(f"missing shard(s) of /{total}: {missing}")
+    return findings, documents
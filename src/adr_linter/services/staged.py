@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/services/staged.py
+
+"""
+Staged-content source for `theseus --staged` (pre-commit).
+
+Lints what is in the git index, never the working tree:
+
+ - the ADRs to lint are the staged changes,
+   `git diff --cached --name-only -z` (added, copied, modified, renamed);
+ - the cross-file context is every ADR in the index (`git ls-files -s`),
+   so links resolve against the snapshot being committed;
+ - blob contents stream through one `git cat-file --batch` process and are
+   parsed in memory into the same IndexEntry records the working-tree
+   builders produce; nothing is written to or read from the work tree.
+
+BlobCache keeps decoded texts and their front matter keyed by blob SHA.
+Blobs are content-addressed, so entries never go stale: a long-lived
+process (`theseus daemon`) re-reads only blobs it has not seen, i.e. the
+ADRs that changed since its last staged lint.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from ..constants import ADR_PATHSPECS
+from ..parser.front_matter import parse_front_matter
+from ..parser.structure import IndexEntry
+
+
+def _git_z(root: Path, *args: str) -> List[str]:
+    """
+    NUL-separated output of a git command run in root (ValueError when git
+    fails, e.g. outside a work tree).
+    """
+    proc = subprocess.run(["git", *args], cwd=root, capture_output=True)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", "replace").strip()
+        raise ValueError(f"git {args[0]} failed: {err}")
+    return [item.decode("utf-8") for item in proc.stdout.split(b"\0") if item]
+
+
+def _visible(rel: str) -> bool:
+    # Same exclusion as services.index.discover: no hidden directories
+    return not any(part.startswith(".") for part in rel.split("/"))
+
+
+def staged_changes(root: Path) -> List[str]:
+    """
+    Root-relative paths of staged ADRs (deletions excluded), sorted.
+    """
+    rels = _git_z(
+        root,
+        "diff",
+        "--cached",
+        "--name-only",
+        "-z",
+        "--relative",
+        "--diff-filter=ACMR",
+        "--",
+        *ADR_PATHSPECS,
+    )
+    return sorted(r for r in rels if _visible(r))
+
+
+def staged_blobs(root: Path) -> Dict[str, str]:
+    """
+    Root-relative path -> blob SHA for every ADR in the git index.
+    ValueError when ADRs are unmerged (git refuses to commit them too).
+    """
+    blobs: Dict[str, str] = {}
+    unmerged = set()
+    # "<mode> <sha> <stage>\t<path>"; conflicted paths list stages 1-3
+    for row in _git_z(root, "ls-files", "-s", "-z", "--", *ADR_PATHSPECS):
+        info, rel = row.split("\t", 1)
+        _mode, sha, stage = info.split()
+        if not _visible(rel):
+            continue
+        if stage == "0":
+            blobs[rel] = sha
+        else:
+            unmerged.add(rel)
+    if unmerged:
+        raise ValueError(f"unmerged ADRs: {', '.join(sorted(unmerged))}")
+    return blobs
+
+
+class BlobCache:
+    """
+    blob SHA -> (text, meta, body offset). Content-addressed: never stale.
+    """
+
+    def __init__(self):
+        self._blobs: Dict[str, Tuple[str, Dict, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._blobs
+
+    def fill(self, root: Path, shas: Iterable[str]) -> None:
+        """
+        Read the blobs not cached yet through one `git cat-file --batch`.
+        """
+        missing = sorted(set(shas) - self._blobs.keys())
+        if not missing:
+            return
+        proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        try:
+            for sha in missing:
+                # One request in flight: the pipe never fills up
+                proc.stdin.write(sha.encode("ascii") + b"\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline().split()
+                if len(header) != 3:
+                    raise ValueError(f"blob {sha} missing from the index")
+                data = proc.stdout.read(int(header[2]) + 1)[:-1]
+                # Universal newlines, like Path.read_text on the worktree
+                text = data.decode("utf-8")
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+                meta, end = parse_front_matter(text)
+                self._blobs[sha] = (text, meta, end)
+        finally:
+            proc.stdin.close()
+            proc.wait()
+
+    def entry(self, sha: str, path: Path) -> IndexEntry:
+        text, meta, end = self._blobs[sha]
+        return IndexEntry(path, meta, text, end)
+
+
+def staged_snapshot(
+    root: Path, cache: BlobCache = None
+) -> Tuple[List[Path], Dict[Path, str], Dict[str, IndexEntry]]:
+    """
+    (staged ADR paths to lint, text per ADR path in the index, id-keyed
+    index of the index snapshot). Paths are `root / <relative path>`, as
+    discover() returns them; a later path wins a duplicate id, as in the
+    working-tree index builders.
+    """
+    cache = cache if cache is not None else BlobCache()
+    blobs = staged_blobs(root)
+    cache.fill(root, blobs.values())
+
+    texts: Dict[Path, str] = {}
+    idx: Dict[str, IndexEntry] = {}
+    for p, rel in sorted((root / rel, rel) for rel in blobs):
+        entry = cache.entry(blobs[rel], p)
+        texts[p] = entry.raw
+        if entry.meta.get("id"):
+            idx[entry.meta["id"]] = entry
+    changed = sorted(root / r for r in staged_changes(root) if r in blobs)
+    return changed, texts, idx
@@ -16,19 +16,18 @@ import json
 from pathlib import Path
 from typing import List, Optional
 
+from ..constants import LOG_DIR
 from ..report import Report
 
 
 def _run_log_path(root: Path, fmt: str) -> Path:
     """
     Return a repo-root-relative path for today's run log in the chosen format.
-      - md    -> docs/adr-new/.adr/YYYY-MM-DD.md
-      - jsonl -> docs/adr-new/.adr/YYYY-MM-DD.jsonl
+      - md    -> logs/.adr/YYYY-MM-DD.md
+      - jsonl -> logs/.adr/YYYY-MM-DD.jsonl
     """
-    # FIXME: This log directory is defined in `engine.py` and this file:
-    #        e.g., engine.run(), services.telemetry._run_log_path()
     date_str = datetime.date.today().isoformat()
-    log_dir = root / "logs" / ".adr"
+    log_dir = root / LOG_DIR
     log_dir.mkdir(parents=True, exist_ok=True)
     ext = "md" if fmt == "md" else "jsonl"
     return log_dir / f"{date_str}.{ext}"
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/tracing.py
+
+"""
+Timeline spans for `theseus --trace out.json` (Chrome Trace Event format).
+
+Instrumented code calls span(name, cat, **args) around a unit of work;
+while no Tracer is active (the default) it returns a shared no-op context,
+so the hooks stay in place at the cost of one global lookup.
+
+Active tracing records complete ("X") events with microsecond timestamps.
+Each thread that records a span gets its own track (tid), named after the
+thread, so --threads runs show one row per worker. Open the file in
+chrome://tracing or https://ui.perfetto.dev.
+
+Categories used by the linter:
+ - phase: engine.run phases (discover, index, validate, post_run, report)
+ - io:    file reads (path)
+ - parse: front matter, structure scans, YAML blocks
+ - rule:  one per-file rule call (rule, path) or post-run rule (rule)
+ - graph: link / supersede graph builds
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_NULL = nullcontext()
+
+# The tracer spans record into; module-global so worker threads see it
+_ACTIVE: Optional["Tracer"] = None
+
+
+class Tracer:
+    """
+    Collects span events for one run; write() dumps them as JSON.
+    """
+
+    def __init__(self):
+        self._t0 = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._events: List[Dict[str, Any]] = []
+        # thread ident -> (tid, thread name); tid 0 is the first thread
+        self._tracks: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _tid(self) -> int:
+        ident = threading.get_ident()
+        track = self._tracks.get(ident)
+        if track is None:
+            with self._lock:
+                track = self._tracks.setdefault(
+                    ident,
+                    (len(self._tracks), threading.current_thread().name),
+                )
+        return track[0]
+
+    def _now(self) -> float:
+        return (time.perf_counter_ns() - self._t0) / 1000
+
+    @contextmanager
+    def span(self, name: str, cat: str, **args: Any) -> Iterator[None]:
+        tid = self._tid()
+        start = self._now()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now() - start,
+                "pid": self._pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            self._events.append(event)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """
+        Thread-name metadata events, then spans by start time.
+        """
+        names = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in sorted(self._tracks.values())
+        ]
+        return names + sorted(self._events, key=lambda e: e["ts"])
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def span(name: str, cat: str, **args: Any):
+    """
+    Context manager timing `name` on the active tracer (no-op otherwise).
+    """
+    tracer = _ACTIVE
+    if tracer is None:
+        return _NULL
+    return tracer.span(name, cat, **args)
+
+
+@contextmanager
+def tracing(tracer: Tracer) -> Iterator[Tracer]:
+    """
+    Make `tracer` the active tracer for the duration of the block.
+    """
+    global _ACTIVE
+    prev, _ACTIVE = _ACTIVE, tracer
+    try:
+        yield tracer
+    finally:
+        _ACTIVE = prev
@@ -5,6 +5,7 @@
 """
 Validator package exports.
 
-Execution order and wiring live in `tools.adr_linter.validators.registry`.
+Execution order and wiring live in `tools.adr_linter.validators.registry`;
+the static rule list (imported lazily) lives in `validators.manifest`.
 This module intentionally avoids defining a pipeline to prevent duplication.
 """
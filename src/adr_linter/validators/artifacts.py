@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/validators/artifacts.py
+
+"""
+Artifact declarations for validators and the per-class execution plan.
+
+Validators stay plain `fn(ctx, rpt)` callables; `@consumes(...)` records
+which parser / cross-file artifacts a rule reads. The registry turns the
+declarations of the rules that apply to a document class into an
+ArtifactPlan:
+
+ - artifacts no active rule declares are never requested (SectionData
+   computes them lazily, so they are simply never built);
+ - each artifact is computed at most once per document (memoized on the
+   SectionData / shared link graph);
+ - per-file artifacts are released right after their last consumer in
+   the plan, so large intermediates (exclusion ranges, section splits)
+   do not outlive the rules that need them.
+
+Manifest order stays authoritative (band order is pinned by the registry
+tests and findings are logged in emission order), so the plan schedules
+releases around that order rather than reordering rules.
+
+Undeclared rules are treated as meta/body-only. Reading an undeclared
+artifact still works (fail-open: it is computed on demand); the parity
+test in tests/adr_linter/registry keeps declarations honest.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Tuple
+
+# ---- Artifact names ---------------------------------------------------------
+
+# SectionData attributes (computed lazily by parser.structure)
+KEY_MARKERS = "key_markers"
+HEADINGS = "headings"
+ALIAS_HITS = "alias_hits"
+YAML_BLOCKS = "yaml_blocks"
+LLM_TAIL = "llm_tail"
+LLM_TAIL_BLOCK = "llm_tail_block"
+EXCLUSION_RANGES = "exclusion_ranges"
+SECTION_SPANS = "section_spans"
+SECTIONS_BY_KEY = "sections_by_key"
+HEADING_INDEX = "heading_index"
+
+# Cross-file artifacts (built once per run, shared by every document)
+LINK_GRAPH = "link_graph"
+EXTENDS_KEYS = "extends_keys"
+
+SECTION_ARTIFACTS: FrozenSet[str] = frozenset(
+    {
+        KEY_MARKERS,
+        HEADINGS,
+        ALIAS_HITS,
+        YAML_BLOCKS,
+        LLM_TAIL,
+        LLM_TAIL_BLOCK,
+        EXCLUSION_RANGES,
+        SECTION_SPANS,
+        SECTIONS_BY_KEY,
+        HEADING_INDEX,
+    }
+)
+CROSS_FILE_ARTIFACTS: FrozenSet[str] = frozenset({LINK_GRAPH, EXTENDS_KEYS})
+ALL_ARTIFACTS: FrozenSet[str] = SECTION_ARTIFACTS | CROSS_FILE_ARTIFACTS
+
+# artifact -> artifacts it is derived from
+ARTIFACT_DEPENDS: Dict[str, Tuple[str, ...]] = {
+    ALIAS_HITS: (HEADINGS,),
+    SECTIONS_BY_KEY: (SECTION_SPANS,),
+    HEADING_INDEX: (HEADINGS,),
+    EXTENDS_KEYS: (LINK_GRAPH,),
+}
+
+# Never released mid-plan: the extends resolver reads other documents' key
+# markers and overrides blocks, and the link graph lives for the whole run.
+SHARED_ARTIFACTS: FrozenSet[str] = frozenset(
+    {KEY_MARKERS, YAML_BLOCKS, LINK_GRAPH, EXTENDS_KEYS}
+)
+
+_ATTR = "__adr_artifacts__"
+
+
+def consumes(*artifacts: str) -> Callable[[Callable], Callable]:
+    """
+    Declare the artifacts a validator reads, e.g. `@consumes(LLM_TAIL)`.
+    """
+    unknown = set(artifacts) - ALL_ARTIFACTS
+    if unknown:
+        raise ValueError(f"Unknown artifact(s): {sorted(unknown)}")
+
+    def _decorate(fn: Callable) -> Callable:
+        setattr(fn, _ATTR, frozenset(artifacts))
+        return fn
+
+    return _decorate
+
+
+def _closure(names: FrozenSet[str]) -> FrozenSet[str]:
+    out = set(names)
+    stack = list(names)
+    while stack:
+        for dep in ARTIFACT_DEPENDS.get(stack.pop(), ()):
+            if dep not in out:
+                out.add(dep)
+                stack.append(dep)
+    return frozenset(out)
+
+
+def declared_artifacts(fn: Callable) -> FrozenSet[str]:
+    """
+    Artifacts a validator declared (as written, without dependencies).
+    """
+    return getattr(fn, _ATTR, frozenset())
+
+
+def artifacts_of(fn: Callable) -> FrozenSet[str]:
+    """
+    Artifacts a validator needs, including the ones they derive from.
+    """
+    return _closure(declared_artifacts(fn))
+
+
+# ---- Plan -------------------------------------------------------------------
+
+
+class ArtifactPlan(NamedTuple):
+    """
+    rules:          (code, fn) in manifest order, already policy-filtered
+    release_after:  per rule, the per-file artifacts whose last consumer
+                    is that rule
+    artifacts:      every artifact some rule in the plan needs
+    """
+
+    rules: Tuple[Tuple[str, Callable], ...]
+    release_after: Tuple[Tuple[str, ...], ...]
+    artifacts: FrozenSet[str]
+
+
+def build_plan(rules: List[Tuple[str, Callable]]) -> ArtifactPlan:
+    """
+    Build the artifact schedule for an ordered, already-filtered rule list.
+    """
+    last_use: Dict[str, int] = {}
+    needed: set = set()
+    for i, (_code, fn) in enumerate(rules):
+        for name in artifacts_of(fn):
+            needed.add(name)
+            last_use[name] = i
+
+    release: List[List[str]] = [[] for _ in rules]
+    for name, i in last_use.items():
+        if name in SECTION_ARTIFACTS and name not in SHARED_ARTIFACTS:
+            release[i].append(name)
+
+    return ArtifactPlan(
+        rules=tuple(rules),
+        release_after=tuple(tuple(sorted(r)) for r in release),
+        artifacts=frozenset(needed),
+    )
+
+
+def release_artifacts(section_data, names: Tuple[str, ...]) -> None:
+    """
+    Drop memoized artifacts from a lazily computed SectionData.
+
+    Only cached (lazy) attributes are dropped; an eagerly built SectionData
+    is left untouched. A later read recomputes instead of failing.
+    """
+    if not names:
+        return
+    cls = type(section_data)
+    state = getattr(section_data, "__dict__", None)
+    if state is None:
+        return
+    for name in names:
+        if isinstance(getattr(cls, name, None), cached_property):
+            state.pop(name, None)
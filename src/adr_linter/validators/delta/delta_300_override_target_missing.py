@@ -5,33 +5,36 @@
 """ADR-DELTA-300 — Override targets non-existent key in base.
 
 Ref: ADR-0001 §8 (Precedence) and §14 ADR-DELTA-300
-Behavior mirrors the legacy check in validate_links_enhanced().
+Behavior mirrors the legacy check in validate_links_enhanced(), except that
+the base's keys are its *effective* keys: a base that is itself a delta
+contributes the sections it inherits through its own `extends` chain.
 """
 
 from __future__ import annotations
 
 from ...constants import EXTENDS_RX
-from ...parser.structure import parse_document_structure
+from ...services.linkgraph import link_graph_for, parse_pin
+from ..artifacts import consumes, EXTENDS_KEYS, LINK_GRAPH, YAML_BLOCKS
 
 
+@consumes(EXTENDS_KEYS, LINK_GRAPH, YAML_BLOCKS)
 def validate_delta_300_override_target_missing(ctx, rpt) -> None:
     """
     Emit ADR-DELTA-300 for overrides of keys not present in the base ADR.
     """
     meta = ctx.meta
     path = ctx.path
-    all_idx = ctx.all_idx
     section_data = ctx.section_data
 
     ext = meta.get("extends")
     base = None
+    graph = link_graph_for(ctx)
 
     # print(f"\n- [VAL DELTA-300]: ext = {ext}")
     # print(f"\n- [VAL DELTA-300]: base = {base}")
 
     if ext and isinstance(ext, str) and EXTENDS_RX.match(ext):
-        base_id = ext.split("@")[0]
-        base = all_idx.get(base_id)
+        base = graph.resolve(ext)
 
     if not base:
         # print("\n- [VAL DELTA-300]: if not base -> returning")
@@ -63,8 +66,7 @@ def validate_delta_300_override_target_missing(ctx, rpt) -> None:
 
     # print(f"\n- [VAL DELTA-300]: overrides = {overrides}")
 
-    base_si = parse_document_structure(base["body"])
-    base_keys = {k for k, _, _ in base_si.key_markers}
+    base_keys = graph.extends.section_keys(parse_pin(ext)[0])
 
     for key in overrides.keys():
         if key not in base_keys:
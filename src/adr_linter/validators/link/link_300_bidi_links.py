@@ -17,51 +17,38 @@ Ref: ADR-0001 §10.1
 """
 from __future__ import annotations
 
-from typing import Iterable
+from ...services.linkgraph import (
+    iter_link_edges,
+    link_graph_for,
+)
+from ..artifacts import consumes, LINK_GRAPH
 
 _ERROR_CODE = "ADR-LINK-300"
 
 
-def _as_list(v) -> list[str]:
-    if v is None:
-        return []
-    if isinstance(v, str):
-        return [v]
-    if isinstance(v, Iterable):
-        return [str(x) for x in v]
-    return [str(v)]
-
-
-def _id_of(pin: str) -> str:
-    return pin.split("@", 1)[0] if "@" in pin else pin
-
-
-def _check_pair(ctx, rpt, field: str, reciprocal: str) -> None:
+def _check_pair(ctx, rpt, graph, field: str, reciprocal: str) -> None:
     meta = ctx.meta
     path = ctx.path
-    all_idx = ctx.all_idx
     src_id = meta.get("id")
 
-    for target in _as_list(meta.get(field)):
-        if not target:
-            continue
-        target_id = _id_of(target)
-        tinfo = all_idx.get(target_id)
-        if not tinfo:
-            rpt.add(_ERROR_CODE, path, f"unknown reciprocal target: {target}")
+    for edge in iter_link_edges(src_id, meta, (field,)):
+        if not graph.has_node(edge.target):
+            rpt.add(
+                _ERROR_CODE, path, f"unknown reciprocal target: {edge.raw}"
+            )
             continue
 
-        rvals = _as_list(tinfo["meta"].get(reciprocal))
-        rids = [_id_of(x) for x in rvals]
-        if src_id not in rids:
+        if not graph.has_edge(edge.target, reciprocal, src_id):
             rpt.add(
                 _ERROR_CODE,
                 path,
-                f"{src_id} {field} {target} but target lacks "
+                f"{src_id} {field} {edge.raw} but target lacks "
                 f"{reciprocal}={src_id}",
             )
 
 
+@consumes(LINK_GRAPH)
 def validate_link_300_bidi_links(ctx, rpt) -> None:
-    _check_pair(ctx, rpt, "supersedes", "superseded_by")
-    _check_pair(ctx, rpt, "informs", "informed_by")
+    graph = link_graph_for(ctx)
+    _check_pair(ctx, rpt, graph, "supersedes", "superseded_by")
+    _check_pair(ctx, rpt, graph, "informs", "informed_by")
@@ -19,6 +19,8 @@ from ...parser.structure import (
     map_heading_to_key,
     parse_document_structure,
 )
+from ...services.linkgraph import link_graph_for, parse_pin
+from ..artifacts import consumes, LINK_GRAPH, YAML_BLOCKS
 
 
 _ERROR_CODE = "ADR-LINK-302"
@@ -27,18 +29,18 @@ _ERROR_CODE = "ADR-LINK-302"
 # REVIEW: This validation depends on HEADINGS_TO_KEYS being complete
 # TODO: Verify all expected keys have corresponding heading patterns
 # REVIEW:  See also ADR-SCHEMA-003, 021 for similar REVIEW & TODO
+@consumes(LINK_GRAPH, YAML_BLOCKS)
 def validate_link_302_pointer_section_missing(ctx, rpt) -> None:
     meta = ctx.meta
     path = ctx.path
     section_data = ctx.section_data
-    idx = ctx.all_idx
 
     # Resolve base ADR from extends@pin
     ext = meta.get("extends")
     if not ext or "@" not in str(ext):
         return
-    base_id = str(ext).split("@", 1)[0]
-    base = idx.get(base_id)
+    base_id, _pin = parse_pin(ext)
+    base = link_graph_for(ctx).resolve(ext)
     if not base:
         return
 
@@ -63,7 +65,10 @@ def validate_link_302_pointer_section_missing(ctx, rpt) -> None:
         return
 
     # Build base section key set (markers first, then fallback via headings)
-    base_si = parse_document_structure(base["body"])
+    # Reuse the index entry's memoized structure when it carries one
+    base_si = base.get("section_data")
+    if base_si is None:
+        base_si = parse_document_structure(base["body"])
     base_keys = {k for k, _, _ in base_si.key_markers}
     if not base_keys:
         base_keys = set(
@@ -20,7 +20,13 @@ Ref: ADR-0001 §8 (regex), §10.2/§10.1 (where pins appear)
 from __future__ import annotations
 
 import datetime
-import re
+
+from ...constants.validation import (
+    ID_RX,
+    PIN_DATE_RX,
+    PIN_HEX_LOWER_RX,
+    PIN_HEX_UPPER_RX,
+)
 
 _ERROR_CODE = "ADR-LINK-303"
 
@@ -36,11 +42,6 @@ _FIELDS = (
     "informed_by",
 )
 
-_RX_ADR = re.compile(r"^ADR-\d{4}$")
-_RX_DATE = re.compile(r"^20\d{2}-\d{2}-\d{2}$")
-_RX_HEX_LO = re.compile(r"^[0-9a-f]{7,40}$")
-_RX_HEX_UP = re.compile(r"^[0-9A-F]{7,40}$")
-
 
 def _check_one(rpt, path, field: str, val: str) -> None:
     if "@" not in val:
@@ -51,11 +52,11 @@ def _check_one(rpt, path, field: str, val: str) -> None:
         rpt.add(_ERROR_CODE, path, f"malformed {field} format: {val}")
         return
 
-    if not _RX_ADR.match(adr):
+    if not ID_RX.match(adr):
         rpt.add(_ERROR_CODE, path, f"bad ADR format in {field}: {val}")
         return
 
-    if _RX_DATE.match(pin):
+    if PIN_DATE_RX.match(pin):
         try:
             datetime.date.fromisoformat(pin)
             return
@@ -63,9 +64,9 @@ def _check_one(rpt, path, field: str, val: str) -> None:
             rpt.add(_ERROR_CODE, path, f"invalid date in {field} pin: {val}")
             return
 
-    if _RX_HEX_LO.match(pin):
+    if PIN_HEX_LOWER_RX.match(pin):
         return
-    if _RX_HEX_UP.match(pin):
+    if PIN_HEX_UPPER_RX.match(pin):
         rpt.add(
             _ERROR_CODE,
             path,
@@ -10,33 +10,35 @@ Behavior mirrors the legacy implementation for normative-section pointers.
 from __future__ import annotations
 
 from ...constants import NORMATIVE_KEYS, EXTENDS_RX
-from ...parser.structure import parse_document_structure
+from ...services.linkgraph import link_graph_for, parse_pin
+from ..artifacts import consumes, EXTENDS_KEYS, LINK_GRAPH, YAML_BLOCKS
 
 
 _ERROR_CODE = "ADR-LINK-304"
 
 
+@consumes(EXTENDS_KEYS, LINK_GRAPH, YAML_BLOCKS)
 def validate_link_304_normative_ptr_missing(ctx, rpt) -> None:
     """
     Emit ADR-LINK-304 when ptr→<normative_key> is missing in base ADR.
     """
     meta = ctx.meta
     path = ctx.path
-    all_idx = ctx.all_idx
     section_data = ctx.section_data
 
     # TOREVIEW: Pins vs IDs: This code resolves the base by ID only
-    #           (split("@")[0]), ignoring the pin’s version/hash. That
-    #           means it checks against the current indexed body of the
-    #           base ADR, not the pinned snapshot.
+    #           (the pin is parsed but not consulted), ignoring the
+    #           pin’s version/hash. That means it checks against the
+    #           current indexed body of the base ADR, not the pinned
+    #           snapshot.
     # This behavior may diverge from strict “at-pin” validation implied by §8
     # if the base evolved.
 
     ext = meta.get("extends")
     base = None
+    graph = link_graph_for(ctx)
     if ext and isinstance(ext, str) and EXTENDS_RX.match(ext):
-        base_id = ext.split("@")[0]
-        base = all_idx.get(base_id)
+        base = graph.resolve(ext)
     if not base:
         return
 
@@ -60,9 +62,9 @@ def validate_link_304_normative_ptr_missing(ctx, rpt) -> None:
     if not ptr_map:
         return
 
-    # Determine which keys exist in the base ADR
-    base_section_data = parse_document_structure(base["body"])
-    base_keys = {k for k, _, _ in base_section_data.key_markers}
+    # Determine which keys exist in the base ADR (including keys the base
+    # inherits through its own `extends` chain)
+    base_keys = graph.extends.section_keys(parse_pin(ext)[0])
     if not base_keys:
         """
         Fallback via heading mapping already handled inside legacy parser if
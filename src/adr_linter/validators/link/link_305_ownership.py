@@ -15,10 +15,13 @@ from __future__ import annotations
 
 from typing import List
 
+from ...services.linkgraph import link_graph_for, parse_pin
+from ..artifacts import consumes, LINK_GRAPH
 
 _ERROR_CODE = "ADR-LINK-305"
 
 
+@consumes(LINK_GRAPH)
 def validate_link_305_ownership(ctx, rpt) -> None:
     """
     ADR-LINK-305: Missing references to governing ADRs
@@ -45,7 +48,6 @@ def validate_link_305_ownership(ctx, rpt) -> None:
 
     meta = ctx.meta
     path = ctx.path
-    all_idx = ctx.all_idx
 
     adr_class = meta.get("class")
     owners_ptr = meta.get("owners_ptr")
@@ -75,19 +77,17 @@ def validate_link_305_ownership(ctx, rpt) -> None:
     # Collect referenced ownership ADR ids
     ownership_refs: List[str] = []
     if extends:
-        base_id = (
-            extends.split("@")[0] if "@" in str(extends) else str(extends)
-        )
+        base_id, _pin = parse_pin(extends)
         if base_id.startswith("ADR-"):
             ownership_refs.append(base_id)
     if owners_ptr:
-        ownership_refs.append(str(owners_ptr))
+        ownership_refs.append(parse_pin(owners_ptr)[0])
 
     # Verify referenced ADRs exist
-    missing_refs: List[str] = []
-    for ref in ownership_refs:
-        if ref not in all_idx:
-            missing_refs.append(ref)
+    graph = link_graph_for(ctx)
+    missing_refs: List[str] = [
+        ref for ref in ownership_refs if not graph.has_node(ref)
+    ]
 
     # Report issues
     if missing_ownership:
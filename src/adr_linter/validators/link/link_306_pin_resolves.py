@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/validators/link/link_306_pin_resolves.py
+
+"""
+ADR-LINK-306 — Pin does not resolve in the repository's git history.
+
+Runs only when the engine hands the context a PinResolver (`--verify-pins`,
+services.pins); otherwise it is a no-op. Checks every pinned relationship
+value whose target is indexed and whose pin LINK-303 accepts:
+
+  - "{field} pin {value}: commit {pin} not found in this repository"
+  - "{field} pin {value}: {target} did not exist at {pin}"
+  - "{field} pin {value}: {target} was not committed yet on {pin}"
+
+Ref: ADR-0001 §8 (pins)
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from ...constants.validation import PIN_DATE_RX, PIN_HEX_LOWER_RX
+from ...services.linkgraph import iter_link_edges, link_graph_for
+from ...services.pins import NO_COMMIT, NOT_AT_COMMIT
+from ..artifacts import consumes, LINK_GRAPH
+
+_ERROR_CODE = "ADR-LINK-306"
+
+
+def _checkable(pin) -> bool:
+    # Unpinned or malformed pins are LINK-301 / LINK-303 findings
+    if not pin:
+        return False
+    if PIN_DATE_RX.match(pin):
+        try:
+            datetime.date.fromisoformat(pin)
+        except ValueError:
+            return False
+        return True
+    return bool(PIN_HEX_LOWER_RX.match(pin))
+
+
+@consumes(LINK_GRAPH)
+def validate_link_306_pin_resolves(ctx, rpt) -> None:
+    pins = ctx.pins
+    if pins is None:
+        return
+    graph = link_graph_for(ctx)
+    for edge in iter_link_edges(ctx.meta.get("id"), ctx.meta):
+        pin = edge.pin
+        if not _checkable(pin):
+            continue
+        target = graph.resolve(edge.raw)
+        if target is None:
+            continue  # unknown target: LINK-300/305
+        outcome = pins.check(pin, target["path"])
+        if outcome is None:
+            continue
+        prefix = f"{edge.field} pin {edge.raw}"
+        if outcome == NO_COMMIT:
+            detail = f"commit {pin} not found in this repository"
+        elif outcome == NOT_AT_COMMIT:
+            detail = f"{edge.target} did not exist at {pin}"
+        else:
+            detail = f"{edge.target} was not committed yet on {pin}"
+        rpt.add(_ERROR_CODE, ctx.path, f"{prefix}: {detail}")
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/validators/manifest.py
+
+"""
+Static rule manifest: ADR code -> (rule module, validator function).
+
+The registry reads rule codes and order from here without importing any
+validator module; a module is imported the first time a rule plan (or
+post-run) actually needs one of its rules. `theseus --help`, a run over a
+single document class, or a `codes=` restricted lint therefore only pay
+for the rules they execute.
+
+Module paths are relative to `adr_linter.validators`. Order is
+authoritative and pinned by tests/adr_linter/registry.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Callable, Dict, List, Tuple
+
+# (code, module, function) in execution order
+RuleRef = Tuple[str, str, str]
+
+RULES_PER_FILE: Tuple[RuleRef, ...] = (
+    # --- schema band (meta/front-matter) ---
+    (
+        "ADR-SCHEMA-001",
+        "schema.schema_001_required_meta",
+        "validate_schema_001_required_meta",
+    ),
+    (
+        "ADR-SCHEMA-002",
+        "schema.schema_002_class_value",
+        "validate_schema_002_class_value",
+    ),
+    (
+        "ADR-SCHEMA-003",
+        "schema.schema_003_keys_order",
+        "validate_schema_003_keys_order",
+    ),
+    (
+        "ADR-SCHEMA-004",
+        "schema.schema_004_status_field_requirements",
+        "validate_schema_004_status_field_requirements",
+    ),
+    (
+        "ADR-SCHEMA-005",
+        "schema.schema_005_date_format",
+        "validate_schema_005_date_format",
+    ),
+    (
+        "ADR-SCHEMA-006",
+        "schema.schema_006_governance_scope",
+        "validate_schema_006_governance_scope",
+    ),
+    (
+        "ADR-SCHEMA-007",
+        "schema.schema_007_owner_governed_by",
+        "validate_schema_007_owner_governed_by",
+    ),
+    (
+        "ADR-SCHEMA-008",
+        "schema.schema_008_invalid_scope_value",
+        "validate_schema_008_invalid_scope_value",
+    ),
+    (
+        "ADR-SCHEMA-009",
+        "schema.schema_009_class_forbidden_field",
+        "validate_schema_009_class_forbidden_field",
+    ),
+    (
+        "ADR-SCHEMA-010",
+        "schema.schema_010_governance_constraint_rules",
+        "validate_schema_010_governance_constraint_rules",
+    ),
+    (
+        "ADR-SCHEMA-011",
+        "schema.schema_011_owner_no_extends",
+        "validate_schema_011_owner_no_extends",
+    ),
+    (
+        "ADR-SCHEMA-012",
+        "schema.schema_012_non_owner_no_owners",
+        "validate_schema_012_non_owner_no_owners",
+    ),
+    (
+        "ADR-SCHEMA-013",
+        "schema.schema_013_non_owner_identify_ownership",
+        "validate_schema_013_non_owner_identify_ownership",
+    ),
+    (
+        "ADR-SCHEMA-014",
+        "schema.schema_014_invalid_relationship_combination",
+        "validate_schema_014_invalid_relationship_combination",
+    ),
+    (
+        "ADR-SCHEMA-015",
+        "schema.schema_015_governance_constraint_violation",
+        "validate_schema_015_governance_constraint_violation",
+    ),
+    (
+        "ADR-SCHEMA-016",
+        "schema.schema_016_decision_format",
+        "validate_schema_016_decision_format",
+    ),
+    # --- schema band (structure) ---
+    # TOREVIEW: Removing this rule due to the new governance controls
+    #           through new SCHEMA, GOVERN rules
+    # ("ADR-SCHEMA-021", "schema.tbd_schema_021_strategy_no_rollout", ...),
+    # --- link band (per-file) ---
+    (
+        "ADR-LINK-300",
+        "link.link_300_bidi_links",
+        "validate_link_300_bidi_links",
+    ),
+    (
+        "ADR-LINK-301",
+        "link.link_301_unidi_required_pin",
+        "validate_link_301_unidi_required_pin",
+    ),
+    (
+        "ADR-LINK-302",
+        "link.link_302_pointer_section_missing",
+        "validate_link_302_pointer_section_missing",
+    ),
+    (
+        "ADR-LINK-303",
+        "link.link_303_pin_format_any_field",
+        "validate_link_303_pin_format_any_field",
+    ),
+    (
+        "ADR-LINK-304",
+        "link.link_304_normative_ptr_missing",
+        "validate_link_304_normative_ptr_missing",
+    ),
+    (
+        "ADR-LINK-305",
+        "link.link_305_ownership",
+        "validate_link_305_ownership",
+    ),
+    (
+        "ADR-LINK-306",
+        "link.link_306_pin_resolves",
+        "validate_link_306_pin_resolves",
+    ),
+    # --- delta band (per-file) ---
+    (
+        "ADR-DELTA-300",
+        "delta.delta_300_override_target_missing",
+        "validate_delta_300_override_target_missing",
+    ),
+    # --- meta band (per-file) ---
+    (
+        "ADR-META-200",
+        "meta.meta_200_tail_missing",
+        "validate_meta_200_tail_missing",
+    ),
+    (
+        "ADR-META-201",
+        "meta.meta_201_tail_mismatch",
+        "validate_meta_201_tail_mismatch",
+    ),
+    (
+        "ADR-META-202",
+        "meta.meta_202_llm_tail_malformed",
+        "validate_meta_202_llm_tail_malformed",
+    ),
+    # --- norm band (per-file) ---
+    (
+        "ADR-NORM-101",
+        "norm.norm_101_rfc_outside_normative",
+        "validate_norm_101_rfc_outside_normative",
+    ),
+    (
+        "ADR-NORM-102",
+        "norm.norm_102_vague_terms_in_normative",
+        "validate_norm_102_vague_terms_in_normative",
+    ),
+    # --- template band (per-file) ---
+    (
+        "ADR-TEMPLATE-600",
+        "template.template_600_template_of_required",
+        "validate_template_600_template_of_required",
+    ),
+    (
+        "ADR-TEMPLATE-601",
+        "template.template_601_status_proposed",
+        "validate_template_601_status_proposed",
+    ),
+    (
+        "ADR-TEMPLATE-602",
+        "template.template_602_filename_template",
+        "validate_template_602_filename_template",
+    ),
+    (
+        "ADR-TEMPLATE-603",
+        "template.template_603_no_link_graph",
+        "validate_template_603_no_link_graph",
+    ),
+    (
+        "ADR-TEMPLATE-604",
+        "template.template_604_rfc_only_in_examples",
+        "validate_template_604_rfc_only_in_examples",
+    ),
+    (
+        "ADR-TEMPLATE-605",
+        "template.template_605_mirror_section_order",
+        "validate_template_605_mirror_section_order",
+    ),
+    (
+        "ADR-TEMPLATE-606",
+        "template.template_606_content_formatting",
+        "validate_template_606_content_formatting",
+    ),
+    (
+        "ADR-TEMPLATE-607",
+        "template.template_607_governance_constraint_rules",
+        "validate_template_607_governance_constraint_rules",
+    ),
+    (
+        "ADR-TEMPLATE-608",
+        "template.template_608_real_values_not_placeholders",
+        "validate_template_608_real_values_not_placeholders",
+    ),
+    (
+        "ADR-TEMPLATE-609",
+        "template.template_609_governance_real_values",
+        "validate_template_609_governance_real_values",
+    ),
+)
+
+RULES_POST_RUN: Tuple[RuleRef, ...] = (
+    (
+        "ADR-LINK-320",
+        "link.link_320_closure_info",
+        "validate_link_320_closure_info",
+    ),
+    (
+        "ADR-LINK-321",
+        "link.link_321_cycle_detected",
+        "validate_link_321_cycle_detected",
+    ),
+    (
+        "ADR-LINK-322",
+        "link.link_322_fork_no_rationale",
+        "validate_link_322_fork_no_rationale_for_meta",
+    ),
+)
+
+_RESOLVED: Dict[str, Callable] = {}
+
+
+def resolve(ref: RuleRef) -> Callable:
+    """
+    Import (once) and return the validator for a manifest entry.
+    """
+    code, module, name = ref
+    fn = _RESOLVED.get(code)
+    if fn is None:
+        mod = import_module(f"{__package__}.{module}")
+        fn = _RESOLVED[code] = getattr(mod, name)
+    return fn
+
+
+def resolve_all(refs: Tuple[RuleRef, ...]) -> List[Tuple[str, Callable]]:
+    """
+    (code, callable) pairs for every entry, importing as needed.
+    """
+    return [(ref[0], resolve(ref)) for ref in refs]
+
+
+def band_rules(band: str, refs: Tuple[RuleRef, ...]) -> List[Tuple]:
+    """
+    Resolved (code, callable) pairs of one band, e.g. band_rules("LINK", ...).
+    """
+    prefix = f"ADR-{band}-"
+    return resolve_all(tuple(r for r in refs if r[0].startswith(prefix)))
@@ -2,19 +2,21 @@
 # !/usr/bin/env python3
 # src/adr_linter/validators/meta/__init__.py
 
-from .meta_200_tail_missing import validate_meta_200_tail_missing
-from .meta_201_tail_mismatch import validate_meta_201_tail_mismatch
-from .meta_202_llm_tail_malformed import validate_meta_202_llm_tail_malformed
+"""
+META band. Rule modules are listed in validators.manifest and imported
+on first use; META_RULES_PER_FILE / META_RULES_POST_RUN resolve lazily.
+"""
 
+from ..manifest import RULES_PER_FILE, RULES_POST_RUN, band_rules
 
-# single source for registry
-META_RULES_PER_FILE = [
-    ("ADR-META-200", validate_meta_200_tail_missing),
-    ("ADR-META-201", validate_meta_201_tail_mismatch),
-    ("ADR-META-202", validate_meta_202_llm_tail_malformed),
-]
 
-META_RULES_POST_RUN = []
+def __getattr__(name: str):
+    if name == "META_RULES_PER_FILE":
+        return band_rules("META", RULES_PER_FILE)
+    if name == "META_RULES_POST_RUN":
+        return band_rules("META", RULES_POST_RUN)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "META_RULES_PER_FILE",
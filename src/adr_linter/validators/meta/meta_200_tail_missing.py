@@ -10,9 +10,12 @@ ADR-META-200 — `llm_tail` missing (optional).
 
 from __future__ import annotations
 
+from ..artifacts import consumes, LLM_TAIL
+
 _ERROR_CODE = "ADR-META-200"
 
 
+@consumes(LLM_TAIL)
 def validate_meta_200_tail_missing(ctx, rpt) -> None:
     if ctx.section_data.llm_tail is None:
         rpt.add(_ERROR_CODE, ctx.path, "llm_tail missing (optional)")
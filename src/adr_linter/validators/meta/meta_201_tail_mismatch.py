@@ -11,10 +11,12 @@ Ref: ADR-0001 §14 · ADR-META-201
 from __future__ import annotations
 
 from ...constants import LLM_TAIL_CORE_FIELDS
+from ..artifacts import consumes, LLM_TAIL
 
 _ERROR_CODE = "ADR-META-201"
 
 
+@consumes(LLM_TAIL)
 def validate_meta_201_tail_mismatch(ctx, rpt) -> None:
     tail = ctx.section_data.llm_tail
     if not tail:
@@ -17,8 +17,9 @@ VALIDATION SCOPE:
 
 ARCHITECTURAL CONTEXT:
 Parser extracts llm_tail block and attempts JSON parsing. When parsing
-fails, parser returns llm_tail=None. This validator detects the parsing
-failure and provides detailed syntax error feedback.
+fails, parser returns llm_tail=None and keeps the raw block text and JSON
+error in llm_tail_block. This validator reports that error in detail
+without re-scanning the body.
 
 VALIDATION TIMING:
 Should run before META-201 to catch JSON syntax errors that would break
@@ -29,18 +30,19 @@ Ref: ADR-0001 §12 (LLM tail), §14 (META-202)
 
 from __future__ import annotations
 import json
-import re
+from ..artifacts import consumes, LLM_TAIL, LLM_TAIL_BLOCK
 
 _ERROR_CODE = "ADR-META-202"
 
 
+@consumes(LLM_TAIL, LLM_TAIL_BLOCK)
 def validate_meta_202_llm_tail_malformed(ctx, rpt) -> None:
     """
     Validate llm_tail JSON syntax and structure.
 
     VALIDATION LOGIC:
     - Check if llm_tail block exists but parsing failed (llm_tail is None)
-    - Re-attempt JSON parsing with detailed error reporting
+    - Report the parser's JSON error for the block in detail
     - Validate JSON structure (must be object for metadata)
 
     ERROR REPORTING:
@@ -48,24 +50,14 @@ def validate_meta_202_llm_tail_malformed(ctx, rpt) -> None:
     rather than silent parsing failure.
     """
 
-    body = ctx.body if hasattr(ctx, "body") else ""
     llm_tail = ctx.section_data.llm_tail
 
-    # Single pattern that matches all llm_tail blocks
-    llm_tail_pattern = re.compile(
-        r"<!--\s*llm_tail:begin\s*-->"
-        r".*?```json\s*"
-        r"(?P<json>.*?)"  # Remove \r?\n requirement
-        r"\s*```"
-        r".*?<!--\s*llm_tail:end\s*-->",
-        re.DOTALL,
-    )
-
-    match = llm_tail_pattern.search(body)
-    if not match:
+    # Parser keeps the first block as written (raw text + JSON error)
+    block = ctx.section_data.llm_tail_block
+    if block is None:
         return  # No llm_tail block found - ignore completely
 
-    json_content = match.group("json").strip()
+    json_content = block["raw"]
 
     # Now analyze what we found
     if not json_content:
@@ -97,8 +89,9 @@ def validate_meta_202_llm_tail_malformed(ctx, rpt) -> None:
         rpt.add(_ERROR_CODE, ctx.path, "llm_tail JSON block is empty")
         return
 
-    try:
-        parsed = json.loads(json_content)
+    err = block["error"]
+    if err is None:
+        parsed = block["data"]
         # If we can parse it but parser couldn't, report the discrepancy
         if not isinstance(parsed, dict):
             rpt.add(
@@ -114,14 +107,14 @@ def validate_meta_202_llm_tail_malformed(ctx, rpt) -> None:
                 "llm_tail parsing discrepancy - validator parsed successfully "
                 "but parser failed",
             )
-    except json.JSONDecodeError as e:
+    elif isinstance(err, json.JSONDecodeError):
         # Provide detailed JSON syntax error
         rpt.add(
             _ERROR_CODE,
             ctx.path,
-            f"llm_tail malformed JSON: {e.msg} at line {e.lineno}, "
-            f"column {e.colno}",
+            f"llm_tail malformed JSON: {err.msg} at line {err.lineno}, "
+            f"column {err.colno}",
         )
-    except Exception as e:
+    else:
         # Catch other JSON-related errors
-        rpt.add(_ERROR_CODE, ctx.path, f"llm_tail JSON error: {str(e)}")
+        rpt.add(_ERROR_CODE, ctx.path, f"llm_tail JSON error: {str(err)}")
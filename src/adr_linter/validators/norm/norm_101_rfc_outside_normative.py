@@ -14,8 +14,10 @@ from __future__ import annotations
 from ...constants import RFC_2119_RX, NORMATIVE_KEYS
 
 from ...parser.structure import line_from_pos
+from ..artifacts import consumes, EXCLUSION_RANGES, HEADINGS, SECTION_SPANS
 
 
+@consumes(EXCLUSION_RANGES, HEADINGS, SECTION_SPANS)
 def validate_norm_101_rfc_outside_normative(ctx, rpt) -> None:
     """
     Emit ADR-NORM-101 for the first RFC-2119 keyword outside
@@ -38,11 +40,9 @@ def validate_norm_101_rfc_outside_normative(ctx, rpt) -> None:
     normative_exclusions = list(section_data.exclusion_ranges)
 
     # Exclude normative sections entirely from scanning.
-    for key, content in section_data.sections_by_key.items():
+    for key, span in section_data.section_spans.items():
         if key in NORMATIVE_KEYS:
-            start = body.find(content)
-            if start != -1:
-                normative_exclusions.append((start, start + len(content)))
+            normative_exclusions.append(span)
 
     # Build a scan mask where 1 = scan, 0 = skip.
     mask = bytearray(b"\x01") * len(body)
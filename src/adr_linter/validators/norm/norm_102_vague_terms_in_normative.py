@@ -79,8 +79,10 @@ from ...constants import (
     NORMATIVE_KEYS,
 )
 from ...parser.structure import line_from_pos
+from ..artifacts import consumes, SECTION_SPANS, SECTIONS_BY_KEY
 
 
+@consumes(SECTION_SPANS, SECTIONS_BY_KEY)
 def validate_norm_102_vague_terms_in_normative(ctx, rpt) -> None:
     """
     Emit ADR-NORM-102 for each vague term occurrence in normative sections.
@@ -112,13 +114,12 @@ def validate_norm_102_vague_terms_in_normative(ctx, rpt) -> None:
     path = ctx.path
     section_data = ctx.section_data
 
+    spans = section_data.section_spans
     for key, content in section_data.sections_by_key.items():
         if key not in NORMATIVE_KEYS:
             continue
 
-        start_in_body = body.find(content)
-        if start_in_body == -1:
-            continue
+        start_in_body = spans[key][0]
 
         # BASELINE: Simple pattern matching (extension point for enhancement)
         vm = VAGUE_TERMS_RX.search(content)
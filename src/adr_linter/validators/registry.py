@@ -6,10 +6,15 @@
 Registry that orchestrates validator execution.
 
 R1: Introduce declarative manifests (zero behavior change).
- - ORDERED_RULES_PER_FILE is the single source of truth for per-file order.
- - run_all(ctx, rpt) now iterates ORDERED_RULES_PER_FILE.
- - ORDERED_RULES_POST_RUN documents the post-run order; post_run() continues
-   to build graphs and call validators in that same order (no behavior change).
+ - validators.manifest is the single source of truth for per-file and
+   post-run order (static: code, module, function).
+ - run_all(ctx, rpt) iterates the class's plan, built from the manifest.
+ - post_run() builds graphs and calls validators in manifest order.
+ - Rule modules are imported lazily, when a plan first needs them.
+
+Artifact plans: per-file rules declare the artifacts they read via
+`validators.artifacts.consumes`; run_all executes the class's ArtifactPlan,
+which releases per-file artifacts after their last consumer.
 
 NOTE:
  - Applicability gating via policy (R2) is intentionally out-of-scope here.
@@ -23,7 +28,17 @@ from __future__ import annotations
 
 import os
 
-from typing import Callable, List, Set, Tuple  # Optional,
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # from ..constants import (
 #     EXTENDS_RX,
@@ -34,32 +49,21 @@ from typing import Callable, List, Set, Tuple  # Optional,
 from ..policy import (
     applies_to as _policy_applies_to,  # R2: policy-driven applicability
 )
-from ..services.linkgraph import build_supersede_graph
-
-# -------------------- Top-level imports for validators -----------------------
-
-# 1) SCHEMA (meta/front-matter)
-from .schema import SCHEMA_RULES_PER_FILE  # , SCHEMA_RULES_POST_RUN
-
-# 3) LINK (per-file)
-from .link import LINK_RULES_PER_FILE, LINK_RULES_POST_RUN
-
-# 4) DELTA (per-file)
-from .delta.delta_300_override_target_missing import (
-    validate_delta_300_override_target_missing,
+from ..services.linkgraph import build_link_graph, build_supersede_graph
+from ..tracing import span
+from .artifacts import (
+    CROSS_FILE_ARTIFACTS,
+    ArtifactPlan,
+    artifacts_of,
+    build_plan,
+    release_artifacts,
 )
 
-# 5) NORM / META
-from .norm.norm_101_rfc_outside_normative import (
-    validate_norm_101_rfc_outside_normative,
-)
-from .norm.norm_102_vague_terms_in_normative import (
-    validate_norm_102_vague_terms_in_normative,
-)
-from .meta import META_RULES_PER_FILE  # , LINK_RULES_POST_RUN
+# ------------- Validators: resolved lazily from the static manifest ----------
 
-# 6) TEMPLATE
-from .template import TEMPLATE_RULES_PER_FILE  # , TEMPLATE_RULES_POST_RUN
+# Rule modules are imported only when a plan (or post-run) first needs one
+# of their rules; see validators.manifest.
+from . import manifest as _manifest
 
 # -------------------- R2 diagnostics toggle (optional, no behavior change) ---
 
@@ -110,54 +114,91 @@ def _post_should_run(idx, code: str) -> bool:
 
 # --------- Declarative manifests (R1) ---------------------------------------
 
-# Each entry is (ADR code, callable). Order is authoritative.
-ORDERED_RULES_PER_FILE: List[Tuple[str, Callable]] = [
-    # --- schema band (meta/front-matter) ---
-    *SCHEMA_RULES_PER_FILE,
-    # --- schema band (structure) ---
-    # TOREVIEW: Removing this rule due to the new governance controls
-    #           through new SCHEMA, GOVERN rules
-    # ("ADR-SCHEMA-021", validate_schema_021_strategy_no_rollout),
-    # --- link band (per-file) ---
-    *LINK_RULES_PER_FILE,
-    # --- delta band (per-file) ---
-    ("ADR-DELTA-300", validate_delta_300_override_target_missing),
-    # --- meta band (per-file) ---
-    *META_RULES_PER_FILE,
-    # --- norm band (per-file) ---
-    ("ADR-NORM-101", validate_norm_101_rfc_outside_normative),
-    ("ADR-NORM-102", validate_norm_102_vague_terms_in_normative),
-    # --- template band (per-file) ---
-    *TEMPLATE_RULES_PER_FILE,
-]
-
-# Order documentation for post-run. Execution still builds graphs below.
-
-ORDERED_RULES_POST_RUN_PER_FILE: List[Tuple[str, Callable]] = [
-    # ("ADR-LINK-320", validate_link_320_closure_info),
-    # ("ADR-LINK-321", validate_link_321_cycle_detected),
-    # ("ADR-LINK-322", validate_link_322_fork_no_rationale_for_meta),
-    *LINK_RULES_POST_RUN,
-]
+# Each entry is (ADR code, module, function); order is authoritative. The
+# (code, callable) views ORDERED_RULES_PER_FILE and
+# ORDERED_RULES_POST_RUN_PER_FILE import every rule module on first access
+# (tests / tooling only; the runtime path resolves per plan).
+_MANIFEST_PER_FILE = _manifest.RULES_PER_FILE
+_MANIFEST_POST_RUN = _manifest.RULES_POST_RUN
+
+_EAGER_VIEWS = {
+    "ORDERED_RULES_PER_FILE": _MANIFEST_PER_FILE,
+    "ORDERED_RULES_POST_RUN_PER_FILE": _MANIFEST_POST_RUN,
+}
+
+
+def __getattr__(name: str) -> List[Tuple[str, Callable]]:
+    refs = _EAGER_VIEWS.get(name)
+    if refs is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _manifest.resolve_all(refs)
+
+
+# --------- Artifact plans (per document class) -------------------------------
+
+# Policy applicability only depends on the class, so the filtered rule list
+# and its artifact schedule are built once per (class, rule selection).
+_PLANS: Dict[
+    Tuple[Optional[str], Optional[FrozenSet[str]]], ArtifactPlan
+] = {}
+
+
+def plan_for(
+    doc_class: Optional[str], codes: Optional[Iterable[str]] = None
+) -> ArtifactPlan:
+    """
+    Policy-filtered rules for a document class plus their artifact schedule.
+
+    `codes` optionally restricts the plan to a subset of rule codes.
+    """
+    cls = doc_class if isinstance(doc_class, str) else None
+    selected = frozenset(codes) if codes is not None else None
+    key = (cls, selected)
+    plan = _PLANS.get(key)
+    if plan is None:
+        rules = [
+            (ref[0], _manifest.resolve(ref))
+            for ref in _MANIFEST_PER_FILE
+            if (selected is None or ref[0] in selected)
+            and _should_run(cls, ref[0])
+        ]
+        plan = _PLANS[key] = build_plan(rules)
+    return plan
 
 
 # --------- Public API --------------------------------------------------------
 
 
-def run_all(ctx, rpt) -> None:
+def run_all(
+    ctx,
+    rpt,
+    codes: Optional[Iterable[str]] = None,
+    precomputed: Optional[Mapping[str, List]] = None,
+) -> None:
     """
     Run per-file validators in the established order (manifest-driven).
+
+    Rules run from the class's ArtifactPlan: per-file artifacts are dropped
+    from ctx.section_data once their last consumer has run. `codes`
+    optionally restricts the run to a subset of rule codes.
+
+    `precomputed` maps codes already evaluated for this document (the bulk
+    SCHEMA passes, validators.schema.bulk) to their findings; those are
+    replayed at the rule's position in the plan instead of calling it.
     """
 
     doc_class = ctx.meta.get("class")
-    attempted = 0
-    skipped = 0
-    for _code, fn in ORDERED_RULES_PER_FILE:
-        attempted += 1
-        if _should_run(doc_class, _code):
-            fn(ctx, rpt)
+    plan = plan_for(doc_class, codes)
+    attempted = len(_MANIFEST_PER_FILE)
+    skipped = attempted - len(plan.rules)
+    path = str(ctx.path)
+    for (_code, fn), release in zip(plan.rules, plan.release_after):
+        if precomputed is not None and _code in precomputed:
+            rpt.items.extend(precomputed[_code])
         else:
-            skipped += 1
+            with span(_code, "rule", rule=_code, path=path):
+                fn(ctx, rpt)
+        release_artifacts(ctx.section_data, release)
 
     # Optional diagnostics (off by default). Set ADR_REGISTRY_DIAG=1 to see it.
     if os.getenv("ADR_REGISTRY_DIAG") == "1":
@@ -168,14 +209,20 @@ def run_all(ctx, rpt) -> None:
         )
 
 
-def post_run(idx, rpt) -> None:
+def post_run(
+    idx, rpt, link_graph=None, codes: Optional[Iterable[str]] = None
+) -> None:
     """
     Run cross-file validations after per-file checks.
 
-    Order matches ORDERED_RULES_POST_RUN. We still construct the graphs
-    here because these callsites require them.
+    Order matches the post-run manifest. The supersede views are projected
+    from the run's typed link graph (built here if the caller has none).
+    `codes` optionally restricts the run to a subset of rule codes.
     """
-    graph, reverse_graph = build_supersede_graph(idx)
+    with span("supersede_graph", "graph"):
+        if link_graph is None:
+            link_graph = build_link_graph(idx)
+        graph, reverse_graph = build_supersede_graph(idx, link_graph)
 
     # R2: apply policy gating to post-run as well. A post-run code executes if
     # it applies to *any* class present in this run. (Current policy makes
@@ -191,29 +238,47 @@ def post_run(idx, rpt) -> None:
         classes_present.add(info["meta"].get("class"))
     """
 
-    for _code, fn in ORDERED_RULES_POST_RUN_PER_FILE:
+    selected = frozenset(codes) if codes is not None else None
+    for ref in _MANIFEST_POST_RUN:
+        _code = ref[0]
+        if selected is not None and _code not in selected:
+            continue
         if not _post_should_run(idx, _code):
             continue
+        fn = _manifest.resolve(ref)
 
-        if _code == "ADR-LINK-320":
-            # ADR-0001 §10.4, §14
-            fn(reverse_graph, idx, rpt)
-        elif _code == "ADR-LINK-321":
-            # ADR-0001 §10.4, §14
-            fn(graph, idx, rpt)
-        elif _code == "ADR-LINK-322":
-            # ADR-0001 §10.4, §14
-            for _sid, info in idx.items():
-                fn(info["meta"], info["path"], rpt)
+        with span(_code, "rule", rule=_code):
+            if _code == "ADR-LINK-320":
+                # ADR-0001 §10.4, §14
+                fn(reverse_graph, idx, rpt)
+            elif _code == "ADR-LINK-321":
+                # ADR-0001 §10.4, §14
+                fn(graph, idx, rpt)
+            elif _code == "ADR-LINK-322":
+                # ADR-0001 §10.4, §14
+                for _sid, info in idx.items():
+                    fn(info["meta"], info["path"], rpt)
 
 
 # --------- Manifest accessors (for tests / tooling) --------------------------
 def manifest_codes_per_file() -> List[str]:
-    return [code for code, _ in ORDERED_RULES_PER_FILE]
+    return [ref[0] for ref in _MANIFEST_PER_FILE]
+
+
+def manifest_codes_cross_file() -> List[str]:
+    """
+    Per-file codes whose result depends on other documents (they declare a
+    cross-file artifact such as the link graph).
+    """
+    return [
+        ref[0]
+        for ref in _MANIFEST_PER_FILE
+        if artifacts_of(_manifest.resolve(ref)) & CROSS_FILE_ARTIFACTS
+    ]
 
 
 def manifest_codes_post_run() -> List[str]:
-    return [code for code, _ in ORDERED_RULES_POST_RUN_PER_FILE]
+    return [ref[0] for ref in _MANIFEST_POST_RUN]
 
 
 def manifest_codes_all() -> List[str]:
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# src/adr_linter/validators/schema/bulk.py
+
+"""
+Bulk SCHEMA passes over a column-oriented front-matter table.
+
+SCHEMA-001/002/004/005/009/011/012 only read front matter. Instead of
+running them once per document, the engine assembles the run's front
+matter into a FrontMatterTable (one list per key, row i = paths[i]) and
+run_bulk() evaluates each rule as a pass over the columns it reads. Value
+checks (date parsing, class and status membership) are memoized per run,
+so the dates, classes and statuses repeated across a corpus are checked
+once each.
+
+Findings are scattered back per row as {code: [Finding, ...]}; the
+registry replays them in the document's plan order (run_all(...,
+precomputed=...)), so reports, policy gating and emission order match the
+per-file rules, which remain the reference implementation.
+
+Ref: ADR-0001 §(Missing) · (If needed, ADR-*-* is missing)
+"""
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from ...constants import (
+    CLASS_FORBIDDEN_RELATIONSHIPS,
+    DATE_KEY_NAMES,
+    ID_RX,
+    REQUIRED_META,
+    VALID_ADR_CLASSES,
+)
+from ...report import Finding, Report
+
+
+class FrontMatterTable:
+    """
+    Front matter of many documents stored column-wise: one list per key,
+    None where a document lacks the key (rules read meta.get(key)).
+    """
+
+    __slots__ = ("paths", "columns", "_absent")
+
+    def __init__(
+        self, paths: Sequence[Path], metas: Sequence[Mapping[str, Any]]
+    ):
+        self.paths = list(paths)
+        keys = set()
+        for meta in metas:
+            keys.update(meta)
+        self.columns: Dict[str, List[Any]] = {
+            k: [meta.get(k) for meta in metas] for k in keys
+        }
+        self._absent: List[Any] = [None] * len(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def column(self, key: str) -> List[Any]:
+        return self.columns.get(key, self._absent)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """
+        Row i as a meta dict (keys the document did not set are omitted).
+        """
+        return {
+            k: col[i] for k, col in self.columns.items() if col[i] is not None
+        }
+
+
+def _memo(fn: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    Per-run memo keyed by (type, value): 1, 1.0 and True hash alike but
+    print differently. Unhashable YAML values (lists, mappings) bypass it.
+    """
+    cache: Dict[Any, Any] = {}
+
+    def call(v):
+        try:
+            key = (type(v), v)
+            if key in cache:
+                return cache[key]
+        except TypeError:
+            return fn(v)
+        out = cache[key] = fn(v)
+        return out
+
+    return call
+
+
+class _Scatter(Report):
+    """
+    Report whose findings are filed under their table row and code.
+    """
+
+    def __init__(self, table: FrontMatterTable, codes: Iterable[str]):
+        super().__init__()
+        self.paths = table.paths
+        self.rows: List[Dict[str, List[Finding]]] = [
+            {code: [] for code in codes} for _ in table.paths
+        ]
+
+    def add_row(self, i: int, code: str, context: str = None) -> None:
+        self.add(code, self.paths[i], context)
+        self.rows[i][code].append(self.items.pop())
+
+
+# --------- Passes (same messages and order as the per-file rules) -----------
+
+
+def _schema_001(table: FrontMatterTable, out: _Scatter) -> None:
+    code = "ADR-SCHEMA-001"
+    missing: List[List[str]] = [[] for _ in range(len(table))]
+    for k in REQUIRED_META:
+        for i, v in enumerate(table.column(k)):
+            if not v:
+                missing[i].append(k)
+
+    bad_id = _memo(lambda v: not ID_RX.match(str(v)))
+    for i, v in enumerate(table.column("id")):
+        if missing[i]:
+            out.add_row(i, code, f"missing: {', '.join(missing[i])}")
+        if bad_id(v):
+            out.add_row(i, code, "id must be ADR-XXXX")
+
+
+def _schema_002(table: FrontMatterTable, out: _Scatter) -> None:
+    code = "ADR-SCHEMA-002"
+    valid = _memo(lambda v: v in VALID_ADR_CLASSES)
+    for i, v in enumerate(table.column("class")):
+        if not valid(v):
+            out.add_row(i, code, f"class={v}")
+
+
+def _schema_004(table: FrontMatterTable, out: _Scatter) -> None:
+    # Cross-field lifecycle logic: a row pass over the columns it reads,
+    # with date parsing memoized and "today" fixed for the run.
+    from .schema_004_status_field_requirements import (
+        parse_date,
+        status_field_violations,
+    )
+
+    code = "ADR-SCHEMA-004"
+    parse = _memo(parse_date)
+    today = datetime.date.today()
+    for i in range(len(table)):
+        meta = table.row(i)
+        for violation in status_field_violations(meta, None, parse, today):
+            out.add_row(i, code, violation)
+
+
+def _iso_date_ok(v) -> bool:
+    try:
+        datetime.date.fromisoformat(str(v))
+        return True
+    except Exception:
+        return False
+
+
+def _schema_005(table: FrontMatterTable, out: _Scatter) -> None:
+    from .schema_005_date_format import _is_valid_iso_date_like
+
+    code = "ADR-SCHEMA-005"
+    date_like = _memo(_is_valid_iso_date_like)
+    iso_ok = _memo(_iso_date_ok)
+
+    # First pass (with explicit '(got: ...)' detail), then the plain one
+    for k in DATE_KEY_NAMES:
+        for i, v in enumerate(table.column(k)):
+            if v and not date_like(v):
+                out.add_row(i, code, f"{k} must be YYYY-MM-DD (got: {v})")
+    for k in DATE_KEY_NAMES:
+        for i, v in enumerate(table.column(k)):
+            if v and not iso_ok(v):
+                out.add_row(i, code, f"{k} must be YYYY-MM-DD")
+
+
+def _present(v) -> bool:
+    return bool(v) and v not in ("", "null", "Null")
+
+
+def _schema_009(table: FrontMatterTable, out: _Scatter) -> None:
+    code = "ADR-SCHEMA-009"
+    for i, cls in enumerate(table.column("class")):
+        if not cls or cls not in CLASS_FORBIDDEN_RELATIONSHIPS:
+            continue
+        for field in CLASS_FORBIDDEN_RELATIONSHIPS[cls]:
+            if _present(table.column(field)[i]):
+                out.add_row(i, code, f"{cls} ADR cannot use '{field}' field")
+
+
+def _schema_011(table: FrontMatterTable, out: _Scatter) -> None:
+    code = "ADR-SCHEMA-011"
+    extends = table.column("extends")
+    for i, cls in enumerate(table.column("class")):
+        if cls == "owner" and extends[i] not in (None, "", "null", "Null"):
+            out.add_row(i, code)
+
+
+def _schema_012(table: FrontMatterTable, out: _Scatter) -> None:
+    code = "ADR-SCHEMA-012"
+    owners = table.column("owners")
+    for i, cls in enumerate(table.column("class")):
+        if cls not in ("owner", "style-guide") and owners[i]:
+            out.add_row(i, code)
+
+
+BULK_PASSES: Dict[str, Callable[[FrontMatterTable, _Scatter], None]] = {
+    "ADR-SCHEMA-001": _schema_001,
+    "ADR-SCHEMA-002": _schema_002,
+    "ADR-SCHEMA-004": _schema_004,
+    "ADR-SCHEMA-005": _schema_005,
+    "ADR-SCHEMA-009": _schema_009,
+    "ADR-SCHEMA-011": _schema_011,
+    "ADR-SCHEMA-012": _schema_012,
+}
+
+
+def run_bulk(
+    table: FrontMatterTable, codes: Optional[Iterable[str]] = None
+) -> List[Dict[str, List[Finding]]]:
+    """
+    Run the bulk passes (optionally only `codes`) and return, per table
+    row, {code: findings} for every code that ran.
+    """
+    wanted = frozenset(codes) if codes is not None else None
+    selected = [c for c in BULK_PASSES if wanted is None or c in wanted]
+    out = _Scatter(table, selected)
+    for code in selected:
+        BULK_PASSES[code](table, out)
+    return out.rows
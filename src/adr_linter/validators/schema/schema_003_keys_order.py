@@ -19,10 +19,11 @@ from __future__ import annotations
 
 # import re
 
-from ...parser.structure import expected_keys_for
 from ...constants import (
+    section_schema,
     validate_section_headers,
 )
+from ..artifacts import consumes, HEADING_INDEX, KEY_MARKERS
 
 _ERROR_CODE = "ADR-SCHEMA-003"
 
@@ -31,12 +32,13 @@ _ERROR_CODE = "ADR-SCHEMA-003"
 
 # BLOCKER: Tests missing governance class validation entirely
 # FIXME: No test coverage for governance template validation
-# TODO: Verify expected_keys_for() supports all 6 classes from
+# TODO: Verify section_schema() supports all 6 classes from
 #       VALID_ADR_CLASSES
 # REVIEW: Test hardcodes owner keys count - should derive from canonical
 #         structure
 
 
+@consumes(HEADING_INDEX, KEY_MARKERS)
 def validate_schema_003_keys_order(ctx, rpt) -> None:
     """
     ADR-SCHEMA-003 — Canonical section keys missing or out of order.
@@ -51,7 +53,8 @@ def validate_schema_003_keys_order(ctx, rpt) -> None:
     cls = meta.get("class", "")
     template_of = meta.get("template_of")
     found_keys = [k for k, _, _ in si.key_markers]
-    expected = expected_keys_for(cls, template_of)
+    schema = section_schema(cls, template_of=template_of)
+    expected = schema.keys
 
     # Early exit if no validation needed
     if not expected:
@@ -82,7 +85,7 @@ def validate_schema_003_keys_order(ctx, rpt) -> None:
         )
 
     # 2. Check for missing sections
-    missing = [k for k in expected if k not in found_keys]
+    missing = [k for k in expected if k not in seen_keys]
     if missing:
         rpt.add(
             _ERROR_CODE,
@@ -114,7 +117,7 @@ def validate_schema_003_keys_order(ctx, rpt) -> None:
                 seen_for_order.add(key)
 
         # Check if order matches expected
-        order_correct = unique_found_keys == expected
+        order_correct = tuple(unique_found_keys) == expected
 
         if not order_correct:
             rpt.add(
@@ -69,16 +69,24 @@ def parse_date(date_str):
 #           can be used reliably across the entire application?
 
 
-def validate_date_logic_consistency(meta: dict, path) -> list[str]:
-    """Validate date-related consistency for status lifecycle."""
+def validate_date_logic_consistency(
+    meta: dict, path, parse=parse_date, today=None
+) -> list[str]:
+    """
+    Validate date-related consistency for status lifecycle.
+
+    `parse` and `today` let bulk callers pass a memoized parse_date and one
+    run-wide date (validators.schema.bulk).
+    """
     violations = []
     status = meta.get("status")
     review_by = meta.get("review_by")
     edit_date = meta.get("date")
 
-    review_date = parse_date(review_by) if review_by else None
-    adr_date = parse_date(edit_date) if edit_date else None
-    today = date_obj.today()
+    review_date = parse(review_by) if review_by else None
+    adr_date = parse(edit_date) if edit_date else None
+    if today is None:
+        today = date_obj.today()
 
     # Status-specific review_by validation
     if status in ["Deprecated", "Superseded"]:
@@ -179,37 +187,31 @@ def validate_status_lifecycle_consistency(meta: dict, path) -> list[str]:
     return violations
 
 
-def validate_schema_004_status_field_requirements(ctx, rpt) -> None:
+def status_field_violations(
+    meta: dict, path=None, parse=parse_date, today=None
+) -> list[str]:
     """
-    ADR-SCHEMA-004 — Status field requirements and lifecycle
-    consistency validation.
-
-    Validates status-dependent field requirements and internal
-    consistency.
+    SCHEMA-004 messages for one front matter, in report order. Shared by
+    the per-file rule and the bulk pass (validators.schema.bulk).
     """
-    meta = ctx.meta
-    path = ctx.path
-
     status = meta.get("status")
 
     # Validate status is a valid value
     if status and status not in VALID_STATUS_TRANSITIONS:
-        rpt.add(
-            _ERROR_CODE,
-            path,
+        # Skip further validation if status is invalid
+        return [
             f"invalid status '{status}' - must be one of: "
-            f"{', '.join(VALID_STATUS_TRANSITIONS.keys())}",
-        )
-        return  # Skip further validation if status is invalid
+            f"{', '.join(VALID_STATUS_TRANSITIONS.keys())}"
+        ]
+
+    violations = []
 
     # Phase 1: Status-specific field requirements
     if status == "Superseded":
         superseded_by = meta.get("superseded_by")
         if not superseded_by or superseded_by in (None, "", "null"):
-            rpt.add(
-                _ERROR_CODE,
-                path,
-                "Superseded status requires non-empty 'superseded_by' field",
+            violations.append(
+                "Superseded status requires non-empty 'superseded_by' field"
             )
 
     elif status == "Deprecated":
@@ -229,11 +231,9 @@ def validate_schema_004_status_field_requirements(ctx, rpt) -> None:
         )
 
         if not (has_superseded_by or has_change_history):
-            rpt.add(
-                _ERROR_CODE,
-                path,
+            violations.append(
                 "Deprecated status requires justification via 'superseded_by' "
-                "field or 'change_history' entries",
+                "field or 'change_history' entries"
             )
 
     # Remove pin format validation - handled by LINK-303
@@ -241,11 +241,20 @@ def validate_schema_004_status_field_requirements(ctx, rpt) -> None:
     #  validators)
 
     # Phase 2: Status-lifecycle internal consistency validation
-    lifecycle_violations = validate_status_lifecycle_consistency(meta, path)
-    for violation in lifecycle_violations:
-        rpt.add(_ERROR_CODE, path, violation)
+    violations += validate_status_lifecycle_consistency(meta, path)
 
     # Phase 2: Date logic consistency validation
-    date_violations = validate_date_logic_consistency(meta, path)
-    for violation in date_violations:
-        rpt.add(_ERROR_CODE, path, violation)
+    violations += validate_date_logic_consistency(meta, path, parse, today)
+    return violations
+
+
+def validate_schema_004_status_field_requirements(ctx, rpt) -> None:
+    """
+    ADR-SCHEMA-004 — Status field requirements and lifecycle
+    consistency validation.
+
+    Validates status-dependent field requirements and internal
+    consistency.
+    """
+    for violation in status_field_violations(ctx.meta, ctx.path):
+        rpt.add(_ERROR_CODE, ctx.path, violation)
@@ -35,10 +35,13 @@ Ref: ADR-0001 §0.4 (Machine Constraints), §4 (Governance sections),
 
 from __future__ import annotations
 
+from ..artifacts import consumes, SECTIONS_BY_KEY
+
 
 _ERROR_CODE = "ADR-SCHEMA-010"
 
 
+@consumes(SECTIONS_BY_KEY)
 def validate_schema_010_governance_constraint_rules(ctx, rpt) -> None:
     """
     Validate governance ADRs have required constraint_rules section.
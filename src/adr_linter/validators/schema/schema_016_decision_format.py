@@ -3,20 +3,23 @@
 # src/adr_linter/validators/schema/schema_016_decision_format.py
 
 from __future__ import annotations
-import re
 
 # Import centralized format validation from TEMPLATE-606
 # from ...template.template_606_content_formatting import (
 from ...constants import (
     DECISION_ONE_LINER_PATTERN_RX,
-    DECISION_ONE_LINER_KEY_PATTERN_RX,
+    MARKDOWN_HEADER_LINE_RX,
+    has_placeholder_content,
     is_single_statement,
+    strip_html_comments,
 )
+from ..artifacts import consumes, SECTIONS_BY_KEY
 
 
 _ERROR_CODE = "ADR-SCHEMA-016"
 
 
+@consumes(SECTIONS_BY_KEY)
 def validate_schema_016_decision_format(ctx, rpt) -> None:
     """
     ADR-SCHEMA-016 — Content formatting matches documented format.
@@ -35,18 +38,16 @@ def validate_schema_016_decision_format(ctx, rpt) -> None:
         return  # Style-guide exempt from canonical sections per ADR-0001 §7.4
 
     # Find decision_one_liner section - reuse section extraction logic
-    match = DECISION_ONE_LINER_KEY_PATTERN_RX.search(ctx.body)
-    if not match:
+    decision_section = ctx.section_data.sections_by_key.get(
+        "decision_one_liner"
+    )
+    if decision_section is None:
         return  # Let other validators handle missing sections
 
-    decision_section = match.group(1).strip()
-
     # Remove HTML comments and markdown syntax for content analysis
-    clean_content = re.sub(
-        r"<!--.*?-->", "", decision_section, flags=re.DOTALL
-    )
+    clean_content = strip_html_comments(decision_section.strip())
     # Remove ENTIRE header line
-    clean_content = re.sub(r"^#+\s*.*$", "", clean_content, flags=re.MULTILINE)
+    clean_content = MARKDOWN_HEADER_LINE_RX.sub("", clean_content)
     clean_content = clean_content.strip()
 
     if not clean_content:
@@ -57,13 +58,8 @@ def validate_schema_016_decision_format(ctx, rpt) -> None:
     is_single = is_single_statement(clean_content)
 
     # Real ADRs should have actual content, not placeholder patterns
-    has_placeholder_content = any(
-        [
-            re.search(r"<[^>]+>", clean_content),  # <angle brackets>
-            re.search(r"\{[^}]+\}", clean_content),  # {curly brackets}
-            re.search(r"\[[^\]]+\]", clean_content),  # [square brackets]
-        ]
-    )
+    # (<angle>, {curly}, [square] brackets)
+    has_placeholders = has_placeholder_content(clean_content)
 
     # print(f"- [D VAL: SCHEMA-016] clean_content: {clean_content}")
     # print(
@@ -72,17 +68,17 @@ def validate_schema_016_decision_format(ctx, rpt) -> None:
     # )
     # print(f"- [D VAL: SCHEMA-016] is_single: {is_single}")
     # print(
-    #     "- [D VAL: SCHEMA-016] has_placeholder_content: "
-    #     f"{has_placeholder_content}"
+    #     "- [D VAL: SCHEMA-016] has_placeholders: "
+    #     f"{has_placeholders}"
     # )
 
-    if not has_correct_structure or not is_single or has_placeholder_content:
+    if not has_correct_structure or not is_single or has_placeholders:
         error_details = []
         if not has_correct_structure:
             error_details.append("incorrect structure")
         if not is_single:
             error_details.append("multiple sentences")
-        if has_placeholder_content:
+        if has_placeholders:
             error_details.append("contains placeholders")
 
         rpt.add(
@@ -2,50 +2,21 @@
 # !/usr/bin/env python3
 # src/adr_linter/validators/template/__init__.py
 
-from .template_600_template_of_required import (
-    validate_template_600_template_of_required,
-)
-from .template_601_status_proposed import (
-    validate_template_601_status_proposed,
-)
-from .template_602_filename_template import (
-    validate_template_602_filename_template,
-)
-from .template_603_no_link_graph import validate_template_603_no_link_graph
-from .template_604_rfc_only_in_examples import (
-    validate_template_604_rfc_only_in_examples,
-)
-from .template_605_mirror_section_order import (
-    validate_template_605_mirror_section_order,
-)
-from .template_606_content_formatting import (
-    validate_template_606_content_formatting,
-)
-from .template_607_governance_constraint_rules import (
-    validate_template_607_governance_constraint_rules,
-)
-from .template_608_real_values_not_placeholders import (
-    validate_template_608_real_values_not_placeholders,
-)
-from .template_609_governance_real_values import (
-    validate_template_609_governance_real_values,
-)
+"""
+TEMPLATE band. Rule modules are listed in validators.manifest and imported
+on first use; TEMPLATE_RULES_PER_FILE / TEMPLATE_RULES_POST_RUN resolve lazily.
+"""
 
-# single source for registry
-TEMPLATE_RULES_PER_FILE = [
-    ("ADR-TEMPLATE-600", validate_template_600_template_of_required),
-    ("ADR-TEMPLATE-601", validate_template_601_status_proposed),
-    ("ADR-TEMPLATE-602", validate_template_602_filename_template),
-    ("ADR-TEMPLATE-603", validate_template_603_no_link_graph),
-    ("ADR-TEMPLATE-604", validate_template_604_rfc_only_in_examples),
-    ("ADR-TEMPLATE-605", validate_template_605_mirror_section_order),
-    ("ADR-TEMPLATE-606", validate_template_606_content_formatting),
-    ("ADR-TEMPLATE-607", validate_template_607_governance_constraint_rules),
-    ("ADR-TEMPLATE-608", validate_template_608_real_values_not_placeholders),
-    ("ADR-TEMPLATE-609", validate_template_609_governance_real_values),
-]
+from ..manifest import RULES_PER_FILE, RULES_POST_RUN, band_rules
+
+
+def __getattr__(name: str):
+    if name == "TEMPLATE_RULES_PER_FILE":
+        return band_rules("TEMPLATE", RULES_PER_FILE)
+    if name == "TEMPLATE_RULES_POST_RUN":
+        return band_rules("TEMPLATE", RULES_POST_RUN)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-TEMPLATE_RULES_POST_RUN = []
 
 __all__ = [
     "TEMPLATE_RULES_PER_FILE",
@@ -4,12 +4,13 @@
 
 from __future__ import annotations
 
-from ...constants import VALID_ADR_CLASSES
-from ...parser.structure import expected_keys_for
+from ...constants import VALID_ADR_CLASSES, section_schema
+from ..artifacts import consumes, KEY_MARKERS
 
 _ERROR_CODE = "ADR-TEMPLATE-605"
 
 
+@consumes(KEY_MARKERS)
 def validate_template_605_mirror_section_order(ctx, rpt) -> None:
     """
     ADR-TEMPLATE-605 — mirror canonical section order of template_of.
@@ -27,13 +28,18 @@ def validate_template_605_mirror_section_order(ctx, rpt) -> None:
     elif not template_of or template_of not in VALID_ADR_CLASSES:
         return
 
-    expected = expected_keys_for(template_of)
+    positions = section_schema(template_of).positions
     found_keys = [k for k, _, _ in ctx.section_data.key_markers]
 
-    if expected and found_keys:
-        expected_present = [k for k in expected if k in found_keys]
-        actual_order = [k for k in found_keys if k in expected]
-        if expected_present != actual_order:
+    if positions and found_keys:
+        # In order iff canonical positions strictly increase (a repeated
+        # key also breaks the mirror)
+        ranks = [positions[k] for k in found_keys if k in positions]
+        if any(a >= b for a, b in zip(ranks, ranks[1:])):
+            actual_order = [k for k in found_keys if k in positions]
+            expected_present = sorted(
+                set(actual_order), key=positions.__getitem__
+            )
             rpt.add(
                 _ERROR_CODE,
                 ctx.path,
@@ -3,18 +3,20 @@
 # src/adr_linter/validators/template/template_606_content_formatting.py
 
 from __future__ import annotations
-import re
 
 from ...constants.validation import (
     DECISION_ONE_LINER_PATTERN_RX,
-    DECISION_ONE_LINER_KEY_PATTERN_RX,
+    MARKDOWN_HEADER_PREFIX_RX,
     has_placeholder_content,
     is_single_statement,
+    strip_html_comments,
 )
+from ..artifacts import consumes, SECTIONS_BY_KEY
 
 _ERROR_CODE = "ADR-TEMPLATE-606"
 
 
+@consumes(SECTIONS_BY_KEY)
 def validate_template_606_content_formatting(ctx, rpt) -> None:
     """
     ADR-TEMPLATE-606 — Content formatting matches documented format.
@@ -28,18 +30,16 @@ def validate_template_606_content_formatting(ctx, rpt) -> None:
     if meta.get("class") != "template":
         return
 
-    # Find decision_one_liner section - work around parser position issues
-    match = DECISION_ONE_LINER_KEY_PATTERN_RX.search(ctx.body)
-    if not match:
+    # Find decision_one_liner section (parser's section split)
+    decision_section = ctx.section_data.sections_by_key.get(
+        "decision_one_liner"
+    )
+    if decision_section is None:
         return  # Let other validators handle missing sections
 
-    decision_section = match.group(1).strip()
-
     # Remove HTML comments and markdown syntax for content analysis
-    clean_content = re.sub(
-        r"<!--.*?-->", "", decision_section, flags=re.DOTALL
-    )
-    clean_content = re.sub(r"^#+\s*", "", clean_content, flags=re.MULTILINE)
+    clean_content = strip_html_comments(decision_section.strip())
+    clean_content = MARKDOWN_HEADER_PREFIX_RX.sub("", clean_content)
     clean_content = clean_content.strip()
 
     if not clean_content:
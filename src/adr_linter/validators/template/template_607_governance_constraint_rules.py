@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
+from ..artifacts import consumes, KEY_MARKERS
+
 _ERROR_CODE = "ADR-TEMPLATE-607"
 
 
+@consumes(KEY_MARKERS)
 def validate_template_607_governance_constraint_rules(ctx, rpt) -> None:
     """
     ADR-TEMPLATE-607 — Governance template missing `constraint_rules` block
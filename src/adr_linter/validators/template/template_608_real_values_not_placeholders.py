@@ -3,11 +3,10 @@
 # src/adr_linter/validators/template/template_608_real_values_not_placeholders.py
 
 from __future__ import annotations
-import re
 
 from ...constants.validation import (
-    PLACEHOLDER_PATTERNS,
-    REAL_VALUE_INDICATORS,
+    PLACEHOLDER_ANY_RX,
+    REAL_VALUE_INDICATORS_RXL,
 )
 
 _ERROR_CODE = "ADR-TEMPLATE-608"
@@ -30,8 +29,8 @@ def validate_template_608_real_values_not_placeholders(ctx, rpt) -> None:
     #  )
 
     # Check for real value indicators
-    for pattern in REAL_VALUE_INDICATORS:
-        matches = re.finditer(pattern, body, re.IGNORECASE)
+    for pattern in REAL_VALUE_INDICATORS_RXL:
+        matches = pattern.finditer(body)
 
         # print(
         #    f"- [D VAL TEMPLATE-608] In for pattern in "
@@ -46,9 +45,8 @@ def validate_template_608_real_values_not_placeholders(ctx, rpt) -> None:
 
             # Skip if this appears to be inside a placeholder pattern
             text_around = body[max(0, match.start() - 20) : match.end() + 20]
-            is_in_placeholder = any(
-                re.search(placeholder_pattern, text_around)
-                for placeholder_pattern in PLACEHOLDER_PATTERNS
+            is_in_placeholder = (
+                PLACEHOLDER_ANY_RX.search(text_around) is not None
             )
 
             # print(
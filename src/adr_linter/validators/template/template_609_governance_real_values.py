@@ -3,17 +3,14 @@
 # src/adr_linter/validators/template/template_609_governance_real_values.py
 
 from __future__ import annotations
-import re
-import yaml
 
-from ...constants.validation import (
-    CONSTRAINT_RULES_KEY_PATTERN_RX,
-    detect_real_governance_values,
-)
+from ...constants.validation import detect_real_governance_values
+from ..artifacts import consumes, SECTION_SPANS, YAML_BLOCKS
 
 _ERROR_CODE = "ADR-TEMPLATE-609"
 
 
+@consumes(SECTION_SPANS, YAML_BLOCKS)
 def validate_template_609_governance_real_values(ctx, rpt) -> None:
     """
     ADR-TEMPLATE-609 — Template contains real governance values instead of
@@ -30,40 +27,34 @@ def validate_template_609_governance_real_values(ctx, rpt) -> None:
         return
 
     # Find constraint_rules section
-    match = CONSTRAINT_RULES_KEY_PATTERN_RX.search(ctx.body)
-    if not match:
+    section_data = ctx.section_data
+    span = section_data.section_spans.get("constraint_rules")
+    if span is None:
         return  # Let TEMPLATE-607 handle missing sections
 
-    constraint_section = match.group(1).strip()
-
-    # Extract YAML content from fenced blocks
-    yaml_pattern = re.compile(r"```yaml\s*\n(.*?)\n```", re.DOTALL)
-    yaml_match = yaml_pattern.search(constraint_section)
-
-    if not yaml_match:
+    # First fenced YAML block inside that section (parsed once by the parser)
+    start, end = span
+    block = next(
+        (b for b in section_data.yaml_blocks if start <= b["span"][0] < end),
+        None,
+    )
+    if block is None:
         return  # No YAML constraint block found
 
-    yaml_content = yaml_match.group(1)
-
-    try:
-        # Parse YAML content
-        constraint_data = yaml.safe_load(yaml_content)
-        if not isinstance(constraint_data, dict):
-            return
-
-        # Look for constraint_rules key
-        if "constraint_rules" in constraint_data:
-            rules = constraint_data["constraint_rules"]
-            violations = detect_real_governance_values(rules)
-
-            if violations:
-                rpt.add(
-                    _ERROR_CODE,
-                    ctx.path,
-                    "governance template contains real "
-                    f"values: {violations[0]}",
-                )
-
-    except yaml.YAMLError:
-        # Let other validators handle YAML syntax errors
+    # Malformed YAML carries data=None; other validators report syntax errors
+    constraint_data = block["data"]
+    if not isinstance(constraint_data, dict):
         return
+
+    # Look for constraint_rules key
+    if "constraint_rules" in constraint_data:
+        rules = constraint_data["constraint_rules"]
+        violations = detect_real_governance_values(rules)
+
+        if violations:
+            rpt.add(
+                _ERROR_CODE,
+                ctx.path,
+                "governance template contains real "
+                f"values: {violations[0]}",
+            )
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/constants/__init__.py
+
+"""
+constants package: precomputed tables (section schemas, alias indexes)
+"""
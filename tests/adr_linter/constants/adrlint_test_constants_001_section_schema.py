@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/constants/adrlint_test_constants_001_section_schema.py
+
+"""
+ADR-0001 · §4 Canonical section keys & order
+ADR-XXXX-YYYY (E? W? I?): per-class SectionSchema tables are built once,
+                          frozen, and agree with get_canonical_keys() and
+                          the heading aliases.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from adr_linter.constants import (
+    HEADING_ALIASES,
+    SECTIONS_UNIVERSAL_CLOSING,
+    SECTIONS_UNIVERSAL_OPENING,
+    VALID_ADR_CLASSES,
+    get_canonical_keys,
+    get_expected_header_text,
+    section_schema,
+)
+
+_CASES = [
+    *((cls, None) for cls in sorted(VALID_ADR_CLASSES)),
+    *(("template", target) for target in sorted(VALID_ADR_CLASSES)),
+    ("template", None),
+    ("template", ""),
+    ("template", "bogus"),
+    ("unknown", None),
+]
+
+
+@pytest.mark.parametrize("cls, template_of", _CASES)
+def test_adrlint_constants001_schema_matches_canonical_keys(cls, template_of):
+    schema = section_schema(cls, template_of=template_of)
+    keys = get_canonical_keys(cls, template_of=template_of)
+
+    assert list(schema.keys) == keys
+    assert dict(schema.positions) == {k: i for i, k in enumerate(keys)}
+    assert schema.key_set == frozenset(keys)
+    assert section_schema(cls, template_of=template_of) is schema
+
+
+def test_adrlint_constants001_relaxed_delta_is_universal_only():
+    schema = section_schema("delta", relaxed_delta=True)
+    assert schema.keys == tuple(
+        SECTIONS_UNIVERSAL_OPENING + SECTIONS_UNIVERSAL_CLOSING
+    )
+
+
+def test_adrlint_constants001_tables_are_frozen():
+    schema = section_schema("owner")
+    with pytest.raises(TypeError):
+        schema.positions["glossary"] = 0  # type: ignore[index]
+    with pytest.raises(TypeError):
+        schema.headers["glossary"] = ()  # type: ignore[index]
+
+
+def test_adrlint_constants001_reverse_alias_index():
+    schema = section_schema("governance")
+    for key in schema.keys:
+        aliases = [h for h, k in HEADING_ALIASES.items() if k == key]
+        assert list(schema.headers[key]) == aliases
+        assert get_expected_header_text(key) == aliases
+
+    # No alias: title-cased fallback
+    assert get_expected_header_text("made_up_key") == ["Made Up Key"]
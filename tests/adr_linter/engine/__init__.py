@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/__init__.py
+
+"""
+engine-level entry points (in-memory lint API)
+"""
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_001_in_memory_lint.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): engine.lint()/iter_findings() lint (path, text)
+                          pairs in memory with no filesystem or stdout side
+                          effects.
+"""
+
+from __future__ import annotations
+
+import builtins
+from pathlib import Path
+
+import pytest
+
+from adr_linter.engine import iter_findings, lint
+from adr_linter.parser.structure import build_index_from_texts
+
+from ..conftest import _good_body_structure, _good_meta_front_matter
+
+
+@pytest.fixture
+def _no_filesystem(monkeypatch):
+    def _boom(*_a, **_k):
+        raise AssertionError("filesystem touched")
+
+    monkeypatch.setattr(builtins, "open", _boom)
+    for name in ("read_text", "write_text", "mkdir", "glob", "exists"):
+        monkeypatch.setattr(Path, name, _boom)
+
+
+def _doc(adr_id: str, **meta) -> str:
+    return _good_meta_front_matter(id=adr_id, **meta) + _good_body_structure(
+        meta.get("class", "owner")
+    )
+
+
+def test_adrlint_engine001_lint_in_memory(_no_filesystem, capsys):
+    docs = [
+        ("drafts/ADR-0100-a.md", _doc("ADR-0100")),
+        ("drafts/ADR-0101-b.md", _doc("ADR-0101", **{"class": "bogus"})),
+    ]
+    findings = lint(docs)
+
+    codes = {f.code for f in findings}
+    assert "ADR-SCHEMA-002" in codes
+    bad = [f for f in findings if f.code == "ADR-SCHEMA-002"]
+    assert bad[0].location.startswith("drafts/ADR-0101-b.md")
+    assert findings.exit_code("E") == 1
+    assert capsys.readouterr().out == ""
+
+
+def test_adrlint_engine001_rule_subset_and_generator(_no_filesystem):
+    docs = [("drafts/ADR-0101-b.md", _doc("ADR-0101", **{"class": "bogus"}))]
+    gen = iter_findings(docs, rules={"ADR-SCHEMA-002"})
+    assert iter(gen) is gen
+    assert [f.code for f in gen] == ["ADR-SCHEMA-002"]
+
+
+def test_adrlint_engine001_index_supplies_cross_file_context(_no_filesystem):
+    corpus = build_index_from_texts(
+        [(Path("adr/ADR-0001-base.md"), _doc("ADR-0001"))]
+    )
+    draft = _doc("ADR-0002", supersedes=["ADR-0001"])
+    findings = lint(
+        [("drafts/ADR-0002.md", draft)],
+        rules={"ADR-LINK-300"},
+        index=corpus,
+    )
+    # ADR-0001 is known through the index, and does not point back
+    assert [f.code for f in findings] == ["ADR-LINK-300"]
+    assert "ADR-0002" not in corpus  # caller's index is not mutated
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_002_lsp_stdio.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `theseus lsp` speaks framed JSON-RPC over stdio
+                          and publishes diagnostics on open/change/close.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import shutil
+
+from adr_linter.lsp import LspServer, path_to_uri, read_message
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def _frame(payload: dict) -> bytes:
+    body = json.dumps(payload).encode("utf-8")
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+def _run(messages) -> tuple:
+    rfile = io.BytesIO(b"".join(_frame(m) for m in messages))
+    wfile = io.BytesIO()
+    rc = LspServer(rfile, wfile).serve()
+    wfile.seek(0)
+    out = []
+    while True:
+        msg = read_message(wfile)
+        if msg is None:
+            return rc, out
+        out.append(msg)
+
+
+def test_adrlint_engine002_lsp_round_trip(_route_and_reset_workspace):
+    root = _route_and_reset_workspace
+    doc = _write_text(
+        root,
+        "docs/adrs/ADR-0001-demo.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    uri = path_to_uri(doc.resolve().as_posix())
+    bad = _good_meta_front_matter(id="ADR-0001", **{"class": "bogus"})
+
+    rc, out = _run(
+        [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"rootUri": path_to_uri(root.resolve().as_posix())},
+            },
+            {"jsonrpc": "2.0", "method": "initialized", "params": {}},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": uri,
+                        "version": 1,
+                        "text": doc.read_text(encoding="utf-8"),
+                    }
+                },
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": 2},
+                    "contentChanges": [{"text": bad}],
+                },
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didClose",
+                "params": {"textDocument": {"uri": uri}},
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+    )
+
+    assert rc == 0
+    assert out[0]["id"] == 1
+    assert out[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+
+    published = [
+        m["params"]
+        for m in out
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+    assert all(p["uri"] == uri for p in published)
+    opened, changed, closed = published
+    assert "ADR-SCHEMA-002" not in {d["code"] for d in opened["diagnostics"]}
+    assert "ADR-SCHEMA-002" in {d["code"] for d in changed["diagnostics"]}
+    assert closed["diagnostics"] == []
+    assert out[-1] == {"jsonrpc": "2.0", "id": 2, "result": None}
+
+
+def test_adrlint_engine002_lsp_survives_handler_errors(
+    _route_and_reset_workspace,
+):
+    root = _route_and_reset_workspace
+    doc = _write_text(
+        root,
+        "docs/adrs/ADR-0001-demo.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    uri = path_to_uri(doc.resolve().as_posix())
+    # LINK-322 raises TypeError on a scalar `supersedes`
+    broken = doc.read_text(encoding="utf-8").replace(
+        "---\nBody", "supersedes: 5\n---\nBody"
+    )
+    bad = _good_meta_front_matter(id="ADR-0001", **{"class": "bogus"})
+
+    def _change(version, text):
+        return {
+            "jsonrpc": "2.0",
+            "method": "textDocument/didChange",
+            "params": {
+                "textDocument": {"uri": uri, "version": version},
+                "contentChanges": [{"text": text}],
+            },
+        }
+
+    rc, out = _run(
+        [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"rootUri": path_to_uri(root.resolve().as_posix())},
+            },
+            _change(1, broken),
+            _change(2, bad),
+            {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+    )
+
+    assert rc == 0
+    logged = [m for m in out if m.get("method") == "window/logMessage"]
+    assert len(logged) == 1
+    assert logged[0]["params"]["type"] == 1
+    assert "TypeError" in logged[0]["params"]["message"]
+    published = [
+        m["params"]
+        for m in out
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+    last = {d["code"] for d in published[-1]["diagnostics"]}
+    assert "ADR-SCHEMA-002" in last
+    assert out[-1] == {"jsonrpc": "2.0", "id": 2, "result": None}
+
+
+def test_adrlint_engine002_lsp_request_error_is_internal_error():
+    def _boom(_root):
+        raise RuntimeError("no index")
+
+    rfile = io.BytesIO(
+        _frame({"jsonrpc": "2.0", "id": 7, "method": "initialize"})
+        + _frame({"jsonrpc": "2.0", "method": "exit"})
+    )
+    wfile = io.BytesIO()
+    LspServer(rfile, wfile, session_factory=_boom).serve()
+    wfile.seek(0)
+    reply = read_message(wfile)
+    assert reply["id"] == 7
+    assert reply["error"]["code"] == -32603
+    assert "no index" in reply["error"]["message"]
+
+
+def test_adrlint_engine002_lsp_publishes_to_the_client_uri(
+    _route_and_reset_workspace,
+):
+    workspace = _route_and_reset_workspace
+    real = workspace / "real"
+    shutil.rmtree(real, ignore_errors=True)
+    _write_text(
+        real,
+        "docs/adrs/ADR-0001-demo.md",
+        _good_meta_front_matter(id="ADR-0001", **{"class": "bogus"}),
+    )
+    link = workspace / "link"
+    if link.is_symlink():
+        link.unlink()
+    link.symlink_to(real, target_is_directory=True)
+    doc = link / "docs/adrs/ADR-0001-demo.md"
+    uri = path_to_uri(doc.absolute().as_posix())
+
+    _rc, out = _run(
+        [
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {"rootUri": path_to_uri(link.absolute().as_posix())},
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": uri,
+                        "version": 1,
+                        "text": doc.read_text(encoding="utf-8"),
+                    }
+                },
+            },
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+    )
+
+    published = [
+        m["params"]
+        for m in out
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+    assert [p["uri"] for p in published] == [uri]
+    assert "ADR-SCHEMA-002" in {d["code"] for d in published[0]["diagnostics"]}
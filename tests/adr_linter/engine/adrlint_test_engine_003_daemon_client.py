@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_003_daemon_client.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `theseus --client` forwards a lint to the warm
+                          daemon and replays the same output and exit code
+                          as an in-process run.
+"""
+
+from __future__ import annotations
+
+import shutil
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from adr_linter import engine
+from adr_linter.cli import main
+from adr_linter.daemon import LintDaemon, request, socket_path
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable"
+)
+
+
+@pytest.fixture
+def _daemon():
+    # AF_UNIX paths are length-limited; keep the socket in a short tmp dir
+    sock_dir = Path(tempfile.mkdtemp(prefix="theseus-", dir="/tmp"))
+    sock = sock_dir / "d.sock"
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=LintDaemon(sock).serve_forever, args=(ready,), daemon=True
+    )
+    thread.start()
+    assert ready.wait(5)
+    yield sock
+    request(sock, {"stop": True})
+    thread.join(5)
+    shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+def _workspace(root: Path) -> None:
+    _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-new.md",
+        _good_meta_front_matter(id="ADR-0002", supersedes=["ADR-0001"])
+        + "Body\n",
+    )
+
+
+def test_adrlint_engine003_client_matches_in_process(
+    _route_and_reset_workspace, _daemon, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+    argv = ["--path", ".", "--format", "jsonl"]
+
+    rc_local = main(argv)
+    local = capsys.readouterr().out
+
+    for _ in range(2):  # second request is served from warm state
+        rc = main(["--client", "--socket", str(_daemon), *argv])
+        out = capsys.readouterr().out
+        assert (rc, out) == (rc_local, local)
+    assert "ADR-LINK-300" in local
+
+
+def test_adrlint_engine003_client_falls_back_in_process(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+    argv = ["--path", ".", "--format", "jsonl"]
+
+    rc_local = main(argv)
+    local = capsys.readouterr().out
+
+    missing = root / "no-daemon.sock"
+    rc = main(["--client", f"--socket={missing}", *argv])
+    captured = capsys.readouterr()
+    assert (rc, captured.out) == (rc_local, local)
+    assert "no daemon" in captured.err
+
+
+def test_adrlint_engine003_daemon_survives_crashing_lint(
+    _route_and_reset_workspace, _daemon, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    # LINK-322 raises TypeError on a scalar `supersedes`
+    _write_text(
+        root,
+        "docs/adrs/ADR-0003-bad.md",
+        _good_meta_front_matter(id="ADR-0003", supersedes=5) + "Body\n",
+    )
+    monkeypatch.chdir(root)
+
+    rc = main(["--client", "--socket", str(_daemon), "--path", "."])
+    captured = capsys.readouterr()
+    assert rc == 2
+    assert "TypeError" in captured.err and "Traceback" in captured.err
+
+    (root / "docs/adrs/ADR-0003-bad.md").unlink()
+    rc_local = main(["--path", "."])
+    local = capsys.readouterr().out
+    assert _daemon.exists()
+    rc = main(["--client", "--socket", str(_daemon), "--path", "."])
+    captured = capsys.readouterr()
+    assert (rc, captured.out) == (rc_local, local)
+    assert "no daemon" not in captured.err
+
+
+def test_adrlint_engine003_request_reports_missing_rc(capsys):
+    sock_dir = Path(tempfile.mkdtemp(prefix="theseus-", dir="/tmp"))
+    sock = sock_dir / "d.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock))
+    server.listen()
+
+    def _hang_up():
+        conn, _ = server.accept()
+        with conn, conn.makefile("rb") as f:
+            f.readline()
+
+    thread = threading.Thread(target=_hang_up, daemon=True)
+    thread.start()
+    try:
+        assert request(sock, {"argv": [], "cwd": "."}) == 1
+    finally:
+        thread.join(5)
+        server.close()
+        shutil.rmtree(sock_dir, ignore_errors=True)
+    assert "without a result" in capsys.readouterr().err
+
+
+def test_adrlint_engine003_default_socket_follows_lint_root(
+    monkeypatch, capsys
+):
+    root = Path(tempfile.mkdtemp(prefix="theseus-", dir="/tmp"))
+    _workspace(root)
+    sock = socket_path(None, str(root))
+    assert sock == root.resolve() / "logs/.adr/theseus.sock"
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=LintDaemon(sock).serve_forever, args=(ready,), daemon=True
+    )
+    thread.start()
+    assert ready.wait(5)
+    try:
+        monkeypatch.chdir(root / "docs")
+        rc_local = main(["--path", ".."])
+        local = capsys.readouterr().out
+        rc = main(["--client", "--path", ".."])
+        captured = capsys.readouterr()
+        assert (rc, captured.out) == (rc_local, local)
+        assert "no daemon" not in captured.err
+    finally:
+        request(sock, {"stop": True})
+        thread.join(5)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def test_adrlint_engine003_daemon_forwards_jobs(
+    _route_and_reset_workspace, monkeypatch
+):
+    seen = {}
+
+    def _run(**kwargs):
+        seen.update(kwargs)
+        return 0
+
+    monkeypatch.setattr(engine, "run", _run)
+    daemon = LintDaemon("/tmp/unused.sock")
+    argv = ["--path", ".", "--jobs", "3"]
+    assert daemon.lint(argv, str(_route_and_reset_workspace))[2] == 0
+    assert seen["jobs"] == 3
+
+
+def test_adrlint_engine003_client_only_as_a_flag(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    # A value that spells --client is the -k expression, not client mode
+    with pytest.raises(SystemExit) as exc:
+        main(["--path", ".", "-k", "--client"])
+    assert exc.value.code == 2
+    err = capsys.readouterr().err
+    assert "expected one argument" in err and "no daemon" not in err
+
+    main(["--path", ".", "--keyword=--client"])
+    captured = capsys.readouterr()
+    assert "no daemon" not in captured.err
+    assert "[file_path]" not in captured.out
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_004_streaming.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--stream` lints from a slim link projection of
+                          each document and reports exactly what a default
+                          run reports.
+"""
+
+from __future__ import annotations
+
+from adr_linter.cli import main
+from adr_linter.services.index import build_projection_index
+
+from ..conftest import (
+    _good_body_structure,
+    _good_meta_front_matter,
+    _write_text,
+)
+
+
+def _workspace(root):
+    paths = [
+        _write_text(
+            root,
+            "docs/adrs/ADR-0001-base.md",
+            _good_meta_front_matter(id="ADR-0001", superseded_by=["ADR-0003"])
+            + _good_body_structure("owner"),
+        ),
+        _write_text(
+            root,
+            "docs/adrs/ADR-0002-delta.md",
+            _good_meta_front_matter(
+                id="ADR-0002",
+                **{"class": "delta", "extends": "ADR-0001@2025-01-01"},
+            )
+            + "```yaml\noverrides:\n  decision_details: x\n  nope: y\n```\n",
+        ),
+        _write_text(
+            root,
+            "docs/adrs/ADR-0003-new.md",
+            _good_meta_front_matter(
+                id="ADR-0003", supersedes=["ADR-0001", "ADR-0009"]
+            )
+            + "Body\n",
+        ),
+    ]
+    return paths
+
+
+def test_adrlint_engine004_projection_keeps_no_text(
+    _route_and_reset_workspace,
+):
+    paths = _workspace(_route_and_reset_workspace)
+    idx = build_projection_index(paths)
+
+    base = idx["ADR-0001"]
+    assert "body" not in base and "raw" not in base
+    assert set(base["meta"]) == {"id", "class", "superseded_by"}
+    keys = {k for k, _, _ in base["section_data"].key_markers}
+    assert "decision_details" in keys
+
+
+def test_adrlint_engine004_stream_matches_default_run(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    rc_default = main(["--path", "."])
+    default = capsys.readouterr().out
+    rc_stream = main(["--path", ".", "--stream"])
+    assert (rc_stream, capsys.readouterr().out) == (rc_default, default)
+    assert "ADR-LINK-300" in default
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_005_shard_merge.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--shard i/N` partitions files deterministically
+                          and `theseus merge` over all shard artifacts
+                          reports exactly what a single-node run reports.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from adr_linter.cli import main
+from adr_linter.services.shard import parse_shard, shard_of
+
+from ..conftest import (
+    _good_body_structure,
+    _good_meta_front_matter,
+    _write_text,
+)
+
+
+def _workspace(root: Path) -> None:
+    _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001", superseded_by=["ADR-0003"])
+        + _good_body_structure("owner"),
+    )
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-delta.md",
+        _good_meta_front_matter(
+            id="ADR-0002",
+            **{"class": "delta", "extends": "ADR-0001@2025-01-01"},
+        )
+        + "```yaml\noverrides:\n  decision_details: x\n  nope: y\n```\n",
+    )
+    _write_text(
+        root,
+        "docs/adrs/ADR-0003-new.md",
+        _good_meta_front_matter(
+            id="ADR-0003", supersedes=["ADR-0001", "ADR-0009"]
+        )
+        + "Body\n",
+    )
+    for n in range(4, 9):
+        _write_text(
+            root,
+            f"docs/adrs/ADR-000{n}-x.md",
+            _good_meta_front_matter(id=f"ADR-000{n}", informs=["ADR-0001"])
+            + "Body\n",
+        )
+
+
+def test_adrlint_engine005_parse_shard_and_partition():
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "2", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+    paths = [Path(f"docs/adrs/ADR-{n:04d}.md") for n in range(50)]
+    shards = [shard_of(p, 4) for p in paths]
+    assert shards == [shard_of(p, 4) for p in paths]
+    assert set(shards) == {1, 2, 3, 4}
+
+
+def test_adrlint_engine005_merge_matches_single_node(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    rc_single = main(["--path", "."])
+    single = capsys.readouterr().out
+
+    artifacts = []
+    for i in (1, 2, 3):
+        out = f"shards/s{i}.json"
+        argv = ["--path", ".", "--shard", f"{i}/3", "--shard-out", out]
+        assert main(argv) == 0
+        artifacts.append(out)
+    capsys.readouterr()
+
+    rc_merged = main(["merge", *artifacts])
+    assert (rc_merged, capsys.readouterr().out) == (rc_single, single)
+    for code in ("ADR-LINK-300", "ADR-DELTA-300", "ADR-LINK-322"):
+        assert code in single
+
+    assert main(["merge", *artifacts[:2]]) == 2
+    assert "missing shard" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "extra", [["-k", "0001"], ["--verify-pins"]], ids=["k", "verify-pins"]
+)
+def test_adrlint_engine005_shard_rejects_conflicting_flags(extra, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--path", ".", "--shard", "1/2", *extra])
+    assert exc.value.code == 2
+    assert f"cannot be combined with {extra[0]}" in capsys.readouterr().err
+
+
+def test_adrlint_engine005_partition_ignores_path_prefix(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root / "repo")
+
+    def _linted(cwd, path):
+        monkeypatch.chdir(cwd)
+        main(["--path", path, "--shard", "1/3", "--shard-out", "s1.json"])
+        out = capsys.readouterr().out
+        return sorted(
+            ln.rsplit("/", 1)[-1]
+            for ln in out.splitlines()
+            if "[file_path]" in ln
+        )
+
+    assert _linted(root / "repo", ".") == _linted(root, "repo")
+
+
+def test_adrlint_engine005_merge_rejects_duplicated_or_misplaced_documents(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+    artifacts = []
+    for i in (1, 2):
+        out = f"shards/d{i}.json"
+        main(["--path", ".", "--shard", f"{i}/2", "--shard-out", out])
+        artifacts.append(root / out)
+    capsys.readouterr()
+
+    first, second = (json.loads(p.read_text()) for p in artifacts)
+    moved = dict(second, documents=second["documents"] + first["documents"])
+    artifacts[1].write_text(json.dumps(moved), encoding="utf-8")
+    assert main(["merge", *map(str, artifacts)]) == 2
+    assert "already read from" in capsys.readouterr().err
+
+    first["documents"], second["documents"] = [], moved["documents"]
+    artifacts[0].write_text(json.dumps(first), encoding="utf-8")
+    artifacts[1].write_text(json.dumps(second), encoding="utf-8")
+    assert main(["merge", *map(str, artifacts)]) == 2
+    assert "belongs to shard 1/2, not 2/2" in capsys.readouterr().err
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_006_threads.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--threads N` runs every per-file rule on a thread
+                          pool over the shared index and reports exactly
+                          what a serial run reports.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from adr_linter.cli import main
+from adr_linter.engine import _map_ordered
+
+from ..conftest import (
+    _good_body_structure,
+    _good_meta_front_matter,
+    _write_text,
+)
+
+_CLASSES = ("owner", "delta", "governance", "strategy", "style-guide")
+
+
+def _workspace(root) -> None:
+    for n in range(1, 41):
+        cls = _CLASSES[n % len(_CLASSES)]
+        meta = {"id": f"ADR-{n:04d}", "class": cls}
+        if cls == "delta":
+            meta["extends"] = f"ADR-{n - 1:04d}@2025-01-01"
+        if n % 7 == 0:
+            meta["supersedes"] = [f"ADR-{n - 3:04d}", "ADR-0999"]
+        if n % 11 == 0:
+            meta["date"] = "2025/01/01"
+        _write_text(
+            root,
+            f"docs/adrs/ADR-{n:04d}-x.md",
+            _good_meta_front_matter(**meta) + _good_body_structure(cls),
+        )
+
+
+def test_adrlint_engine006_map_ordered_keeps_input_order():
+    def _slow(n):
+        time.sleep(random.random() / 500)
+        return n * n
+
+    items = list(range(50))
+    assert list(_map_ordered(_slow, items, 8)) == [n * n for n in items]
+    assert list(_map_ordered(_slow, items, None)) == [n * n for n in items]
+
+
+def test_adrlint_engine006_threaded_run_matches_serial(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    rc_serial = main(["--path", "."])
+    serial = capsys.readouterr().out
+    assert "ADR-LINK-300" in serial and "ADR-SCHEMA-005" in serial
+
+    for threads in ("2", "8", "8"):
+        rc = main(["--path", ".", "--threads", threads])
+        assert (rc, capsys.readouterr().out) == (rc_serial, serial)
+
+    argv = ["--path", ".", "-k", "0007 or 0014"]
+    rc_k = main(argv)
+    k_serial = capsys.readouterr().out
+    assert main([*argv, "--threads", "4"]) == rc_k
+    assert capsys.readouterr().out == k_serial
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_007_staged.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--staged` lints the staged ADR blobs against the
+                          git index snapshot, not the work tree; parsed
+                          blobs are cached by SHA.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+
+from adr_linter.cli import main
+from adr_linter.services import staged as staged_mod
+from adr_linter.services.staged import BlobCache, staged_snapshot
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _repo(workspace):
+    """
+    Committed: ADR-0001, ADR-0002. Staged: a broken ADR-0003 (bad date,
+    supersedes an unknown ADR), fixed only in the work tree.
+    """
+    root = workspace / "repo"
+    shutil.rmtree(root, ignore_errors=True)
+    root.mkdir()
+    _git(root, "init", "-q")
+    for n in (1, 2):
+        _write_text(
+            root,
+            f"docs/adrs/ADR-000{n}-x.md",
+            _good_meta_front_matter(id=f"ADR-000{n}") + "Body\n",
+        )
+    _git(root, "add", "docs")
+    _git(root, "commit", "-qm", "base")
+
+    new = "docs/adrs/ADR-0003-new.md"
+    _write_text(
+        root,
+        new,
+        _good_meta_front_matter(
+            id="ADR-0003", date="2025/01/01", supersedes=["ADR-0999"]
+        )
+        + "Body\n",
+    )
+    _git(root, "add", new)
+    _write_text(root, new, _good_meta_front_matter(id="ADR-0003") + "Body\n")
+    return root
+
+
+def test_adrlint_engine007_staged_lints_index_not_worktree(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _repo(_route_and_reset_workspace)
+    monkeypatch.chdir(root)
+
+    main(["--path", "."])
+    worktree = capsys.readouterr().out
+    assert "ADR-SCHEMA-005" not in worktree
+    assert "ADR-0999" not in worktree
+
+    main(["--path", ".", "--staged"])
+    out = capsys.readouterr().out
+    files = [ln for ln in out.splitlines() if "[file_path]" in ln]
+    assert files == ["report.py: [file_path] docs/adrs/ADR-0003-new.md"]
+    assert "ADR-SCHEMA-005" in out
+    assert "ADR-LINK-300: unknown reciprocal target: ADR-0999" in out
+
+
+def test_adrlint_engine007_blob_cache_reads_each_blob_once(
+    _route_and_reset_workspace, monkeypatch
+):
+    root = _repo(_route_and_reset_workspace)
+    started = []
+    real_popen = staged_mod.subprocess.Popen
+
+    def _popen(*args, **kwargs):
+        started.append(args[0])
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(staged_mod.subprocess, "Popen", _popen)
+    cache = BlobCache()
+
+    changed, texts, idx = staged_snapshot(root, cache)
+    assert [p.name for p in changed] == ["ADR-0003-new.md"]
+    assert sorted(idx) == ["ADR-0001", "ADR-0002", "ADR-0003"]
+    assert "ADR-0999" in texts[root / "docs/adrs/ADR-0003-new.md"]
+    assert len(cache) == 3
+
+    batches = started.count(["git", "cat-file", "--batch"])
+    staged_snapshot(root, cache)
+    assert started.count(["git", "cat-file", "--batch"]) == batches == 1
+
+
+def test_adrlint_engine007_unmerged_adrs_are_refused(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _repo(_route_and_reset_workspace)
+    _git(root, "commit", "-qm", "adr 3")
+    base = "docs/adrs/ADR-0001-x.md"
+    _git(root, "checkout", "-qb", "side")
+    _write_text(root, base, _good_meta_front_matter(id="ADR-0001") + "A\n")
+    _git(root, "commit", "-qam", "side")
+    _git(root, "checkout", "-q", "-")
+    _write_text(root, base, _good_meta_front_matter(id="ADR-0001") + "B\n")
+    _git(root, "commit", "-qam", "main")
+    try:
+        _git(root, "merge", "-q", "side")
+    except subprocess.CalledProcessError:
+        pass  # conflicted: stages 1-3 in the index
+    assert (root / ".git" / "MERGE_HEAD").exists()
+    monkeypatch.chdir(root)
+
+    assert main(["--path", ".", "--staged"]) == 2
+    err = capsys.readouterr().err
+    assert f"theseus --staged: unmerged ADRs: {base}" in err
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_008_profile.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--profile[=cpu|mem|all]` writes a cProfile dump
+                          and a per-phase top-N summary to logs/.adr/
+                          without changing the report.
+"""
+
+from __future__ import annotations
+
+import pstats
+import tracemalloc
+
+from adr_linter.cli import main
+from adr_linter.engine import run
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+_PHASES = ("discover", "index", "validate", "post_run", "report")
+
+
+def _workspace(root) -> None:
+    for n in (1, 2, 3):
+        _write_text(
+            root,
+            f"docs/adrs/ADR-000{n}-x.md",
+            _good_meta_front_matter(id=f"ADR-000{n}", supersedes=["ADR-0999"])
+            + "Body\n",
+        )
+
+
+def test_adrlint_engine008_profile_all_phases(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+    out_dir = root / "logs" / ".adr"
+    for name in ("profile.prof", "profile.txt"):
+        (out_dir / name).unlink(missing_ok=True)
+
+    rc = main(["--path", "."])
+    plain = capsys.readouterr().out
+
+    assert main(["--path", ".", "--profile=all"]) == rc
+    captured = capsys.readouterr()
+    assert captured.out == plain
+    assert "profile: logs/.adr/profile.prof" in captured.err
+    assert not tracemalloc.is_tracing()
+
+    summary = (out_dir / "profile.txt").read_text(encoding="utf-8")
+    heads = [ln for ln in summary.splitlines() if ln.startswith("== ")]
+    assert [h.split(":")[0][3:] for h in heads] == list(_PHASES)
+    assert all("KiB" in h for h in heads)
+    assert "ncalls" in summary and "allocation sites" in summary
+
+    stats = pstats.Stats(str(out_dir / "profile.prof"))
+    assert any(fn == "discover" for _file, _line, fn in stats.stats)
+
+
+def test_adrlint_engine008_profile_mem_only_skips_prof(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+    (root / "logs" / ".adr" / "profile.prof").unlink(missing_ok=True)
+
+    main(["--path", ".", "--profile=mem"])
+    assert "profile.prof" not in capsys.readouterr().err
+    assert not (root / "logs" / ".adr" / "profile.prof").exists()
+    summary = (root / "logs" / ".adr" / "profile.txt").read_text("utf-8")
+    assert "ncalls" not in summary and "== validate" in summary
+
+
+def test_adrlint_engine008_profile_written_on_early_return(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    # Not a git work tree: --staged fails during discover and returns 2
+    root = _route_and_reset_workspace / "no-git"
+    root.mkdir(exist_ok=True)
+    (root / ".git").write_text("gitdir: /nonexistent\n", encoding="utf-8")
+    monkeypatch.chdir(root)
+    summary = root / "logs" / ".adr" / "profile.txt"
+    summary.unlink(missing_ok=True)
+
+    assert run(path=".", staged=True, profile="mem") == 2
+    assert not tracemalloc.is_tracing()
+    assert "== discover" in summary.read_text(encoding="utf-8")
+    assert "profile: logs/.adr/profile.txt" in capsys.readouterr().err
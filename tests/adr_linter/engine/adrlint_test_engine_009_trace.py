@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/engine/adrlint_test_engine_009_trace.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): `--trace out.json` writes Chrome Trace Event spans
+                          (phases, reads, parses, rule calls, graph builds)
+                          with one track per worker thread.
+"""
+
+from __future__ import annotations
+
+import json
+
+from adr_linter import tracing
+from adr_linter.cli import main
+
+from ..conftest import (
+    _good_body_structure,
+    _good_meta_front_matter,
+    _write_text,
+)
+
+_PHASES = ["discover", "index", "validate", "post_run", "report"]
+
+
+def _workspace(root) -> None:
+    for n in range(1, 13):
+        _write_text(
+            root,
+            f"docs/adrs/ADR-{n:04d}-x.md",
+            _good_meta_front_matter(id=f"ADR-{n:04d}")
+            + _good_body_structure("owner"),
+        )
+
+
+def _events(path):
+    return json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+
+def test_adrlint_engine009_trace_spans(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    rc = main(["--path", "."])
+    plain = capsys.readouterr().out
+    assert main(["--path", ".", "--trace", "out/trace.json"]) == rc
+    captured = capsys.readouterr()
+    assert captured.out == plain
+    assert "trace: out/trace.json" in captured.err
+    assert tracing._ACTIVE is None
+
+    events = _events(root / "out" / "trace.json")
+    spans = [e for e in events if e["ph"] == "X"]
+    phases = [e for e in spans if e["cat"] == "phase"]
+    assert [e["name"] for e in phases] == _PHASES
+    validate = phases[2]
+
+    rules = [e for e in spans if e["cat"] == "rule"]
+    per_file = [e for e in rules if "path" in e["args"]]
+    assert {e["args"]["path"] for e in per_file} == {
+        f"docs/adrs/ADR-{n:04d}-x.md" for n in range(1, 13)
+    }
+    assert all(e["name"] == e["args"]["rule"] for e in rules)
+    for e in per_file:
+        assert validate["ts"] <= e["ts"]
+        assert e["ts"] + e["dur"] <= validate["ts"] + validate["dur"]
+
+    names = {e["name"] for e in spans}
+    assert {"read", "front_matter", "key_markers", "headings"} <= names
+    assert {"link_graph", "supersede_graph"} <= names
+    reads = [e for e in spans if e["name"] == "read"]
+    assert all(e["args"]["path"].endswith(".md") for e in reads)
+
+
+def test_adrlint_engine009_trace_one_track_per_worker(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    main(["--path", ".", "--threads", "4", "--trace", "t.json"])
+    capsys.readouterr()
+    events = _events(root / "t.json")
+    tracks = {
+        e["tid"]: e["args"]["name"] for e in events if e["ph"] == "M"
+    }
+    assert tracks[0] == "MainThread"
+    assert len(tracks) > 1
+    per_file = {
+        e["tid"]
+        for e in events
+        if e.get("cat") == "rule" and "path" in e["args"]
+    }
+    assert per_file <= set(tracks) - {0}
+    assert all(e["tid"] == 0 for e in events if e.get("cat") == "phase")
+
+
+def test_adrlint_engine009_span_is_noop_without_tracer():
+    assert tracing._ACTIVE is None
+    assert tracing.span("x", "phase") is tracing.span("y", "rule")
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/filters/adrlint_test_filters_002_k_pushdown.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): -k compiles to a flat matcher that runs inside
+                          discovery; only selected files and the ADRs they
+                          link to are indexed, and only selected files are
+                          reported.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from adr_linter import engine
+from adr_linter.cli import main
+from adr_linter.filters import compile_k, path_key
+from adr_linter.services.index import build_context_index, discover
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def _workspace(root: Path, *, base_name: str = "ADR-0001-base.md") -> None:
+    _write_text(
+        root,
+        f"docs/adrs/{base_name}",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-new.md",
+        _good_meta_front_matter(id="ADR-0002", supersedes=["ADR-0001"])
+        + "Body\n",
+    )
+    _write_text(
+        root,
+        "docs/adrs/ADR-0003-other.md",
+        _good_meta_front_matter(id="ADR-0003") + "Body\n",
+    )
+
+
+def test_adrlint_filters002_matcher_parity_with_predicate():
+    paths = [
+        Path("docs/adrs/ADR-0001-Owner.md"),
+        Path("docs/adrs/ADR-0003-strategy.md"),
+        Path("docs/adrs/notes.md"),
+    ]
+    for expr in ("0001", "owner and not notes", "(0001 or 0003) and not x"):
+        matcher = compile_k(expr)
+        for p in paths:
+            assert matcher.match_key(path_key(p)) == matcher(p)
+    assert compile_k("0001 or 0001").needles == ("0001",)
+
+
+def test_adrlint_filters002_discover_splits_selected(
+    _route_and_reset_workspace, monkeypatch
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    selected, rest = discover(Path("."), compile_k("0002").match_key)
+    assert [p.name for p in selected] == ["ADR-0002-new.md"]
+    assert [p.name for p in rest] == ["ADR-0001-base.md", "ADR-0003-other.md"]
+
+
+def test_adrlint_filters002_context_loads_linked_only(
+    _route_and_reset_workspace, monkeypatch
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    selected, rest = discover(Path("."), compile_k("0002").match_key)
+    idx = build_context_index(selected, rest)
+    assert set(idx) == {"ADR-0001", "ADR-0002"}
+
+
+def test_adrlint_filters002_context_falls_back_to_full_scan(
+    _route_and_reset_workspace, monkeypatch
+):
+    root = _route_and_reset_workspace
+    _workspace(root, base_name="base-decision.md")
+    monkeypatch.chdir(root)
+
+    selected, rest = discover(Path("."), compile_k("0002").match_key)
+    idx = build_context_index(selected, rest)
+    assert {"ADR-0001", "ADR-0002"} <= set(idx)
+
+
+def test_adrlint_filters002_run_reports_selected_files_only(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    main(["--path", ".", "-k", "0002"])
+    out = capsys.readouterr().out
+    reported = {
+        line.rsplit(" ", 1)[-1]
+        for line in out.splitlines()
+        if "[file_path]" in line
+    }
+    assert reported == {"docs/adrs/ADR-0002-new.md"}
+    # LINK-300 still sees the (unselected) supersedes target
+    assert "target lacks superseded_by=ADR-0002" in out
+
+
+def _post_run_lines(out: str, code: str):
+    return [line for line in out.splitlines() if code in line]
+
+
+def test_adrlint_filters002_k_run_keeps_descendants_for_link320(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    # A second descendant; the base itself names neither
+    _write_text(
+        root,
+        "docs/adrs/ADR-0004-fork.md",
+        _good_meta_front_matter(id="ADR-0004", supersedes=["ADR-0001"])
+        + "Body\n",
+    )
+    monkeypatch.chdir(root)
+
+    main(["--path", "."])
+    full = _post_run_lines(capsys.readouterr().out, "ADR-LINK-320")
+    assert full == [
+        "report.py: [I] ADR-LINK-320: multiple descendants: "
+        "ADR-0002, ADR-0004"
+    ]
+    main(["--path", ".", "-k", "0001"])
+    assert _post_run_lines(capsys.readouterr().out, "ADR-LINK-320") == full
+
+
+def test_adrlint_filters002_k_run_keeps_located_post_run_findings(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace
+    _workspace(root)
+    monkeypatch.chdir(root)
+
+    def _post_run(idx, rpt, link_graph=None, codes=None):
+        for name in ("ADR-0002-new.md", "ADR-0003-other.md"):
+            rpt.add("ADR-LINK-320", Path("docs/adrs") / name, "x", 3)
+
+    monkeypatch.setattr(engine, "_post_run_validators", _post_run)
+    main(["--path", ".", "-k", "0002"])
+    out = capsys.readouterr().out
+    # "path:line" locations are matched on their path part
+    assert len(_post_run_lines(out, "ADR-LINK-320")) == 1
+    assert "ADR-0003-other.md" not in out
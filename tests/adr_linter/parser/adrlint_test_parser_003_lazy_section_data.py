@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/parser/adrlint_test_parser_003_lazy_section_data.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): SectionData artifacts are computed on first
+                          access, memoized, and keep their line numbers.
+"""
+
+from __future__ import annotations
+
+from adr_linter.models import SectionData
+from adr_linter.parser.structure import parse_document_structure
+
+_BODY = "\n".join(
+    [
+        "# Title",
+        "",
+        "<!-- key: decision_one_liner -->",
+        "Hinges on speed.",
+        "",
+        "## Glossary",
+        "<!-- key: glossary -->",
+        "```yaml",
+        "overrides:",
+        "  glossary: base",
+        "```",
+        "",
+    ]
+)
+
+
+def test_adrlint_parser003_artifacts_are_lazy_and_memoized():
+    sd = parse_document_structure(_BODY, class_hint="delta")
+    assert isinstance(sd, SectionData)
+
+    # Nothing computed until read
+    for name in ("key_markers", "headings", "yaml_blocks", "llm_tail"):
+        assert name not in sd.__dict__
+
+    keys = sd.key_markers
+    assert [(k, ln) for k, _pos, ln in keys] == [
+        ("decision_one_liner", 3),
+        ("glossary", 7),
+    ]
+    assert sd.key_markers is keys
+    assert "yaml_blocks" not in sd.__dict__
+    assert "exclusion_ranges" not in sd.__dict__
+
+
+def test_adrlint_parser003_values_match_section_contract():
+    sd = parse_document_structure(_BODY, class_hint="delta")
+
+    assert [(t, lvl, ln) for t, lvl, _pos, ln in sd.headings] == [
+        ("Title", 1, 1),
+        ("Glossary", 2, 6),
+    ]
+    assert sd.yaml_blocks[0]["kind"] == "overrides"
+    assert sd.llm_tail is None
+    assert set(sd.sections_by_key) == {"decision_one_liner", "glossary"}
+    assert sd.alias_hits.get("Glossary") == "glossary"
+    assert sd.class_hint == "delta"
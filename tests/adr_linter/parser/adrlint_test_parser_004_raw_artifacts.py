@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/parser/adrlint_test_parser_004_raw_artifacts.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): parser exposes section spans, header index, raw
+                          llm_tail / YAML text and their parse errors so
+                          validators never re-scan the body.
+"""
+
+from __future__ import annotations
+
+import json
+
+from adr_linter.parser.structure import parse_document_structure
+
+_BODY = "\n".join(
+    [
+        "<!-- key: decision_one_liner -->",
+        "## Decision",
+        "Because X, we choose Y so that Z.",
+        "<!-- key: constraint_rules -->",
+        "```yaml",
+        "constraint_rules: [unclosed",
+        "```",
+        "<!-- llm_tail:begin -->",
+        "```json",
+        '{"id": "ADR-1234",}',
+        "```",
+        "<!-- llm_tail:end -->",
+    ]
+)
+
+
+def test_adrlint_parser004_section_spans_match_sections_by_key():
+    sd = parse_document_structure(_BODY)
+    for key, (start, end) in sd.section_spans.items():
+        assert _BODY[start:end] == sd.sections_by_key[key]
+    assert sd.heading_index == {"Decision": [2]}
+
+
+def test_adrlint_parser004_raw_text_and_errors_are_kept():
+    sd = parse_document_structure(_BODY)
+
+    (blk,) = sd.yaml_blocks
+    assert blk["kind"] == "malformed"
+    assert blk["raw"] == "constraint_rules: [unclosed"
+    assert blk["error"]
+
+    tail = sd.llm_tail_block
+    assert sd.llm_tail is None
+    assert tail["raw"] == '{"id": "ADR-1234",}'
+    assert isinstance(tail["error"], json.JSONDecodeError)
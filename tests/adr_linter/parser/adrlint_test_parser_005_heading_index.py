@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/parser/adrlint_test_parser_005_heading_index.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): one heading definition: SectionData.headings,
+                          SectionData.heading_index and
+                          find_markdown_headers() agree, and the index is
+                          derived from the headings scan.
+"""
+
+from __future__ import annotations
+
+from adr_linter.constants import find_markdown_headers
+from adr_linter.parser.structure import parse_document_structure
+
+_BODY = "\n".join(
+    [
+        "# Title",
+        "## Decision (one-liner)  ",
+        "  ### Indented",
+        "## C# Notes",
+        "## Closed ##",
+        "####### Deep",
+        "##",
+        "##   ",
+        "##no-space",
+        "##",
+        "not a heading",
+        "## Windows\r",
+        "## Decision (one-liner)",
+    ]
+)
+
+
+def test_adrlint_parser005_parser_and_constants_agree():
+    sd = parse_document_structure(_BODY)
+    assert sd.heading_index == find_markdown_headers(_BODY)
+    assert sd.heading_index == {
+        "Title": [1],
+        "Decision (one-liner)": [2, 13],
+        "Indented": [3],
+        "C# Notes": [4],
+        "Closed ##": [5],
+        "Deep": [6],
+        "Windows": [12],
+    }
+    assert [(t, lvl) for t, lvl, _pos, _ln in sd.headings][:3] == [
+        ("Title", 1),
+        ("Decision (one-liner)", 2),
+        ("Indented", 3),
+    ]
+
+
+def test_adrlint_parser005_index_is_derived_from_headings():
+    sd = parse_document_structure(_BODY)
+    headings = sd.headings
+    sd._source = ""  # a re-scan would now find nothing
+    assert sum(map(len, sd.heading_index.values())) == len(headings)
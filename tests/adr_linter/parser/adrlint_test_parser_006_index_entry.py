@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/parser/adrlint_test_parser_006_index_entry.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): index entries are slotted records holding the
+                          raw text once; body and sections are offsets
+                          into it and read like the legacy entry dict.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from adr_linter.models import ValidationData
+from adr_linter.parser.structure import (
+    IndexEntry,
+    build_index_from_texts,
+    parse_document_structure,
+)
+
+_TEXT = "\n".join(
+    [
+        "---",
+        "id: ADR-0001",
+        "class: owner",
+        "---",
+        "<!-- key: decision_one_liner -->",
+        "## Decision",
+        "Because X, we choose Y so that Z.",
+        "<!-- key: glossary -->",
+        "Terms.",
+        "",
+    ]
+)
+
+
+def test_adrlint_parser006_entry_is_slotted_and_stores_text_once():
+    entry = build_index_from_texts([(Path("ADR-0001-a.md"), _TEXT)])[
+        "ADR-0001"
+    ]
+    assert isinstance(entry, IndexEntry)
+    assert not hasattr(entry, "__dict__")
+    assert entry.section_data._source is entry.raw
+    assert "__slots__" in vars(ValidationData)
+
+
+def test_adrlint_parser006_entry_reads_like_legacy_dict():
+    entry = build_index_from_texts([(Path("ADR-0001-a.md"), _TEXT)])[
+        "ADR-0001"
+    ]
+    assert set(entry) == {"path", "meta", "body", "raw", "section_data"}
+    assert entry["meta"]["class"] == "owner"
+    assert entry["body"] == _TEXT[_TEXT.index("<!--") :]
+    assert entry.get("missing", "d") == "d"
+
+    eager = parse_document_structure(entry["body"], class_hint="owner")
+    sd = entry["section_data"]
+    assert sd.key_markers == eager.key_markers
+    assert sd.headings == eager.headings
+    assert dict(sd.sections_by_key) == dict(eager.sections_by_key)
+    assert sd.sections_by_key["glossary"] == "\nTerms.\n"
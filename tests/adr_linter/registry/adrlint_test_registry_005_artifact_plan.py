@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/registry/adrlint_test_registry_005_artifact_plan.py
+
+"""
+ADRLINT-meta · validator artifact declarations ↔ scheduler
+
+ - every per-file rule declares the SectionData / cross-file artifacts its
+   module reads (source scan, so new reads cannot slip in undeclared);
+ - the plan releases per-file artifacts after their last consumer and
+   never builds artifacts no active rule needs.
+"""
+
+from __future__ import annotations
+
+import inspect
+import re
+
+from adr_linter.parser.structure import parse_document_structure
+from adr_linter.validators.artifacts import (
+    EXCLUSION_RANGES,
+    EXTENDS_KEYS,
+    KEY_MARKERS,
+    LINK_GRAPH,
+    LLM_TAIL,
+    SECTION_ARTIFACTS,
+    artifacts_of,
+    build_plan,
+    consumes,
+    declared_artifacts,
+    release_artifacts,
+)
+from adr_linter.validators.registry import ORDERED_RULES_PER_FILE
+
+_SECTION_READ_RX = re.compile(r"\b(?:section_data|si)\.([a-z_]+)")
+
+
+def _reads(fn) -> set:
+    src = inspect.getsource(inspect.getmodule(fn))
+    found = {
+        m.group(1)
+        for m in _SECTION_READ_RX.finditer(src)
+        if m.group(1) in SECTION_ARTIFACTS
+    }
+    if "link_graph_for(" in src:
+        found.add(LINK_GRAPH)
+    if ".extends.section_keys(" in src:
+        found.add(EXTENDS_KEYS)
+    return found
+
+
+def test_adrlint_registry005_declarations_cover_reads():
+    missing = {}
+    for code, fn in ORDERED_RULES_PER_FILE:
+        undeclared = _reads(fn) - declared_artifacts(fn)
+        if undeclared:
+            missing[code] = sorted(undeclared)
+    assert not missing, f"Undeclared artifact reads: {missing}"
+
+
+def test_adrlint_registry005_plan_releases_after_last_consumer():
+    @consumes(LLM_TAIL, KEY_MARKERS)
+    def a(ctx, rpt):
+        pass
+
+    @consumes(LLM_TAIL)
+    def b(ctx, rpt):
+        pass
+
+    def c(ctx, rpt):
+        pass
+
+    plan = build_plan([("A", a), ("B", b), ("C", c)])
+    assert plan.release_after == ((), (LLM_TAIL,), ())
+    # Shared artifacts (read by the extends resolver) are kept
+    assert KEY_MARKERS in plan.artifacts
+    assert EXCLUSION_RANGES not in plan.artifacts
+    assert artifacts_of(c) == frozenset()
+
+
+def test_adrlint_registry005_release_drops_memoized_artifact():
+    sd = parse_document_structure("<!-- llm_tail:begin -->\n")
+    assert sd.llm_tail is None
+    assert "llm_tail" in sd.__dict__
+    release_artifacts(sd, (LLM_TAIL,))
+    assert "llm_tail" not in sd.__dict__
+    # Recomputed on demand rather than failing
+    assert sd.llm_tail is None
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/registry/adrlint_test_registry_006_body_scan_budget.py
+
+"""
+ADRLINT-meta · full-body scan budget per document
+
+Validators read sections, headers, YAML and llm_tail through SectionData.
+A rule touching `ctx.body` counts as one full-body scan; only the rules in
+BODY_SCANNERS may do so (RFC-2119 / real-value scans are inherently
+whole-body), at most once per call, and a document stays within
+MAX_BODY_SCANS_PER_DOC. New rules must use parser artifacts instead.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from adr_linter.models import ValidationData
+from adr_linter.parser.front_matter import parse_front_matter
+from adr_linter.parser.structure import parse_document_structure
+from adr_linter.report import Report
+from adr_linter.validators.registry import plan_for
+
+from ..conftest import _good_body_structure, _good_meta_front_matter
+
+BODY_SCANNERS = {
+    "ADR-NORM-101",
+    "ADR-NORM-102",
+    "ADR-TEMPLATE-604",
+    "ADR-TEMPLATE-608",
+}
+MAX_BODY_SCANS_PER_DOC = 2
+
+_TAIL = """
+<!-- llm_tail:begin -->
+```json
+{"id": "ADR-1234", "class": "owner", "status": "Proposed",}
+```
+<!-- llm_tail:end -->
+"""
+
+
+class _CountingCtx(ValidationData):
+    """ValidationData that counts reads of the raw body."""
+
+    body_reads = 0
+
+    @property
+    def body(self):
+        self.body_reads += 1
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+
+
+def _ctx(text: str) -> _CountingCtx:
+    meta, end = parse_front_matter(text)
+    body = text[end:]
+    return _CountingCtx(
+        meta=meta,
+        body=body,
+        path=Path("docs/adr/ADR-1234-budget.md"),
+        section_data=parse_document_structure(body),
+        all_idx={},
+    )
+
+
+@pytest.mark.parametrize(
+    "meta, body_args",
+    [
+        ({"class": "owner"}, ("owner",)),
+        ({"class": "strategy"}, ("strategy",)),
+        (
+            {"class": "template", "template_of": "governance"},
+            ("template", "governance"),
+        ),
+    ],
+)
+def test_adrlint_registry006_body_scans_within_budget(meta, body_args):
+    text = (
+        _good_meta_front_matter(**meta)
+        + _good_body_structure(*body_args)
+        + _TAIL
+    )
+    ctx = _ctx(text)
+    rpt = Report()
+
+    per_rule = {}
+    for code, fn in plan_for(meta["class"]).rules:
+        before = ctx.body_reads
+        fn(ctx, rpt)
+        if ctx.body_reads != before:
+            per_rule[code] = ctx.body_reads - before
+
+    offenders = {c: n for c, n in per_rule.items() if c not in BODY_SCANNERS}
+    assert not offenders, f"Rules re-scanning the body: {offenders}"
+    assert all(n == 1 for n in per_rule.values()), per_rule
+    assert sum(per_rule.values()) <= MAX_BODY_SCANS_PER_DOC, per_rule
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/registry/adrlint_test_registry_007_lazy_import_budget.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): Import-time budget. Rule modules load lazily from
+                          validators.manifest; `-X importtime` output of a
+                          fresh interpreter pins what cold start pulls in.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+
+from adr_linter.validators.manifest import RULES_PER_FILE, RULES_POST_RUN
+
+# Cumulative import time of `adr_linter.cli` (µs). Generous on purpose:
+# it only needs to catch the validator pipeline creeping back in (~80 ms).
+CLI_IMPORT_BUDGET_US = 40_000
+
+_RULE_MODULE_RX = re.compile(
+    r"^adr_linter\.validators\.[a-z]+\.[a-z]+_\d{3}_[a-z0-9_]+$"
+)
+_LINE_RX = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)$")
+
+
+def _importtime(code: str) -> dict:
+    """
+    Run `code` in a fresh interpreter; module -> cumulative µs.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    out = {}
+    for line in proc.stderr.splitlines():
+        m = _LINE_RX.match(line)
+        if m:
+            out[m.group(3)] = int(m.group(2))
+    return out
+
+
+def _rule_modules(mods) -> set:
+    return {m for m in mods if _RULE_MODULE_RX.match(m)}
+
+
+def test_adrlint_registry007_cli_import_is_thin():
+    mods = _importtime("import adr_linter.cli")
+    assert "adr_linter.cli" in mods
+    heavy = {
+        m
+        for m in mods
+        if m == "yaml"
+        or m.startswith("adr_linter.validators")
+        or m.startswith("adr_linter.engine")
+        or m.startswith("adr_linter.constants")
+    }
+    assert not heavy, f"cli import pulled in: {sorted(heavy)}"
+    assert mods["adr_linter.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_adrlint_registry007_engine_imports_no_rule_modules():
+    mods = _importtime("import adr_linter.engine")
+    assert not _rule_modules(mods)
+
+
+def test_adrlint_registry007_plan_imports_only_selected_rules():
+    # manifest.resolve() goes through importlib, which `-X importtime` does
+    # not report; list sys.modules from the child instead.
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; "
+            "from adr_linter.validators.registry import plan_for; "
+            "plan_for('owner', ['ADR-SCHEMA-001', 'ADR-LINK-300']); "
+            "print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert _rule_modules(proc.stdout.splitlines()) == {
+        "adr_linter.validators.schema.schema_001_required_meta",
+        "adr_linter.validators.link.link_300_bidi_links",
+    }
+
+
+def test_adrlint_registry007_manifest_entries_resolve():
+    from adr_linter.validators.manifest import resolve
+
+    for ref in RULES_PER_FILE + RULES_POST_RUN:
+        fn = resolve(ref)
+        assert callable(fn) and fn.__name__ == ref[2], ref
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/registry/adrlint_test_registry_008_precompiled_patterns.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): Validators use the precompiled pattern registry in
+                          constants.validation; no `re.compile` or string
+                          patterns passed to `re` at runtime.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+from pathlib import Path
+
+import pytest
+
+from adr_linter.constants import (
+    PLACEHOLDER_ANY_RX,
+    PLACEHOLDER_BRACKET_ANY_RX,
+    PLACEHOLDER_BRACKET_PATTERNS_RXL,
+    PLACEHOLDER_PATTERNS_RXL,
+    SCOPE_TOPIC_ANY_RX,
+    get_scope_topic_patterns,
+)
+
+# Module-level functions of `re` that compile (or take) a pattern
+_RE_PATTERN_FUNCS = {
+    "compile",
+    "search",
+    "match",
+    "fullmatch",
+    "sub",
+    "subn",
+    "split",
+    "findall",
+    "finditer",
+}
+
+
+def _validator_sources():
+    pkg = importlib.import_module("adr_linter.validators")
+    root = Path(pkg.__file__).resolve().parent
+    return sorted(root.rglob("*.py"))
+
+
+def _runtime_re_calls(path: Path):
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "re"
+            and node.func.attr in _RE_PATTERN_FUNCS
+        ):
+            yield node.lineno, f"re.{node.func.attr}"
+
+
+def test_adrlint_registry008_validators_use_precompiled_patterns():
+    offenders = [
+        f"{p.name}:{line} {call}"
+        for p in _validator_sources()
+        for line, call in _runtime_re_calls(p)
+    ]
+    assert not offenders, "Use constants.validation patterns:\n" + "\n".join(
+        offenders
+    )
+
+
+def test_adrlint_registry008_scope_topic_patterns_are_memoized():
+    assert get_scope_topic_patterns() is get_scope_topic_patterns()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "cli.parse_args",
+        "engine.run",
+        "shared.config",
+        "<scope>.<topic>",
+        "{scope}.topic",
+        "[scope]",
+        "plain text",
+        "Because <x>, we choose <y> so that <z>.",
+        "TODO: fill in",
+        "YYYY-MM-DD",
+    ],
+)
+def test_adrlint_registry008_any_rx_matches_pattern_lists(text):
+    def _any(rxl):
+        return any(rx.search(text) for rx in rxl)
+
+    assert bool(PLACEHOLDER_BRACKET_ANY_RX.search(text)) == _any(
+        PLACEHOLDER_BRACKET_PATTERNS_RXL
+    )
+    assert bool(PLACEHOLDER_ANY_RX.search(text)) == _any(
+        PLACEHOLDER_PATTERNS_RXL
+    )
+    assert bool(SCOPE_TOPIC_ANY_RX.search(text)) == _any(
+        get_scope_topic_patterns()
+    )
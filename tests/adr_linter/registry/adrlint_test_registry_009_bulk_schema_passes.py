@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/registry/adrlint_test_registry_009_bulk_schema_passes.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): the front-matter SCHEMA rules run as bulk column
+                          passes over a FrontMatterTable and report exactly
+                          what the per-file rules report, per document.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from adr_linter.engine import lint
+from adr_linter.models import ValidationData
+from adr_linter.parser.structure import build_index_from_texts
+from adr_linter.report import Report
+from adr_linter.validators import manifest
+from adr_linter.validators.registry import run_all
+from adr_linter.validators.schema.bulk import (
+    BULK_PASSES,
+    FrontMatterTable,
+    run_bulk,
+)
+
+from ..conftest import _good_body_structure, _good_meta_front_matter
+
+_VARIANTS = [
+    {},
+    {"class": "strategy", "owners": ["team-a"], "scope": "x"},
+    {"class": "owner", "extends": "ADR-0001@2025-01-01"},
+    {"class": "delta", "owners": ["team-a"]},
+    {"class": "bogus"},
+    {"status": "Superseded"},
+    {"status": "Deprecated", "supersedes": ["ADR-0001"]},
+    {"status": "Draft"},
+    {"status": "Accepted", "superseded_by": ["ADR-0002"]},
+    {"date": "2025/09/05", "review_by": "2026-13-01"},
+    {"date": "2025-01-01", "review_by": "2024-01-01"},
+    {"title": None, "review_by": None},
+    {"id": "ADR-12"},
+]
+
+
+def _documents():
+    docs = []
+    for n, overrides in enumerate(_VARIANTS, start=1):
+        adr_id = overrides.pop("id", f"ADR-{n:04d}")
+        text = _good_meta_front_matter(id=adr_id, **overrides)
+        docs.append((Path(f"docs/adrs/ADR-{n:04d}.md"), text + "Body\n"))
+    return docs
+
+
+def _per_file(entry, code) -> list:
+    ref = next(r for r in manifest.RULES_PER_FILE if r[0] == code)
+    ctx = ValidationData(
+        meta=entry["meta"],
+        body="",
+        path=entry["path"],
+        section_data=None,
+        all_idx={},
+    )
+    rpt = Report()
+    manifest.resolve(ref)(ctx, rpt)
+    return rpt.items
+
+
+def test_adrlint_registry009_bulk_passes_match_per_file_rules():
+    idx = build_index_from_texts(_documents())
+    entries = sorted(idx.values(), key=lambda e: e["path"])
+    table = FrontMatterTable(
+        [e["path"] for e in entries], [e["meta"] for e in entries]
+    )
+    rows = run_bulk(table)
+
+    assert len(rows) == len(entries)
+    fired = set()
+    for entry, row in zip(entries, rows):
+        assert set(row) == set(BULK_PASSES)
+        for code, findings in row.items():
+            assert findings == _per_file(entry, code), (entry["path"], code)
+            fired.update(f.code for f in findings)
+    assert fired == set(BULK_PASSES)
+
+
+def test_adrlint_registry009_precomputed_findings_replay_in_plan_order():
+    docs = [
+        (
+            Path("docs/adrs/ADR-0001.md"),
+            _good_meta_front_matter(
+                id="ADR-0001", status="Draft", date="2025/01/01"
+            )
+            + _good_body_structure("owner"),
+        )
+    ]
+    idx = build_index_from_texts(docs)
+    entry = idx["ADR-0001"]
+
+    def _ctx():
+        # Fresh per run: plans release section artifacts as they go
+        return ValidationData(
+            meta=entry["meta"],
+            body=entry["body"],
+            path=entry["path"],
+            section_data=build_index_from_texts(docs)["ADR-0001"][
+                "section_data"
+            ],
+            all_idx=idx,
+        )
+
+    plain = Report()
+    run_all(_ctx(), plain)
+
+    (row,) = run_bulk(FrontMatterTable([entry["path"]], [entry["meta"]]))
+    replayed = Report()
+    run_all(_ctx(), replayed, precomputed=row)
+    assert replayed.items == plain.items
+    assert list(lint(docs)) == plain.items
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_003_linkgraph_typed_edges.py
+
+"""
+ADR-0001 · §8, §10.1, §10.4
+ADR-XXXX-YYYY (E? W? I?): typed link graph parses pins once and exposes
+                          forward/reverse adjacency for every relationship
+                          field.
+"""
+
+from __future__ import annotations
+
+from adr_linter.services.linkgraph import (
+    build_link_graph,
+    build_supersede_graph,
+    parse_pin,
+)
+
+
+def _idx():
+    return {
+        "ADR-0001": {
+            "path": "a.md",
+            "meta": {"id": "ADR-0001", "superseded_by": "ADR-0002@abc1234"},
+        },
+        "ADR-0002": {
+            "path": "b.md",
+            "meta": {
+                "id": "ADR-0002",
+                "supersedes": ["ADR-0001@2025-09-01"],
+                "governed_by": "ADR-0003@2025-09-01",
+                "owners_ptr": "ADR-0009",
+            },
+        },
+        "ADR-0003": {"path": "c.md", "meta": {"id": "ADR-0003"}},
+    }
+
+
+def test_adrlint_services003_parse_pin():
+    assert parse_pin("ADR-0001@2025-09-01") == ("ADR-0001", "2025-09-01")
+    assert parse_pin("ADR-0001") == ("ADR-0001", None)
+
+
+def test_adrlint_services003_forward_reverse_and_reciprocity():
+    g = build_link_graph(_idx())
+
+    assert g.targets("ADR-0002", "supersedes") == ["ADR-0001"]
+    assert g.sources("ADR-0001", "supersedes") == ["ADR-0002"]
+    assert g.sources("ADR-0003", "governed_by") == ["ADR-0002"]
+    assert g.edges("ADR-0002", "governed_by")[0].pin == "2025-09-01"
+
+    # Reciprocity as a set lookup
+    assert g.has_edge("ADR-0001", "superseded_by", "ADR-0002")
+    assert not g.has_edge("ADR-0003", "superseded_by", "ADR-0002")
+
+    # Dangling targets are kept as edges but do not resolve
+    assert g.targets("ADR-0002", "owners_ptr") == ["ADR-0009"]
+    assert not g.has_node("ADR-0009")
+    assert g.resolve("ADR-0009@abc1234") is None
+    assert g.resolve("ADR-0003@2025-09-01")["path"] == "c.md"
+
+
+def test_adrlint_services003_supersede_projection_resolves_pins():
+    idx = _idx()
+    graph, reverse_graph = build_supersede_graph(idx, build_link_graph(idx))
+    assert graph["ADR-0002"] == ["ADR-0001"]
+    assert reverse_graph["ADR-0001"] == ["ADR-0002"]
+    assert graph["ADR-0003"] == []
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_004_extends_chain_resolver.py
+
+"""
+ADR-0001 · §4 (delta inheritance), §8 (overrides)
+ADR-XXXX-YYYY (E? W? I?): extends-chain resolver computes ancestor chains
+                          and effective section keys once, and terminates
+                          on cycles.
+"""
+
+from __future__ import annotations
+
+from adr_linter.services.linkgraph import build_link_graph
+
+
+def _entry(adr_id: str, keys, extends=None, overrides=None) -> dict:
+    body = "\n".join(f"<!-- key: {k} -->\n{k} text\n" for k in keys)
+    if overrides:
+        lines = ["```yaml", "overrides:"]
+        lines += [f"  {k}: {v}" for k, v in overrides.items()]
+        lines.append("```")
+        body += "\n" + "\n".join(lines) + "\n"
+    meta = {"id": adr_id}
+    if extends:
+        meta["extends"] = extends
+    return {"path": f"{adr_id}.md", "meta": meta, "body": body}
+
+
+def test_adrlint_services004_chain_and_effective_keys():
+    idx = {
+        "ADR-0001": _entry("ADR-0001", ["glossary", "license"]),
+        "ADR-0002": _entry(
+            "ADR-0002",
+            ["decision_details"],
+            extends="ADR-0001@2025-09-01",
+            overrides={"glossary": "base"},
+        ),
+        "ADR-0003": _entry(
+            "ADR-0003",
+            ["context_and_drivers"],
+            extends="ADR-0002@2025-09-01",
+            overrides={"glossary": "nearest"},
+        ),
+    }
+    res = build_link_graph(idx).extends
+
+    assert res.chain("ADR-0003") == ("ADR-0002", "ADR-0001")
+    assert res.chain("ADR-0001") == ()
+    assert res.section_keys("ADR-0003") == {
+        "context_and_drivers",
+        "decision_details",
+        "glossary",
+        "license",
+    }
+    assert res.overrides("ADR-0003") == {"glossary": "nearest"}
+    assert not res.is_cyclic("ADR-0003")
+
+
+def test_adrlint_services004_cycle_terminates():
+    idx = {
+        "ADR-0001": _entry("ADR-0001", ["glossary"], extends="ADR-0002@abc"),
+        "ADR-0002": _entry("ADR-0002", ["license"], extends="ADR-0001@abc"),
+        "ADR-0003": _entry("ADR-0003", [], extends="ADR-0001@abc"),
+    }
+    res = build_link_graph(idx).extends
+
+    assert res.chain("ADR-0001") == ("ADR-0002",)
+    assert res.chain("ADR-0003") == ("ADR-0001", "ADR-0002")
+    assert res.is_cyclic("ADR-0003")
+    assert res.section_keys("ADR-0003") == {"glossary", "license"}
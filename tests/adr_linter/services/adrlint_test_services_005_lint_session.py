@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_005_lint_session.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): warm LintSession re-lints an edited buffer and
+                          its graph neighbours, with file line numbers.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+from adr_linter.services.session import LintSession
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def _codes(findings) -> set:
+    return {f.code for f in findings}
+
+
+def test_adrlint_services005_edit_relints_neighbour(
+    _route_and_reset_workspace,
+):
+    root = _route_and_reset_workspace
+    base = _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    new = _write_text(
+        root,
+        "docs/adrs/ADR-0002-new.md",
+        _good_meta_front_matter(id="ADR-0002", supersedes=["ADR-0001"])
+        + "Body\n",
+    )
+
+    session = LintSession(root)
+    session.update(new, new.read_text(encoding="utf-8"))
+    session.update(base, base.read_text(encoding="utf-8"))
+    assert "ADR-LINK-300" in _codes(session.findings(new))
+
+    # Fix the reciprocal link in the (unsaved) base buffer
+    fixed = (
+        _good_meta_front_matter(id="ADR-0001", superseded_by="ADR-0002")
+        + "Body\n"
+    )
+    changed = session.update(base, fixed)
+
+    assert new.resolve().as_posix() in changed
+    assert "ADR-LINK-300" not in _codes(session.findings(new))
+
+
+def test_adrlint_services005_lines_are_file_lines(_route_and_reset_workspace):
+    root = _route_and_reset_workspace
+    fm = _good_meta_front_matter(id="ADR-0003")
+    body = "\n<!-- key: decision_one_liner -->\nThis MUST stay.\n"
+    doc = _write_text(root, "docs/adrs/ADR-0003-lines.md", fm + body)
+
+    session = LintSession(root)
+    session.update(doc, fm + body)
+    norm = [f for f in session.findings(doc) if f.code == "ADR-NORM-101"]
+
+    expected = (fm + body).splitlines().index("This MUST stay.") + 1
+    assert norm and norm[0].location.endswith(f":{expected}")
+
+
+def test_adrlint_services005_ignores_files_outside_adr_locations(
+    _route_and_reset_workspace,
+):
+    root = _route_and_reset_workspace / "repo"
+    shutil.rmtree(root, ignore_errors=True)
+    _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    text = _good_meta_front_matter(id="ADR-0009", **{"class": "bogus"})
+    session = LintSession(root)
+    for rel in ("README.md", "docs/adrs/.drafts/ADR-0009.md", "notes.md"):
+        path = _write_text(root, rel, text)
+        assert session.update(path, text) == set()
+        assert session.findings(path) == []
+    assert "ADR-0009" not in session.idx
+
+    nested = _write_text(root, "docs/adrs/2025/ADR-0009-x.md", text)
+    assert nested.resolve().as_posix() in session.update(nested, text)
+    assert "ADR-SCHEMA-002" in _codes(session.findings(nested))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_006_index_cache.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): IndexCache re-parses only files whose stat
+                          changed and matches a cold index build.
+"""
+
+from __future__ import annotations
+
+import os
+
+from adr_linter.services.index import IndexCache, build_index_from_files
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def test_adrlint_services006_reuses_unchanged_entries(
+    _route_and_reset_workspace,
+):
+    root = _route_and_reset_workspace
+    a = _write_text(
+        root,
+        "docs/adrs/ADR-0001-a.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    b = _write_text(
+        root,
+        "docs/adrs/ADR-0002-b.md",
+        _good_meta_front_matter(id="ADR-0002") + "Body\n",
+    )
+
+    cache = IndexCache()
+    first = cache.build([a, b])
+    assert first == build_index_from_files([a, b])
+
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-b.md",
+        _good_meta_front_matter(id="ADR-0002", title="Renamed") + "Body\n",
+    )
+    st = b.stat()
+    os.utime(b, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = cache.build([a, b])
+    assert second["ADR-0001"] is first["ADR-0001"]
+    assert second["ADR-0002"]["meta"]["title"] == "Renamed"
+    assert second == build_index_from_files([a, b])
+
+
+def test_adrlint_services006_drops_deleted_files(_route_and_reset_workspace):
+    root = _route_and_reset_workspace
+    a = _write_text(
+        root,
+        "docs/adrs/ADR-0003-a.md",
+        _good_meta_front_matter(id="ADR-0003") + "Body\n",
+    )
+    b = _write_text(
+        root,
+        "docs/adrs/ADR-0004-b.md",
+        _good_meta_front_matter(id="ADR-0004") + "Body\n",
+    )
+
+    cache = IndexCache()
+    cache.build([a, b])
+    b.unlink()
+
+    assert set(cache.build([a])) == {"ADR-0003"}
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_007_lazy_index.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): LazyIndex parses an ADR only when a rule looks it
+                          up, locating it through the file-name id manifest
+                          and falling back to a full scan for misnamed files.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from adr_linter.services.index import (
+    LazyIndex,
+    build_index_from_files,
+    id_manifest,
+)
+from adr_linter.services.linkgraph import build_link_graph
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def _workspace(root: Path, *, base_name: str = "ADR-0001-base.md"):
+    return [
+        _write_text(
+            root,
+            f"docs/adrs/{base_name}",
+            _good_meta_front_matter(id="ADR-0001") + "Body\n",
+        ),
+        _write_text(
+            root,
+            "docs/adrs/ADR-0002-new.md",
+            _good_meta_front_matter(id="ADR-0002", supersedes=["ADR-0001"])
+            + "Body\n",
+        ),
+        _write_text(
+            root,
+            "docs/adrs/ADR-0003-other.md",
+            _good_meta_front_matter(id="ADR-0003") + "Body\n",
+        ),
+    ]
+
+
+def _recording_build(log):
+    def build(paths):
+        log.extend(p.name for p in paths)
+        return build_index_from_files(paths)
+
+    return build
+
+
+def test_adrlint_services007_manifest_from_file_names():
+    manifest, unnamed = id_manifest(
+        [
+            Path("ADR-0001-style-guide.md"),
+            Path("ADR-0001-copy.md"),
+            Path("ADR-00012-typo.md"),
+            Path("notes.md"),
+        ]
+    )
+    assert list(manifest) == ["ADR-0001"]
+    assert len(manifest["ADR-0001"]) == 2
+    assert [p.name for p in unnamed] == ["ADR-00012-typo.md", "notes.md"]
+
+
+def test_adrlint_services007_loads_only_looked_up_targets(
+    _route_and_reset_workspace,
+):
+    base, new, other = _workspace(_route_and_reset_workspace)
+    read = []
+    idx = LazyIndex([base, other], build=_recording_build(read))
+    idx.seed([new])
+    graph = build_link_graph(idx)
+    assert read == ["ADR-0002-new.md"]
+
+    assert graph.has_node("ADR-0001")
+    assert graph.targets("ADR-0001", "supersedes") == []
+    assert graph.resolve("ADR-0001@2025-01-01")["meta"]["id"] == "ADR-0001"
+    assert read == ["ADR-0002-new.md", "ADR-0001-base.md"]
+    assert set(idx) == {"ADR-0001", "ADR-0002"}
+
+
+def test_adrlint_services007_misnamed_file_falls_back_once(
+    _route_and_reset_workspace,
+):
+    base, new, other = _workspace(
+        _route_and_reset_workspace, base_name="base-decision.md"
+    )
+    read = []
+    idx = LazyIndex([base, other], build=_recording_build(read))
+    idx.seed([new])
+    graph = build_link_graph(idx)
+
+    assert graph.has_node("ADR-0001")
+    assert not graph.has_node("ADR-0999")
+    assert sorted(read) == sorted(
+        ["ADR-0002-new.md", "ADR-0003-other.md", "base-decision.md"]
+    )
+
+
+def test_adrlint_services007_expand_matches_full_index(
+    _route_and_reset_workspace,
+):
+    files = _workspace(_route_and_reset_workspace)
+    idx = LazyIndex([files[0], files[2]])
+    idx.seed([files[1]])
+    idx.expand()
+    full = build_index_from_files(files)
+    assert set(idx) == {"ADR-0001", "ADR-0002"}
+    for k in idx:
+        assert idx[k]["meta"] == full[k]["meta"]
+        assert idx[k]["body"] == full[k]["body"]
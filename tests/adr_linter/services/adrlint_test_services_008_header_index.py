@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_008_header_index.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): The metadata-only index tier reads files only up
+                          to the closing front-matter fence and promotes
+                          body/sections on first access.
+"""
+
+from __future__ import annotations
+
+from adr_linter.parser.front_matter import parse_front_matter
+from adr_linter.services.index import (
+    HeaderEntry,
+    build_header_index,
+    build_index_from_files,
+    read_header,
+)
+
+from ..conftest import _good_meta_front_matter, _write_text
+
+
+def test_adrlint_services008_reads_only_front_matter(
+    _route_and_reset_workspace,
+):
+    text = _good_meta_front_matter(id="ADR-0001") + "x" * 1_000_000 + "\n"
+    p = _write_text(_route_and_reset_workspace, "ADR-0001-long.md", text)
+
+    header = read_header(p)
+    assert len(header) < 10_000
+    assert parse_front_matter(header)[0] == parse_front_matter(text)[0]
+
+
+def test_adrlint_services008_fence_across_chunk_boundary(
+    _route_and_reset_workspace,
+):
+    root = _route_and_reset_workspace
+    for pad in range(4070, 4110):
+        text = (
+            "---\nid: ADR-0001\nnote: "
+            + "a" * pad
+            + "\n---   \n---x\nBody\n"
+        )
+        p = _write_text(root, "ADR-0001-pad.md", text)
+        assert parse_front_matter(read_header(p))[0] == (
+            parse_front_matter(text)[0]
+        )
+
+    p = _write_text(root, "notes.md", "# No front matter\n" * 2000)
+    assert read_header(p) == p.read_text(encoding="utf-8")
+
+
+def test_adrlint_services008_promotes_sections_on_access(
+    _route_and_reset_workspace,
+):
+    p = _write_text(
+        _route_and_reset_workspace,
+        "ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    full = build_index_from_files([p])["ADR-0001"]
+    entry = build_header_index([p])["ADR-0001"]
+
+    assert isinstance(entry, HeaderEntry)
+    assert entry["meta"] == full["meta"]
+    assert not entry.promoted
+
+    assert entry.get("section_data") is not None
+    assert entry.promoted
+    assert entry == full
+    assert entry["body"] == full["body"]
+    assert entry["raw"] == full["raw"]
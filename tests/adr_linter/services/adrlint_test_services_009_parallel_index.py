@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/services/adrlint_test_services_009_parallel_index.py
+
+"""
+ADR-0001 · §<XXX> Linter Rules Reference
+ADR-XXXX-YYYY (E? W? I?): the pipelined index builder (reader threads,
+                          parser processes) yields the sequential index for
+                          any worker count, with a defined duplicate-id
+                          policy.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from adr_linter.services import index as index_mod
+from adr_linter.services.index import (
+    build_header_index,
+    build_index_from_files,
+    build_index_parallel,
+)
+
+from ..conftest import (
+    _good_body_structure,
+    _good_meta_front_matter,
+    _write_text,
+)
+
+
+def _corpus(root):
+    paths = [
+        _write_text(
+            root,
+            f"docs/adrs/ADR-{n:04d}-x.md",
+            _good_meta_front_matter(id=f"ADR-{n:04d}")
+            + _good_body_structure("owner"),
+        )
+        for n in range(1, 41)
+    ]
+    # Same id as ADR-0001, sorts after it; and one file without an id
+    paths.append(
+        _write_text(
+            root,
+            "docs/adrs/ADR-0001-zz-dup.md",
+            _good_meta_front_matter(id="ADR-0001", title="Dup") + "Body\n",
+        )
+    )
+    paths.append(_write_text(root, "docs/adrs/notes.md", "No front matter\n"))
+    return sorted(paths)
+
+
+def test_adrlint_services009_parallel_equals_sequential(
+    _route_and_reset_workspace,
+):
+    files = _corpus(_route_and_reset_workspace)
+
+    full = build_index_parallel(files, workers=2)
+    assert list(full) == list(build_index_from_files(files))
+    assert full == build_index_from_files(files)
+    assert full["ADR-0001"]["meta"]["title"] == "Dup"
+
+    header = build_index_parallel(files, workers=3, header_only=True)
+    expected = build_header_index(files)
+    assert list(header) == list(expected)
+    assert all(header[k]["meta"] == expected[k]["meta"] for k in header)
+    assert not header["ADR-0002"].promoted
+
+
+def test_adrlint_services009_duplicate_id_policy(_route_and_reset_workspace):
+    files = _corpus(_route_and_reset_workspace)
+
+    first = build_index_parallel(files, workers=2, duplicates="first")
+    assert first["ADR-0001"]["path"].name == "ADR-0001-x.md"
+
+    with pytest.raises(ValueError, match="duplicate id ADR-0001"):
+        build_index_parallel(files, workers=2, duplicates="error")
+    with pytest.raises(ValueError, match="unknown duplicate id policy"):
+        build_index_parallel(files, duplicates="newest")
+
+
+def test_adrlint_services009_streams_within_a_bounded_window(
+    _route_and_reset_workspace, monkeypatch
+):
+    files = _corpus(_route_and_reset_workspace)
+    reads, lag = [], []
+    real_read, real_admit = index_mod.read_header, index_mod._admit
+
+    def _read(p, **kwargs):
+        reads.append(p)
+        return real_read(p, **kwargs)
+
+    def _admit(idx, adr_id, entry, policy):
+        lag.append(len(reads) - files.index(entry["path"]))
+        real_admit(idx, adr_id, entry, policy)
+
+    monkeypatch.setattr(index_mod, "_PARSE_CHUNK", 2)
+    monkeypatch.setattr(index_mod, "read_header", _read)
+    monkeypatch.setattr(index_mod, "_admit", _admit)
+    idx = build_index_parallel(files, workers=1, header_only=True)
+
+    assert len(reads) == len(files) and len(idx) == 40
+    # One chunk read ahead + 2 * workers chunks in flight, not the corpus
+    assert max(lag) <= 2 * (1 + 2 * 1) + 1
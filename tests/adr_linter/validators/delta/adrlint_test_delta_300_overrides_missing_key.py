@@ -148,3 +148,55 @@ overrides:
     run_all(ctx, rpt)
 
     assert not _has_code(rpt, "ADR-DELTA-300")
+
+
+def test_adrlint300_override_key_inherited_from_grandparent_is_ok(
+    _route_and_reset_workspace,
+):
+    """
+    Owner ADR-9410 has 'glossary'; delta ADR-9411 extends it without its own
+    'glossary'; delta ADR-9412 extends ADR-9411 and overrides 'glossary'
+    → resolved through the extends chain, should NOT emit ADR-DELTA-300.
+    """
+    ws = _route_and_reset_workspace
+    root_keys = list(CANONICAL_KEYS_DELTA)
+    mid_keys = [k for k in root_keys if k != "glossary"]
+
+    root_text = _good_meta_front_matter(
+        **{"id": "ADR-9410", "class": "owner"}
+    ) + _canonical_body(root_keys)
+    mid_text = _good_meta_front_matter(
+        **{
+            "id": "ADR-9411",
+            "class": "delta",
+            "extends": "ADR-9410@2025-09-03",
+        }
+    ) + _canonical_body(mid_keys)
+    leaf_text = (
+        _good_meta_front_matter(
+            **{
+                "id": "ADR-9412",
+                "class": "delta",
+                "extends": "ADR-9411@2025-09-03",
+            }
+        )
+        + _canonical_body(mid_keys)
+        + """
+```yaml
+overrides:
+  glossary: "MUST define 'tenant' precisely"
+```"""
+    )
+
+    root_p = _write_text(ws, "docs/adr-new/ADR-9410-root.md", root_text)
+    mid_p = _write_text(ws, "docs/adr-new/ADR-9411-mid.md", mid_text)
+    leaf_p = _write_text(ws, "docs/adr-new/ADR-9412-leaf.md", leaf_text)
+
+    ctx = _ctx_from_path(leaf_p)
+    for adr_id, p in (("ADR-9410", root_p), ("ADR-9411", mid_p)):
+        c = _ctx_from_path(p)
+        ctx.all_idx[adr_id] = {"meta": c.meta, "body": c.body, "path": p}
+
+    rpt = Report()
+    run_all(ctx, rpt)
+    assert not _has_code(rpt, "ADR-DELTA-300")
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# !/usr/bin/env python3
+# tests/adr_linter/validators/link/adrlint_test_link_306_pin_resolves.py
+
+"""
+ADR-0001 · §8 (pins)
+ADR-LINK-306 (E): with `--verify-pins`, hex pins must name a commit that
+                  contains the pinned ADR and date pins must not predate
+                  its first commit (local git history, one batch process).
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from adr_linter import engine
+from adr_linter.cli import main
+from adr_linter.services import pins as pins_mod
+from adr_linter.services.pins import PinResolver
+
+from ...conftest import _good_meta_front_matter, _write_text
+
+_ERROR_CODE = "ADR-LINK-306"
+
+
+def _git(root, *args, date="2025-06-01T12:00:00"):
+    env = dict(
+        os.environ,
+        GIT_AUTHOR_DATE=date,
+        GIT_COMMITTER_DATE=date,
+        GIT_AUTHOR_NAME="t",
+        GIT_AUTHOR_EMAIL="t@example.com",
+        GIT_COMMITTER_NAME="t",
+        GIT_COMMITTER_EMAIL="t@example.com",
+    )
+    out = subprocess.run(
+        ["git", *args], cwd=root, env=env, check=True, capture_output=True
+    )
+    return out.stdout.decode().strip()
+
+
+def _repo(workspace):
+    """
+    Fresh repo (the workspace persists across runs). Commit 1
+    (2025-05-01): README only. Commit 2 (2025-06-01): ADR-0001.
+    """
+    root = workspace / "repo"
+    shutil.rmtree(root, ignore_errors=True)
+    root.mkdir()
+    _git(root, "init", "-q")
+    _write_text(root, "README.md", "x\n")
+    _git(root, "add", "README.md")
+    _git(root, "commit", "-qm", "one", date="2025-05-01T12:00:00")
+    before = _git(root, "rev-parse", "HEAD")
+    _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    _git(root, "add", "docs")
+    _git(root, "commit", "-qm", "two")
+    return root, before, _git(root, "rev-parse", "HEAD")
+
+
+def test_adrlint_link306_pins_checked_against_history(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root, before, after = _repo(_route_and_reset_workspace)
+    pins = [
+        f"ADR-0001@{after[:12]}",  # ok
+        "ADR-0001@2025-07-01",  # ok
+        f"ADR-0001@{before[:12]}",  # ADR not there yet
+        "ADR-0001@0000000deadbeef",  # no such commit
+        "ADR-0001@2025-01-01",  # before the first commit
+        "ADR-0001@2025-13-01",  # malformed: LINK-303 only
+    ]
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-new.md",
+        _good_meta_front_matter(id="ADR-0002", informs=pins) + "Body\n",
+    )
+    monkeypatch.chdir(root)
+
+    main(["--path", "."])
+    assert _ERROR_CODE not in capsys.readouterr().out
+
+    main(["--path", ".", "--verify-pins"])
+    lines = [
+        ln for ln in capsys.readouterr().out.splitlines() if _ERROR_CODE in ln
+    ]
+    assert len(lines) == 3, lines
+    text = "\n".join(lines)
+    assert f"ADR-0001 did not exist at {before[:12]}" in text
+    assert "commit 0000000deadbeef not found" in text
+    assert "ADR-0001 was not committed yet on 2025-01-01" in text
+
+
+def test_adrlint_link306_one_batch_process_and_memo(
+    _route_and_reset_workspace, monkeypatch
+):
+    root, _before, after = _repo(_route_and_reset_workspace)
+    started = []
+    real_popen = pins_mod.subprocess.Popen
+
+    def _popen(*args, **kwargs):
+        started.append(args[0])
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(pins_mod.subprocess, "Popen", _popen)
+    adr = root / "docs/adrs/ADR-0001-base.md"
+    with PinResolver(root) as resolver:
+        assert resolver.available
+        for _ in range(50):
+            assert resolver.check(after[:7], adr) is None
+            assert resolver.check("2025-06-01", adr) is None
+        assert resolver.check("abcdef0", adr) == pins_mod.NO_COMMIT
+        # The date scan only lists ADR paths, not every committed file
+        assert resolver.first_seen(root / "README.md") is None
+        assert resolver.first_seen(adr) is not None
+    # rev-parse, the batch pipe and the log scan; nothing per pin
+    assert len(started) == 3
+    assert started.count(["git", "cat-file", "--batch-check"]) == 1
+
+
+def test_adrlint_link306_batch_process_reaped_when_a_rule_raises(
+    _route_and_reset_workspace, monkeypatch
+):
+    root, _before, after = _repo(_route_and_reset_workspace)
+    _write_text(
+        root,
+        "docs/adrs/ADR-0002-new.md",
+        _good_meta_front_matter(id="ADR-0002", informs=[f"ADR-0001@{after}"])
+        + "Body\n",
+    )
+    resolvers = []
+
+    class _Tracked(PinResolver):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            resolvers.append(self)
+
+    def _boom(ctx, rpt, *args, **kwargs):
+        # Start the batch process, then fail like a broken rule would
+        ctx.pins.commit_exists(after)
+        raise RuntimeError("rule crashed")
+
+    monkeypatch.setattr(engine, "PinResolver", _Tracked)
+    monkeypatch.setattr(engine, "_run_all_validators", _boom)
+    monkeypatch.chdir(root)
+
+    with pytest.raises(RuntimeError):
+        main(["--path", ".", "--verify-pins"])
+    assert resolvers and all(r._batch is None for r in resolvers)
+
+
+def test_adrlint_link306_first_seen_is_the_earliest_commit_date(
+    _route_and_reset_workspace,
+):
+    root, _before, _after = _repo(_route_and_reset_workspace)
+    adr = root / "docs/adrs/ADR-0001-base.md"
+    # Newest in log order, oldest by date (e.g. a rebased, backdated fix)
+    _write_text(adr.parent, adr.name, adr.read_text() + "More\n")
+    _git(root, "commit", "-qam", "three", date="2025-03-01T12:00:00")
+    with PinResolver(root) as resolver:
+        assert str(resolver.first_seen(adr)) == "2025-03-01"
+        assert resolver.check("2025-04-01", adr) is None
+
+
+def test_adrlint_link306_warns_outside_a_work_tree(
+    _route_and_reset_workspace, monkeypatch, capsys
+):
+    root = _route_and_reset_workspace / "plain"
+    shutil.rmtree(root, ignore_errors=True)
+    _write_text(
+        root,
+        "docs/adrs/ADR-0001-base.md",
+        _good_meta_front_matter(id="ADR-0001") + "Body\n",
+    )
+    # Stop git from finding the enclosing checkout
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(root.parent))
+    monkeypatch.chdir(root)
+
+    main(["--path", ".", "--verify-pins"])
+    assert "not a git work tree; LINK-306 skipped" in capsys.readouterr().err